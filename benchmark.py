@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Thread scaling benchmark for the NumPy backend
+
+Steps one large random board with 1, 2, 4, ... worker threads and reports
+generations per second and the speedup over a single thread.
+
+Usage: python benchmark.py [size] [generations]
+"""
+
+import os
+import random
+import sys
+import time
+from game_of_life import GameOfLife
+
+
+def time_generations(size, generations, workers):
+    """
+    Time how long a random board takes to step a number of generations
+    
+    Args:
+        size: Width and height of the board
+        generations: Number of generations to step
+        workers: Number of threads stepping the board
+        
+    Returns:
+        Elapsed time in seconds
+    """
+    game = GameOfLife(width=size, height=size, backend="numpy", workers=workers)
+    rng = random.Random(0)
+    for x in range(size):
+        for y in range(size):
+            if rng.random() < 0.3:
+                game.set_cell(x, y)
+    
+    start = time.perf_counter()
+    for _ in range(generations):
+        game.next_generation()
+    elapsed = time.perf_counter() - start
+    game.close()
+    return elapsed
+
+
+def main():
+    """Print a scaling table for every power-of-two thread count up to the core count"""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    generations = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    
+    thread_counts = [1]
+    while thread_counts[-1] * 2 <= (os.cpu_count() or 1):
+        thread_counts.append(thread_counts[-1] * 2)
+    
+    print(f"{size}x{size} board, {generations} generations")
+    print(f"{'threads':>8} {'gen/s':>10} {'speedup':>8}")
+    baseline = None
+    for workers in thread_counts:
+        elapsed = time_generations(size, generations, workers)
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {generations / elapsed:>10.1f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,40 +11,2853 @@ Rules:
 import time
 import sys
 import os
+import math
 import random
+import functools
+import multiprocessing
+import weakref
+from array import array
+from collections import Counter, namedtuple
+from itertools import compress
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the "numpy" backend needs it
+    np = None
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+
+# Properties of a default Cell, the only kind a plain-Conway board holds
+PLAIN_GENOTYPE = ("", "white", "█")
+
+# Palette ids of a default cell
+DEFAULT_IDS = (0, 0, 0)
+
+# (row, column) steps to the eight neighbors of a cell
+NEIGHBOR_OFFSETS = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy)
+
+# Values a mutation picks new colors and symbols from
+MUTATION_COLORS = ("white", "red", "green", "blue", "yellow", "magenta", "cyan")
+MUTATION_SYMBOLS = ("█", "●", "■", "◆", "★", "♦", "▲")
+
+# Predefined patterns as (row, column) positions of live cells
+PATTERNS = {
+    'glider': [(1, 2), (2, 3), (3, 1), (3, 2), (3, 3)],
+    'blinker': [(1, 1), (1, 2), (1, 3)],
+    'toad': [(2, 2), (2, 3), (2, 4), (3, 1), (3, 2), (3, 3)],
+    'beacon': [(1, 1), (1, 2), (2, 1), (3, 4), (4, 3), (4, 4)],
+    'pulsar': [
+        (2, 4), (2, 5), (2, 6), (2, 10), (2, 11), (2, 12),
+        (4, 2), (4, 7), (4, 9), (4, 14),
+        (5, 2), (5, 7), (5, 9), (5, 14),
+        (6, 2), (6, 7), (6, 9), (6, 14),
+        (7, 4), (7, 5), (7, 6), (7, 10), (7, 11), (7, 12),
+        (9, 4), (9, 5), (9, 6), (9, 10), (9, 11), (9, 12),
+        (10, 2), (10, 7), (10, 9), (10, 14),
+        (11, 2), (11, 7), (11, 9), (11, 14),
+        (12, 2), (12, 7), (12, 9), (12, 14),
+        (14, 4), (14, 5), (14, 6), (14, 10), (14, 11), (14, 12)
+    ]
+}
 
 
 class Cell:
     """Represents a customizable cell in the Game of Life"""
     
-    def __init__(self, alive=False, name="", color="white", symbol="█"):
+    __slots__ = ("alive", "lineage", "color", "symbol")
+    
+    def __init__(self, alive=False, name="", color="white", symbol="█"):
+        """
+        Initialize a cell with custom properties
+        
+        Args:
+            alive: Whether the cell is alive
+            name: Custom name for the cell, or the HybridName of a hybrid
+            color: Color for the cell (default: white)
+            symbol: Symbol to display for the cell (default: █)
+        """
+        self.alive = alive
+        self.lineage = name
+        self.color = color
+        self.symbol = symbol
+    
+    @property
+    def name(self):
+        """Name of the cell, with hybrid names rendered from their lineage"""
+        lineage = self.lineage
+        if isinstance(lineage, HybridName):
+            return lineage.render()
+        return lineage
+    
+    @name.setter
+    def name(self, name):
+        """Set the name to a string or a HybridName"""
+        self.lineage = name
+    
+    def __bool__(self):
+        """Allow cell to be used in boolean context"""
+        return self.alive
+    
+    def copy(self):
+        """Create a copy of this cell"""
+        return Cell(self.alive, self.lineage, self.color, self.symbol)
+
+
+class Palette:
+    """
+    Table of distinct property values addressed by small integer ids
+    
+    Boards store these ids instead of the values themselves, so all cells
+    sharing a name, color or symbol share a single entry. Id 0 is always the
+    default value. Ids of released values are handed out again to new ones.
+    """
+    
+    def __init__(self, default):
+        """
+        Create a palette holding only the default value
+        
+        Args:
+            default: Value stored under id 0
+        """
+        self.values = [default]
+        self._ids = {default: 0}
+        self._free = []
+    
+    def __len__(self):
+        """Number of distinct values"""
+        return len(self._ids)
+    
+    def __getitem__(self, value_id):
+        """Look up the value stored under an id"""
+        return self.values[value_id]
+    
+    def intern(self, value):
+        """Return the id for a value, adding it to the palette if it is new"""
+        value_id = self._ids.get(value)
+        if value_id is None:
+            if self._free:
+                value_id = self._free.pop()
+                self.values[value_id] = value
+            else:
+                value_id = len(self.values)
+                self.values.append(value)
+            self._ids[value] = value_id
+        return value_id
+    
+    def retain(self, keep):
+        """
+        Release every value except the default and those whose ids are in keep
+        
+        Callers must make sure no cell still refers to a released id.
+        
+        Args:
+            keep: Set of ids to keep
+        """
+        for value_id, value in enumerate(self.values):
+            if value_id and value_id not in keep and self._ids.get(value) == value_id:
+                del self._ids[value]
+                self.values[value_id] = None
+                self._free.append(value_id)
+
+
+class HybridName:
+    """
+    Node of the lineage DAG that hybrid names are made of
+    
+    A hybrid's name is its two parents' names joined with a hyphen. Instead
+    of that ever longer string, a node keeps references to the two parent
+    names, each a plain string or another node, so it takes the same memory
+    however deep the lineage goes. The string is only built by render.
+    """
+    
+    __slots__ = ("first", "second")
+    
+    def __init__(self, first, second):
+        """
+        Create a node joining two names
+        
+        Args:
+            first: Name written first, a string or a HybridName
+            second: Name written second, a string or a HybridName
+        """
+        self.first = first
+        self.second = second
+    
+    def render(self, depth=None):
+        """
+        Build the hyphen-joined name string
+        
+        Args:
+            depth: Number of hybrid levels to spell out, or None for all;
+                deeper hybrids are written as "…"
+                
+        Returns:
+            The name as a string
+        """
+        parts = []
+        stack = [(self, 0)]
+        while stack:
+            name, level = stack.pop()
+            if not isinstance(name, HybridName):
+                parts.append(name)
+            elif depth is not None and level >= depth:
+                parts.append("…")
+            else:
+                stack.extend(((name.second, level + 1), ("-", level), (name.first, level + 1)))
+        return "".join(parts)
+    
+    def __str__(self):
+        """The fully rendered name"""
+        return self.render()
+    
+    def __repr__(self):
+        """Short representation that does not render deep lineages"""
+        return f"HybridName({self.render(3)!r})"
+
+
+class NamePalette(Palette):
+    """
+    Palette of cell names whose hybrids are interned lineage nodes
+    
+    Plain names are stored as strings. A hybrid is stored as a HybridName
+    and interned under the ids of its two parent names, so joining two
+    names is one dict lookup and every hybrid costs one entry, while two
+    cells have the same name exactly when their name ids are equal. Hybrids
+    stay distinct by lineage even when two of them render to the same string.
+    """
+    
+    def __init__(self):
+        """Create a palette holding only the empty name"""
+        Palette.__init__(self, "")
+        self._pairs = {}
+        self._parents = {}
+    
+    def join(self, first_id, second_id):
+        """Return the id of the hybrid of two names, interning it if it is new"""
+        key = (first_id, second_id)
+        name_id = self._pairs.get(key)
+        if name_id is None:
+            hybrid = HybridName(self.values[first_id], self.values[second_id])
+            name_id = self._add_hybrid(key, hybrid)
+        return name_id
+    
+    def intern(self, value):
+        """Return the id for a name string or HybridName, adding it if it is new"""
+        if not isinstance(value, HybridName):
+            return Palette.intern(self, value)
+        name_id = self._ids.get(value)
+        if name_id is None:
+            # A node from a Cell made elsewhere or released since: intern
+            # it by its parents, reusing an equal hybrid when there is one
+            key = (self.intern(value.first), self.intern(value.second))
+            name_id = self._pairs.get(key)
+            if name_id is None:
+                name_id = self._add_hybrid(key, value)
+        return name_id
+    
+    def _add_hybrid(self, key, node):
+        """Store a new hybrid node under the ids of its parents"""
+        name_id = Palette.intern(self, node)
+        self._pairs[key] = name_id
+        self._parents[name_id] = key
+        return name_id
+    
+    def render(self, name_id, depth=None):
+        """
+        Render the name stored under an id
+        
+        Args:
+            name_id: Name id
+            depth: Number of hybrid levels to spell out, or None for all
+            
+        Returns:
+            The name as a string
+        """
+        name = self.values[name_id]
+        if isinstance(name, HybridName):
+            return name.render(depth)
+        return name
+    
+    def retain(self, keep):
+        """
+        Release every name except the empty one, those in keep and their ancestors
+        
+        Args:
+            keep: Set of ids to keep
+        """
+        keep = set(keep)
+        stack = list(keep)
+        while stack:
+            for parent_id in self._parents.get(stack.pop(), ()):
+                if parent_id not in keep:
+                    keep.add(parent_id)
+                    stack.append(parent_id)
+        Palette.retain(self, keep)
+        for name_id in [name_id for name_id in self._parents if self.values[name_id] is None]:
+            del self._pairs[self._parents.pop(name_id)]
+
+
+class CompatibilityMatrix:
+    """
+    Bit-matrix telling which genotypes can breed with each other
+    
+    Compatibility only depends on whether a cell is named and on its color
+    and symbol, so genotypes are interned by that (named, color id, symbol
+    id) key to small ids. Row i is an int whose bit j is set when ids i and
+    j are compatible, and interning a new key fills in its row and column
+    against the keys already known, so checking a pair is one lookup
+    however many cell types exist.
+    """
+    
+    def __init__(self):
+        """Create an empty matrix"""
+        self.keys = []
+        self.rows = []
+        self._ids = {}
+    
+    def __len__(self):
+        """Number of distinct keys"""
+        return len(self.keys)
+    
+    def intern(self, key):
+        """Return the id for a (named, color id, symbol id) key, adding it if it is new"""
+        key_id = self._ids.get(key)
+        if key_id is None:
+            key_id = len(self.keys)
+            named, color_id, symbol_id = key
+            row = 0
+            for other_id, (other_named, other_color, other_symbol) in enumerate(self.keys):
+                if (named and other_named) or color_id != other_color or symbol_id != other_symbol:
+                    row |= 1 << other_id
+                    self.rows[other_id] |= 1 << key_id
+            # Two named cells are compatible even when they look alike
+            if named:
+                row |= 1 << key_id
+            self.keys.append(key)
+            self.rows.append(row)
+            self._ids[key] = key_id
+        return key_id
+    
+    def compatible(self, first_id, second_id):
+        """Whether the genotypes with two ids can be parents together"""
+        return bool(self.rows[first_id] >> second_id & 1)
+
+
+class Genotype(namedtuple("Genotype", ["name", "color", "symbol"])):
+    """Immutable properties shared by every cell of one kind"""
+    
+    __slots__ = ()
+
+
+class GenotypeRegistry:
+    """
+    Flyweight registry of the genotypes carried by a game's live cells
+    
+    Boards store a cell's genotype as (name, color, symbol) palette ids.
+    The registry hands out one shared, immutable Genotype per distinct
+    combination, reports how many live cells carry each one, and forgets
+    the genotypes no cell carries any more, releasing the names only they
+    used so that hybrid names of extinct lineages do not pile up.
+    """
+    
+    def __init__(self, game):
+        """
+        Create an empty registry for a game
+        
+        Args:
+            game: GameOfLife whose engine and palettes the registry reads
+        """
+        self.game = game
+        self._genotypes = {}
+    
+    def __len__(self):
+        """Number of genotypes currently registered"""
+        return len(self._genotypes)
+    
+    def get(self, ids):
+        """Return the shared Genotype for (name, color, symbol) palette ids"""
+        genotype = self._genotypes.get(ids)
+        if genotype is None:
+            game = self.game
+            name_id, color_id, symbol_id = ids
+            genotype = Genotype(game.name_palette.render(name_id, game.name_depth),
+                                game.color_palette[color_id], game.symbol_palette[symbol_id])
+            self._genotypes[ids] = genotype
+        return genotype
+    
+    def prune(self):
+        """
+        Drop the genotypes no live cell carries, without rendering any name
+        
+        Names that neither a live cell nor a cell type carries are released
+        from the name palette as well.
+        
+        Returns:
+            Dict mapping the palette ids of each genotype on the board to its
+            number of live cells
+        """
+        game = self.game
+        counts = game.engine.genotype_counts()
+        self._genotypes = {ids: self._genotypes[ids] for ids in counts if ids in self._genotypes}
+        keep = {ids[0] for ids in counts}
+        keep.update(game.name_palette.intern(cell_type.lineage) for cell_type in game.cell_types)
+        game.name_palette.retain(keep)
+        return counts
+    
+    def counts(self):
+        """
+        Count the live cells of every genotype, dropping the unused ones
+        
+        Returns:
+            Dict mapping each Genotype on the board to its number of live cells
+        """
+        # Hybrids of different lineages can render to the same name
+        genotypes = {}
+        for ids, count in self.prune().items():
+            genotype = self.get(ids)
+            genotypes[genotype] = genotypes.get(genotype, 0) + count
+        return genotypes
+
+
+class RunStats:
+    """Summary of a GameOfLife.run call"""
+    
+    __slots__ = ("generations", "population", "births", "deaths", "elapsed", "switches",
+                 "conversion_time")
+    
+    def __init__(self, generations, population, births, deaths, elapsed, switches=0,
+                 conversion_time=0.0):
+        """
+        Record the outcome of a run
+        
+        Args:
+            generations: Number of generations stepped
+            population: Number of live cells after the last generation
+            births: Total number of cells born during the run
+            deaths: Total number of cells that died during the run
+            elapsed: Wall-clock time of the run in seconds
+            switches: Number of dense/sparse layout switches during the run
+            conversion_time: Seconds of the run spent converting layouts
+        """
+        self.generations = generations
+        self.population = population
+        self.births = births
+        self.deaths = deaths
+        self.elapsed = elapsed
+        self.switches = switches
+        self.conversion_time = conversion_time
+    
+    def __repr__(self):
+        return (f"RunStats(generations={self.generations}, population={self.population}, "
+                f"births={self.births}, deaths={self.deaths}, elapsed={self.elapsed:.3f}, "
+                f"switches={self.switches}, conversion_time={self.conversion_time:.3f})")
+
+
+class GridView:
+    """
+    Read-only view of a board as rows of Cell objects
+    
+    Rows are built from the engine's storage when they are accessed, so the
+    Cell objects are snapshots; use GameOfLife.set_cell to change the board.
+    """
+    
+    def __init__(self, engine, height):
+        """
+        Create a view over an engine's board
+        
+        Args:
+            engine: Engine holding the board
+            height: Number of rows
+        """
+        self.engine = engine
+        self.height = height
+    
+    def __len__(self):
+        """Number of rows"""
+        return self.height
+    
+    def __getitem__(self, x):
+        """Get a row as a list of Cell objects"""
+        if not -self.height <= x < self.height:
+            raise IndexError("grid row out of range")
+        return self.engine.row(x % self.height)
+    
+    def __iter__(self):
+        """Iterate over the rows"""
+        for x in range(self.height):
+            yield self.engine.row(x)
+
+
+class Engine:
+    """
+    Interface every stepping engine implements
+    
+    An engine owns the board of one GameOfLife and is created with the
+    game as its only argument. Positions are (row, column) pairs the game
+    has already checked against its boundary. Subclasses must implement
+    the storage, neighborhood scan and stepping methods; count_neighbors,
+    alive_neighbors, population, is_plain, run and close have generic
+    defaults that engines override when they can do better.
+    """
+    
+    # Name used to select the engine through GameOfLife(backend=...)
+    name = None
+    # Plain-only engines hold dead and default live cells and nothing else
+    plain_only = False
+    # Boundary modes the engine can step
+    boundaries = ("bounded",)
+    
+    def clear(self):
+        """Reset every cell to a dead default cell"""
+        raise NotImplementedError
+    
+    def row(self, x):
+        """Return row x as a list of Cell objects"""
+        raise NotImplementedError
+    
+    def live_cells(self):
+        """Yield (x, y, cell) for every live cell"""
+        raise NotImplementedError
+    
+    def get(self, x, y):
+        """Get the state of a cell"""
+        raise NotImplementedError
+    
+    def set(self, x, y, alive, cell_type):
+        """Set a cell, taking the properties of cell_type when given"""
+        raise NotImplementedError
+    
+    def scan_neighbors(self, x, y):
+        """
+        Count the live neighbors of a cell and collect their properties in one pass
+        
+        Plain-only engines share this version, which looks the neighbors up
+        with get; every live cell on their boards is a default cell.
+        
+        Returns:
+            Tuple of (count, list of (name, color, symbol) palette id tuples
+            of the live neighbors)
+        """
+        if not self.plain_only:
+            raise NotImplementedError
+        height, width = self.game.height, self.game.width
+        count = sum(1 for dx, dy in NEIGHBOR_OFFSETS
+                    if 0 <= x + dx < height and 0 <= y + dy < width and self.get(x + dx, y + dy))
+        return count, [DEFAULT_IDS] * count
+    
+    def step(self):
+        """Replace the board with the next generation"""
+        raise NotImplementedError
+    
+    def count_neighbors(self, x, y):
+        """Count the number of alive neighbors for a cell"""
+        return self.scan_neighbors(x, y)[0]
+    
+    def alive_neighbors(self, x, y):
+        """Get list of all alive neighbor cells"""
+        decode = self.game._decode
+        return [decode(1, *ids) for ids in self.scan_neighbors(x, y)[1]]
+    
+    def population(self):
+        """Count the live cells"""
+        return sum(1 for _ in self.live_cells())
+    
+    def is_plain(self):
+        """Whether every live cell is a default cell"""
+        return all((cell.lineage, cell.color, cell.symbol) == PLAIN_GENOTYPE
+                   for _, _, cell in self.live_cells())
+    
+    def genotype_counts(self):
+        """Count the live cells of each distinct (name, color, symbol) palette ids"""
+        if self.plain_only:
+            population = self.population()
+            return {DEFAULT_IDS: population} if population else {}
+        return Counter(self.game._encode(cell) for _, _, cell in self.live_cells())
+    
+    def run(self, generations):
+        """
+        Step several generations in a row
+        
+        Returns:
+            Number of cells born over those generations
+        """
+        births = 0
+        for _ in range(generations):
+            before = {(x, y) for x, y, _ in self.live_cells()}
+            self.step()
+            births += sum(1 for x, y, _ in self.live_cells() if (x, y) not in before)
+        return births
+    
+    def close(self):
+        """Release any worker processes or threads"""
+
+
+# Engines selectable through GameOfLife(backend=...), by name
+ENGINES = {}
+
+
+def register_engine(engine_class):
+    """Class decorator making an Engine subclass selectable by its name"""
+    ENGINES[engine_class.name] = engine_class
+    return engine_class
+
+
+@functools.lru_cache(maxsize=None)
+def _rule_table(births=(3,), survivals=(2, 3)):
+    """
+    Build the next state of a cell for every 3x3 neighborhood
+    
+    A neighborhood is a 9-bit index holding cell (row, column) of the
+    window at bit 3 * column + row, so the center cell is bit 4.
+    
+    Args:
+        births: Neighbor counts that bring a dead cell to life
+        survivals: Neighbor counts that keep a live cell alive
+        
+    Returns:
+        bytes of 512 next-state flags
+    """
+    table = bytearray(512)
+    for index in range(512):
+        neighbors = bin(index & ~16).count("1")
+        table[index] = neighbors in (survivals if index & 16 else births)
+    return bytes(table)
+
+
+@functools.lru_cache(maxsize=None)
+def _block_table(births=(3,), survivals=(2, 3)):
+    """
+    Build the next state of the 2x2 center of every 4x4 block
+    
+    A block is a 16-bit index holding cell (row, column) at bit
+    4 * column + row. The result holds the center cells (1, 1), (1, 2),
+    (2, 1) and (2, 2) in bits 0 to 3, so one lookup steps four cells.
+    
+    Args:
+        births: Neighbor counts that bring a dead cell to life
+        survivals: Neighbor counts that keep a live cell alive
+        
+    Returns:
+        bytes of 65536 four-bit results
+    """
+    rule = _rule_table(births, survivals)
+    table = bytearray(65536)
+    for index in range(65536):
+        columns = [(index >> shift) & 15 for shift in (0, 4, 8, 12)]
+        result = 0
+        for row in (1, 2):
+            # Three-cell slices of the columns around each center cell
+            slices = [(column >> (row - 1)) & 7 for column in columns]
+            upper = 0 if row == 1 else 2
+            result |= rule[slices[0] | slices[1] << 3 | slices[2] << 6] << upper
+            result |= rule[slices[1] | slices[2] << 3 | slices[3] << 6] << (upper + 1)
+        table[index] = result
+    return bytes(table)
+
+
+# Alive flags of two horizontally adjacent cells, indexed by two result bits
+_CELL_PAIRS = (b"\0\0", b"\1\0", b"\0\1", b"\1\1")
+
+
+def _step_rows(rows, span):
+    """
+    Step a block of rows with the 4x4 lookup table, two rows and columns at a time
+    
+    Args:
+        rows: Equal-length bytes of alive flags: one halo row above and below
+            the block, and per row one halo column on the left and at least
+            two columns on the right, all dead or taken from the neighbors
+        span: Number of columns in the block
+        
+    Returns:
+        List of bytes with the next generation of each row inside the halo
+    """
+    blocks = _block_table()
+    count = len(rows) - 2
+    if count % 2:
+        # Pair the last row with a dead one; its results are dropped
+        rows = rows + [bytes(len(rows[0]))]
+    stepped = []
+    for x in range(0, count, 2):
+        columns = [a | b << 1 | c << 2 | d << 3 for a, b, c, d in zip(*rows[x:x + 4])]
+        results = [blocks[columns[k] | columns[k + 1] << 4 | columns[k + 2] << 8
+                          | columns[k + 3] << 12]
+                   for k in range(0, span, 2)]
+        stepped.append(b"".join([_CELL_PAIRS[r & 3] for r in results])[:span])
+        stepped.append(b"".join([_CELL_PAIRS[r >> 2] for r in results])[:span])
+    return stepped[:count]
+
+
+@register_engine
+class PythonEngine(Engine):
+    """
+    Reference engine that walks every cell of the board in Python
+    
+    The board is stored as parallel flat arrays in row-major order: a
+    bytearray of alive flags plus palette ids for each cell's name, color
+    and symbol.
+    
+    Next states come from a lookup table mapping each 4x4 block of the
+    current board to its 2x2 center, so four cells are stepped per lookup
+    and only cells alive next generation need any further work.
+    
+    The board is also split into square tiles. Without mutations a tile
+    can only change if it or one of its neighbor tiles changed in the
+    previous generation, so all other tiles are carried over without being
+    recomputed. tiles_computed and tiles_skipped count both cases.
+    
+    Two preallocated boards swap roles every generation, so stepping writes
+    births, deaths and survivors in place and allocates nothing. A tile
+    left untouched in the back board still holds its state from two
+    generations ago, which is the current state of any skipped tile.
+    """
+    
+    name = "python"
+    plain_only = False
+    boundaries = ("bounded", "torus")
+    
+    TILE_SIZE = 16
+    
+    def __init__(self, game):
+        """
+        Create an empty board for a game
+        
+        Args:
+            game: GameOfLife instance providing the size, palettes and offspring rules
+        """
+        self.game = game
+        self.tile_rows = -(-game.height // self.TILE_SIZE)
+        self.tile_columns = -(-game.width // self.TILE_SIZE)
+        self.tiles_computed = 0
+        self.tiles_skipped = 0
+        self.clear()
+    
+    def _empty_board(self):
+        """Allocate (alive, name_ids, color_ids, symbol_ids) arrays of dead default cells"""
+        size = self.game.width * self.game.height
+        return (bytearray(size), array("I", [0]) * size, array("H", [0]) * size,
+                array("H", [0]) * size)
+    
+    def clear(self):
+        """Reset every cell to a dead default cell"""
+        tile_count = self.tile_rows * self.tile_columns
+        self.alive, self.name_ids, self.color_ids, self.symbol_ids = self._empty_board()
+        self._back_board = self._empty_board()
+        self.changed_tiles = bytearray([1]) * tile_count
+        self._back_changed_tiles = bytearray(tile_count)
+        self._active_tiles = bytearray(tile_count)
+        self._no_tiles = bytes(tile_count)
+        self._all_tiles = bytes([1]) * tile_count
+    
+    def _tile(self, x, y):
+        """Return the index of the tile holding a cell"""
+        return (x // self.TILE_SIZE) * self.tile_columns + y // self.TILE_SIZE
+    
+    def _cell(self, index):
+        """Build a Cell object for a flat board index"""
+        return self.game._decode(self.alive[index], self.name_ids[index], self.color_ids[index],
+                                 self.symbol_ids[index])
+    
+    def _store(self, board, index, cell):
+        """Write a Cell object into a board at a flat index"""
+        alive, name_ids, color_ids, symbol_ids = board
+        alive[index] = bool(cell.alive)
+        name_ids[index], color_ids[index], symbol_ids[index] = self.game._encode(cell)
+    
+    def row(self, x):
+        """Return row x as a list of Cell objects"""
+        start = x * self.game.width
+        return [self._cell(index) for index in range(start, start + self.game.width)]
+    
+    def live_cells(self):
+        """Yield (x, y, cell) for every live cell"""
+        index = self.alive.find(1)
+        while index != -1:
+            x, y = divmod(index, self.game.width)
+            yield x, y, self._cell(index)
+            index = self.alive.find(1, index + 1)
+    
+    def get(self, x, y):
+        """Get the state of an in-range cell"""
+        return bool(self.alive[x * self.game.width + y])
+    
+    def set(self, x, y, alive, cell_type):
+        """Set an in-range cell, taking the properties of cell_type when given"""
+        index = x * self.game.width + y
+        if cell_type is not None:
+            board = (self.alive, self.name_ids, self.color_ids, self.symbol_ids)
+            self._store(board, index, cell_type)
+        else:
+            self.alive[index] = bool(alive)
+            if not alive:
+                # Dead cells hold no palette ids, which may be released
+                self.name_ids[index] = self.color_ids[index] = self.symbol_ids[index] = 0
+        self.changed_tiles[self._tile(x, y)] = 1
+    
+    def scan_neighbors(self, x, y):
+        """Count the live neighbors of a cell and collect their palette ids in one pass"""
+        width = self.game.width
+        alive, name_ids = self.alive, self.name_ids
+        color_ids, symbol_ids = self.color_ids, self.symbol_ids
+        neighbors = []
+        for nx, ny in self.game._neighbor_positions(x, y):
+            index = nx * width + ny
+            if alive[index]:
+                neighbors.append((name_ids[index], color_ids[index], symbol_ids[index]))
+        return len(neighbors), neighbors
+    
+    def population(self):
+        """Count the live cells"""
+        return self.alive.count(1)
+    
+    def genotype_counts(self):
+        """Count the live cells of each distinct (name, color, symbol) palette ids"""
+        return Counter(compress(zip(self.name_ids, self.color_ids, self.symbol_ids), self.alive))
+    
+    def run(self, generations):
+        """
+        Step several generations in a row
+        
+        Returns:
+            Number of cells born over those generations
+        """
+        births = 0
+        for _ in range(generations):
+            before = int.from_bytes(self.alive, "little")
+            self.step()
+            # Every flag is a 0 or 1 byte, so set bits count newborn cells
+            births += bin(int.from_bytes(self.alive, "little") & ~before).count("1")
+        return births
+    
+    def _mark_active_tiles(self, active):
+        """Flag every tile that changed last generation or borders one that did"""
+        rows, columns = self.tile_rows, self.tile_columns
+        torus = self.game.boundary == "torus"
+        active[:] = self._no_tiles
+        for tile, changed in enumerate(self.changed_tiles):
+            if changed:
+                tile_x, tile_y = divmod(tile, columns)
+                if torus:
+                    # Tiles on opposite edges of a torus are neighbors
+                    around = [((tile_x + dx) % rows) * columns + (tile_y + dy) % columns
+                              for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+                else:
+                    around = [nx * columns + ny
+                              for nx in range(max(tile_x - 1, 0), min(tile_x + 2, rows))
+                              for ny in range(max(tile_y - 1, 0), min(tile_y + 2, columns))]
+                for neighbor in around:
+                    active[neighbor] = 1
+    
+    def step(self):
+        """Replace the board with the next generation"""
+        new_board = self._back_board
+        changed_tiles = self._back_changed_tiles
+        changed_tiles[:] = self._no_tiles
+        active = self._active_tiles
+        # Mutations can strike any tile, so every tile is recomputed while they are on
+        if self.game.mutation_rate > 0:
+            active[:] = self._all_tiles
+        else:
+            self._mark_active_tiles(active)
+        
+        game = self.game
+        shared = game._shared_genotype()
+        births = []
+        for tile, is_active in enumerate(active):
+            if is_active:
+                self.tiles_computed += 1
+                changed_tiles[tile] = self._step_tile(new_board, tile, shared, births)
+            else:
+                self.tiles_skipped += 1
+        
+        # Resolve the offspring of the whole generation in one batch
+        if births:
+            _, new_name_ids, new_color_ids, new_symbol_ids = new_board
+            resolved = game._resolve_births([neighbors for _, neighbors in births],
+                                            [divmod(index, game.width) for index, _ in births])
+            for (index, _), ids in zip(births, resolved):
+                new_name_ids[index], new_color_ids[index], new_symbol_ids[index] = ids
+        if game.mutation_rate > 0:
+            self._apply_mutations(new_board, changed_tiles)
+        
+        # Swap the buffers; the old board becomes the back board
+        self._back_board = (self.alive, self.name_ids, self.color_ids, self.symbol_ids)
+        self.alive, self.name_ids, self.color_ids, self.symbol_ids = new_board
+        self._back_changed_tiles = self.changed_tiles
+        self.changed_tiles = changed_tiles
+    
+    def _step_tile(self, new_board, tile, shared, births):
+        """
+        Compute the next generation of one tile into new_board
+        
+        Newborns that need the offspring rules are left as default cells and
+        appended to births, for step to resolve in one batch.
+        
+        Args:
+            new_board: (alive, name_ids, color_ids, symbol_ids) arrays to write
+            tile: Index of the tile
+            shared: Palette ids every live cell shares, from
+                GameOfLife._shared_genotype, or None
+            births: List collecting (index, neighbor palette ids) of births
+            
+        Returns:
+            True if any cell in the tile was born or died
+        """
+        game = self.game
+        width, height = game.width, game.height
+        alive, name_ids = self.alive, self.name_ids
+        color_ids, symbol_ids = self.color_ids, self.symbol_ids
+        new_alive, new_name_ids, new_color_ids, new_symbol_ids = new_board
+        top = (tile // self.tile_columns) * self.TILE_SIZE
+        left = (tile % self.tile_columns) * self.TILE_SIZE
+        bottom = min(top + self.TILE_SIZE, height)
+        right = min(left + self.TILE_SIZE, width)
+        span = right - left
+        changed = False
+        
+        # Alive flags of every row the tile reads, including one column on
+        # each side and a spare one for odd spans, with dead cells off the board
+        on_edge = top == 0 or left == 0 or bottom == height or right == width
+        if game.boundary == "torus" and on_edge:
+            # Ghost rows and columns come from the opposite edges instead
+            west, east = (left - 1) % width, right % width
+            rows = []
+            for x in range(top - 1, bottom + 1):
+                start = (x % height) * width
+                rows.append(alive[start + west:start + west + 1]
+                            + alive[start + left:start + right]
+                            + alive[start + east:start + east + 1] + b"\0")
+        else:
+            first, last = max(left - 1, 0), min(right + 2, width)
+            prefix, suffix = bytes(first - (left - 1)), bytes(right + 2 - last)
+            dead_row = bytes(span + 3)
+            rows = [prefix + alive[x * width + first:x * width + last] + suffix
+                    if 0 <= x < height else dead_row
+                    for x in range(top - 1, bottom + 1)]
+        
+        # Apply Game of Life rules
+        for x, flags in zip(range(top, bottom), _step_rows(rows, span)):
+            start = x * width + left
+            new_alive[start:start + span] = flags
+        
+        blank_names = array("I", [0]) * span
+        blank_ids = array("H", [0]) * span
+        for x in range(top, bottom):
+            start = x * width + left
+            end = start + span
+            new_name_ids[start:end] = blank_names
+            new_color_ids[start:end] = new_symbol_ids[start:end] = blank_ids
+            if new_alive[start:end] != alive[start:end]:
+                changed = True
+            
+            # Only cells alive next generation need properties, and default
+            # ones are already in place
+            if shared == DEFAULT_IDS:
+                continue
+            index = new_alive.find(1, start, end)
+            while index != -1:
+                if shared is not None:
+                    # Every survivor and newborn has the one genotype
+                    new_name_ids[index], new_color_ids[index], new_symbol_ids[index] = shared
+                elif alive[index]:
+                    # Survivors keep their properties
+                    new_name_ids[index] = name_ids[index]
+                    new_color_ids[index] = color_ids[index]
+                    new_symbol_ids[index] = symbol_ids[index]
+                else:
+                    births.append((index, self.scan_neighbors(x, index - x * width)[1]))
+                index = new_alive.find(1, index + 1, end)
+        
+        return changed
+    
+    def _apply_mutations(self, new_board, changed_tiles):
+        """Apply the per-cell mutation rules to a freshly computed board"""
+        game = self.game
+        if game.seed is not None:
+            self._apply_seeded_mutations(new_board, changed_tiles)
+            return
+        new_alive, new_name_ids, new_color_ids, new_symbol_ids = new_board
+        for index in _bernoulli_sites(game.mutation_rate, len(new_alive)):
+            # The back board holds this tile's old properties, so the tile
+            # must be recomputed next generation
+            changed_tiles[self._tile(*divmod(index, game.width))] = 1
+            if new_alive[index]:
+                # Mutate living cell - mostly change properties, rarely kill it
+                if random.random() < 0.03:  # Only 3% chance to die from mutation
+                    new_alive[index] = 0
+                    new_name_ids[index] = new_color_ids[index] = new_symbol_ids[index] = 0
+                else:
+                    cell = game._decode(1, new_name_ids[index], new_color_ids[index],
+                                        new_symbol_ids[index])
+                    game._mutate_cell(cell)
+                    self._store(new_board, index, cell)
+            elif random.random() < 0.01:  # Only 1% chance to spontaneously birth
+                # Very rarely birth a cell through mutation
+                cell = Cell(alive=True)
+                game._mutate_cell(cell)
+                self._store(new_board, index, cell)
+    
+    def _apply_seeded_mutations(self, new_board, changed_tiles):
+        """Apply the mutation rules with the draws of a seeded game"""
+        game = self.game
+        width = game.width
+        new_alive, new_name_ids, new_color_ids, new_symbol_ids = new_board
+        live = []
+        index = new_alive.find(1)
+        while index != -1:
+            live.append(index)
+            index = new_alive.find(1, index + 1)
+        sites, mutating = game._seeded_mutations(len(live), len(new_alive))
+        
+        for index in sites:
+            if not new_alive[index]:
+                x, y = divmod(index, width)
+                changed_tiles[self._tile(x, y)] = 1
+                new_alive[index] = 1
+                ids = game._spontaneous_ids(game._random_stream(_MUTATION_STREAM, x, y))
+                new_name_ids[index], new_color_ids[index], new_symbol_ids[index] = ids
+        for position in mutating:
+            index = live[position]
+            x, y = divmod(index, width)
+            changed_tiles[self._tile(x, y)] = 1
+            ids = (new_name_ids[index], new_color_ids[index], new_symbol_ids[index])
+            ids = game._mutate_ids(ids, game._random_stream(_MUTATION_STREAM, x, y))
+            if ids is None:
+                new_alive[index] = 0
+                ids = DEFAULT_IDS
+            new_name_ids[index], new_color_ids[index], new_symbol_ids[index] = ids
+
+
+def _life_rows(padded):
+    """
+    Apply the B3/S23 rule to the interior of a padded uint8 block
+    
+    Args:
+        padded: 2-D array of alive flags with one extra row and column on
+            every side, holding dead cells or halo cells from a neighbor
+        
+    Returns:
+        uint8 array with the next generation of the interior
+    """
+    # Sum each 3x3 window, cell included, as a vertical pass and a horizontal one
+    columns = padded[:-2] + padded[1:-1] + padded[2:]
+    totals = columns[:, :-2] + columns[:, 1:-1] + columns[:, 2:]
+    # A total of 3 always means alive next; 4 keeps a live cell alive
+    return ((totals == 3) | ((totals == 4) & (padded[1:-1, 1:-1] == 1))).view(np.uint8)
+
+
+def _wrap_ghosts(padded):
+    """Refresh the ghost border of a padded block from the opposite edges of its interior"""
+    padded[0, 1:-1] = padded[-2, 1:-1]
+    padded[-1, 1:-1] = padded[1, 1:-1]
+    # Whole columns, so the corners pick up the opposite corners
+    padded[:, 0] = padded[:, -2]
+    padded[:, -1] = padded[:, 1]
+
+
+def _life_block(rows, generations, wrap=False):
+    """
+    Step a block of rows several generations, treating everything outside it as dead
+    
+    Cells within `generations` rows of a cut edge pick up errors from the
+    missing neighbors, so callers pass that many halo rows on each side
+    and keep only the middle.
+    
+    Args:
+        rows: 2-D uint8 array of alive flags
+        generations: Number of generations to step
+        wrap: Treat the block as a torus instead, with ghost cells
+            refreshed from the opposite edges every generation
+        
+    Returns:
+        The block after the given number of generations
+    """
+    height, width = rows.shape
+    padded = np.zeros((height + 2, width + 2), dtype=np.uint8)
+    padded[1:-1, 1:-1] = rows
+    for _ in range(generations):
+        if wrap:
+            _wrap_ghosts(padded)
+        padded[1:-1, 1:-1] = _life_rows(padded)
+    return padded[1:-1, 1:-1]
+
+
+def _custom_step_kernel(alive, name_ids, color_ids, symbol_ids, height, width, wrap, mutation_rate,
+                        mutation_colors, mutation_symbols, new_alive, new_names, new_colors,
+                        new_symbols, partners):
+    """
+    Step a board with custom cells in a single loop over flattened arrays
+    
+    Neighbor counting, parent selection and offspring inheritance over
+    palette ids, and mutation all happen in the one loop, following
+    _select_parents, _create_offspring and _mutate_cell draw for draw. The
+    loop is plain enough for Numba to compile; NumpyEngine.custom_kernel
+    compiles it on first use when Numba is installed.
+    
+    Hybrid names are interned in the Python name palette, so a birth whose
+    parents are both named gets the first name's id in new_names and the
+    second name's id plus one in partners, for the caller to join them.
+    
+    Args:
+        alive, name_ids, color_ids, symbol_ids: Flattened current board
+        height, width: Shape of the board
+        wrap: Whether the board is a torus
+        mutation_rate: Probability of mutating each cell
+        mutation_colors, mutation_symbols: Palette ids a mutation picks from
+        new_alive, new_names, new_colors, new_symbols: Flattened arrays
+            receiving the next generation
+        partners: Flattened array receiving the pending hybrid names
+        
+    Returns:
+        Number of cells born
+    """
+    neighbors = np.empty(8, dtype=np.int64)
+    births = 0
+    # Draw the gap to the next mutated cell, as _bernoulli_sites does, so
+    # cells in between cost no draw
+    size = height * width
+    log_keep = 0.0
+    next_mutation = size
+    if mutation_rate >= 1.0:
+        next_mutation = 0
+    elif mutation_rate > 0:
+        log_keep = math.log(1.0 - mutation_rate)
+        next_mutation = int(min(math.log(1.0 - random.random()) / log_keep, size))
+    for x in range(height):
+        for y in range(width):
+            index = x * width + y
+            count = 0
+            for dx in range(-1, 2):
+                for dy in range(-1, 2):
+                    if dx == 0 and dy == 0:
+                        continue
+                    nx = x + dx
+                    ny = y + dy
+                    if wrap:
+                        nx %= height
+                        ny %= width
+                    elif nx < 0 or nx >= height or ny < 0 or ny >= width:
+                        continue
+                    if alive[nx * width + ny]:
+                        neighbors[count] = nx * width + ny
+                        count += 1
+            
+            state = 0
+            name = 0
+            color = 0
+            symbol = 0
+            partner = 0
+            if alive[index]:
+                if count == 2 or count == 3:
+                    state = 1
+                    name = name_ids[index]
+                    color = color_ids[index]
+                    symbol = symbol_ids[index]
+            elif count == 3:
+                state = 1
+                births += 1
+                # Shuffle, then take the first compatible pair or else the first two
+                for i in range(count - 1, 0, -1):
+                    j = int(random.random() * (i + 1))
+                    neighbors[i], neighbors[j] = neighbors[j], neighbors[i]
+                first = neighbors[0]
+                second = neighbors[1]
+                found = False
+                for i in range(count):
+                    for j in range(i + 1, count):
+                        a = neighbors[i]
+                        b = neighbors[j]
+                        # Only the empty name has id 0
+                        if ((name_ids[a] and name_ids[b]) or symbol_ids[a] != symbol_ids[b]
+                                or color_ids[a] != color_ids[b]):
+                            first = a
+                            second = b
+                            found = True
+                            break
+                    if found:
+                        break
+                symbol = symbol_ids[first] if random.random() < 0.5 else symbol_ids[second]
+                color = color_ids[first] if random.random() < 0.5 else color_ids[second]
+                if name_ids[first] and name_ids[second]:
+                    if random.random() < 0.5:
+                        name = name_ids[first]
+                        partner = name_ids[second] + 1
+                    else:
+                        name = name_ids[second]
+                        partner = name_ids[first] + 1
+                elif name_ids[second]:
+                    name = name_ids[second]
+                else:
+                    name = name_ids[first]
+            
+            if index == next_mutation:
+                if mutation_rate >= 1.0:
+                    next_mutation += 1
+                else:
+                    next_mutation += 1 + int(min(math.log(1.0 - random.random()) / log_keep, size))
+                mutate = False
+                if state:
+                    # Mutate living cell - mostly change properties, rarely kill it
+                    if random.random() < 0.03:
+                        state = 0
+                        partner = 0
+                    else:
+                        mutate = True
+                elif random.random() < 0.01:
+                    # Very rarely birth a default cell through mutation
+                    state = 1
+                    mutate = True
+                if mutate:
+                    if random.random() < 0.5:
+                        color = mutation_colors[int(random.random() * len(mutation_colors))]
+                    if random.random() < 0.3:
+                        symbol = mutation_symbols[int(random.random() * len(mutation_symbols))]
+            
+            new_alive[index] = state
+            if state:
+                new_names[index] = name
+                new_colors[index] = color
+                new_symbols[index] = symbol
+            else:
+                new_names[index] = 0
+                new_colors[index] = 0
+                new_symbols[index] = 0
+            partners[index] = partner
+    return births
+
+
+def _seed_kernel_random(seed):
+    """Seed the generator compiled code draws from, which is not the random module's"""
+    random.seed(seed)
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_kernels():
+    """
+    Compile the custom-cell kernel with Numba, importing it on first use
+    
+    Returns:
+        Tuple of the compiled _custom_step_kernel and _seed_kernel_random,
+        or None when Numba is not installed
+    """
+    try:
+        import numba
+    except ImportError:  # Numba is optional; without it custom-cell steps use array operations
+        return None
+    return (numba.njit(cache=True, nogil=True)(_custom_step_kernel),
+            numba.njit(cache=True)(_seed_kernel_random))
+
+
+@register_engine
+class NumpyEngine(Engine):
+    """
+    Vectorized engine that keeps the board in NumPy arrays
+    
+    The board uses the same layout as PythonEngine, as 2-D arrays: uint8
+    alive flags plus palette ids for names, colors and symbols. Neighbor
+    counts come from shifted-array sums and the rules are applied as boolean
+    masks, so only births next to custom cells and mutations run per-cell
+    Python code.
+    """
+    
+    name = "numpy"
+    plain_only = False
+    boundaries = ("bounded", "torus")
+    BLOCK_GENERATIONS = 8
+    
+    def __init__(self, game):
+        """
+        Create an empty board for a game
+        
+        Args:
+            game: GameOfLife instance providing the size, palettes and offspring rules
+        """
+        if np is None:
+            raise ImportError("The 'numpy' backend requires NumPy to be installed")
+        self.game = game
+        self.clear()
+    
+    @property
+    def custom_kernel(self):
+        """Compiled step for boards with custom cells or mutations, or None without Numba"""
+        compiled = _compiled_kernels()
+        return compiled[0] if compiled is not None else None
+    
+    def clear(self):
+        """Reset every cell to a dead default cell"""
+        shape = (self.game.height, self.game.width)
+        self.alive = np.zeros(shape, dtype=np.uint8)
+        self.name_ids = np.zeros(shape, dtype=np.uint32)
+        self.color_ids = np.zeros(shape, dtype=np.uint16)
+        self.symbol_ids = np.zeros(shape, dtype=np.uint16)
+    
+    def _cell(self, x, y):
+        """Build a Cell object for an in-range position"""
+        return self.game._decode(self.alive[x, y], self.name_ids[x, y], self.color_ids[x, y],
+                                 self.symbol_ids[x, y])
+    
+    def row(self, x):
+        """Return row x as a list of Cell objects"""
+        decode = self.game._decode
+        columns = zip(self.alive[x].tolist(), self.name_ids[x].tolist(),
+                      self.color_ids[x].tolist(), self.symbol_ids[x].tolist())
+        return [decode(*ids) for ids in columns]
+    
+    def live_cells(self):
+        """Yield (x, y, cell) for every live cell"""
+        for x, y in np.argwhere(self.alive).tolist():
+            yield x, y, self._cell(x, y)
+    
+    def get(self, x, y):
+        """Get the state of an in-range cell"""
+        return bool(self.alive[x, y])
+    
+    def set(self, x, y, alive, cell_type):
+        """Set an in-range cell, taking the properties of cell_type when given"""
+        if cell_type is not None:
+            self.alive[x, y] = bool(cell_type.alive)
+            ids = self.game._encode(cell_type)
+            self.name_ids[x, y], self.color_ids[x, y], self.symbol_ids[x, y] = ids
+        else:
+            self.alive[x, y] = bool(alive)
+            if not alive:
+                # Dead cells hold no palette ids, which may be released
+                self.name_ids[x, y] = self.color_ids[x, y] = self.symbol_ids[x, y] = 0
+    
+    @staticmethod
+    def _neighbor_counts(alive, wrap=False):
+        """Count the live neighbors of every cell with shifted-array sums"""
+        height, width = alive.shape
+        padded = np.zeros((height + 2, width + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = alive
+        if wrap:
+            _wrap_ghosts(padded)
+        # Sum each 3x3 window as a vertical pass followed by a horizontal one
+        columns = padded[:-2] + padded[1:-1] + padded[2:]
+        return columns[:, :-2] + columns[:, 1:-1] + columns[:, 2:] - alive
+    
+    def scan_neighbors(self, x, y):
+        """Count the live neighbors of a cell and collect their palette ids in one pass"""
+        neighbors = [(int(self.name_ids[position]), int(self.color_ids[position]),
+                      int(self.symbol_ids[position]))
+                     for position in self.game._neighbor_positions(x, y) if self.alive[position]]
+        return len(neighbors), neighbors
+    
+    def population(self):
+        """Count the live cells"""
+        return int(np.count_nonzero(self.alive))
+    
+    def run(self, generations):
+        """
+        Step several generations in a row
+        
+        Returns:
+            Number of cells born over those generations
+        """
+        births = 0
+        for _ in range(generations):
+            before = self.alive
+            self.step()
+            births += int(np.count_nonzero(self.alive > before))
+        return births
+    
+    def is_plain(self):
+        """Whether every live cell is a default cell"""
+        return not ((self.name_ids | self.color_ids | self.symbol_ids) * self.alive).any()
+    
+    def genotype_counts(self):
+        """Count the live cells of each distinct (name, color, symbol) palette ids"""
+        live = self.alive == 1
+        ids = np.stack([self.name_ids[live], self.color_ids[live], self.symbol_ids[live]], axis=1)
+        genotypes, counts = np.unique(ids, axis=0, return_counts=True)
+        return {tuple(row): count for row, count in zip(genotypes.tolist(), counts.tolist())}
+    
+    def _next_alive(self, generations=1):
+        """Compute the alive flags a number of plain-Conway generations ahead"""
+        return _life_block(self.alive, generations, self.game.boundary == "torus")
+    
+    def advance(self, generations):
+        """
+        Advance a plain-Conway board several generations at once
+        
+        Generations are taken BLOCK_GENERATIONS at a time, so parallel
+        subclasses only synchronize their bands once per block.
+        
+        Args:
+            generations: Number of generations to advance
+        """
+        while generations > 0:
+            block = min(generations, self.BLOCK_GENERATIONS)
+            self.alive = self._next_alive(block)
+            generations -= block
+        # Every newborn is a default cell, so no stale ids may carry over
+        self.name_ids[:] = 0
+        self.color_ids[:] = 0
+        self.symbol_ids[:] = 0
+    
+    def step(self):
+        """Replace the board with the next generation"""
+        game = self.game
+        # While every palette holds only its default, all ids are zero and
+        # the id arrays can be carried over untouched
+        custom = any(len(palette) > 1
+                     for palette in (game.name_palette, game.color_palette, game.symbol_palette))
+        shared = game._shared_genotype() if custom else None
+        if shared is not None:
+            # One genotype throughout breeds only copies of itself
+            new_alive = self._next_alive()
+            live = new_alive == 1
+            for ids, value_id in zip(("name_ids", "color_ids", "symbol_ids"), shared):
+                values = np.zeros_like(getattr(self, ids))
+                values[live] = value_id
+                setattr(self, ids, values)
+            self.alive = new_alive
+            return
+        # The kernel draws its own way, so seeded games keep to array operations
+        random_rules = custom or game.mutation_rate > 0
+        if game.seed is None and random_rules and self.custom_kernel is not None:
+            self._step_kernel()
+            return
+        
+        alive = self.alive
+        new_alive = self._next_alive()
+        name_ids, color_ids, symbol_ids = self.name_ids, self.color_ids, self.symbol_ids
+        
+        if custom:
+            survivors = alive & new_alive
+            births = new_alive > alive
+            # Multiplying by the mask keeps survivors' ids and resets everyone else
+            name_ids = name_ids * survivors
+            color_ids = color_ids * survivors
+            symbol_ids = symbol_ids * survivors
+            
+            # A birth surrounded only by default cells is a default cell, so
+            # only births touching a custom cell need the offspring rules
+            custom_ids = (self.name_ids | self.color_ids | self.symbol_ids) != 0
+            custom = ((alive == 1) & custom_ids).view(np.uint8)
+            custom_births = births & (self._neighbor_counts(custom, game.boundary == "torus") > 0)
+            sites = np.nonzero(custom_births)
+            if sites[0].size:
+                name_ids[sites], color_ids[sites], symbol_ids[sites] = self._resolve_births(*sites)
+        
+        if game.mutation_rate > 0:
+            # Mutations write through flattened views, which only contiguous arrays give
+            new_alive, name_ids, color_ids, symbol_ids = (
+                np.ascontiguousarray(array)
+                for array in (new_alive, name_ids, color_ids, symbol_ids))
+            self._apply_mutations(new_alive, name_ids, color_ids, symbol_ids)
+        
+        self.alive = new_alive
+        self.name_ids, self.color_ids, self.symbol_ids = name_ids, color_ids, symbol_ids
+    
+    def _resolve_births(self, xs, ys):
+        """
+        Resolve the offspring of every birth in a generation with array operations
+        
+        Follows GameOfLife._resolve_births, with each step applied to all
+        births at once: every birth has exactly three live neighbors, which
+        are shuffled with the same two swaps CounterRandom.shuffle makes
+        before the first compatible pair is picked from the three possible
+        pairs, so seeded games draw exactly what the Python engines do.
+        
+        Args:
+            xs, ys: Arrays with the rows and columns of the births
+            
+        Returns:
+            Tuple of (name, color, symbol) palette id arrays for the newborns
+        """
+        game = self.game
+        mode = "wrap" if game.boundary == "torus" else "constant"
+        alive, names, colors, symbols = (
+            np.pad(board, 1, mode=mode)
+            for board in (self.alive, self.name_ids, self.color_ids, self.symbol_ids))
+        offsets = np.array(NEIGHBOR_OFFSETS)
+        rows = xs[:, None] + offsets[:, 0] + 1
+        columns = ys[:, None] + offsets[:, 1] + 1
+        
+        # Positions of the three live neighbors of each birth, in random order
+        count = xs.size
+        if game.seed is None:
+            draws = np.array([random.random() for _ in range(5 * count)]).reshape(count, 5)
+        else:
+            draws = _counter_randoms((game.seed, game.generation, _OFFSPRING_STREAM), xs, ys, 5)
+        slots = np.nonzero(alive[rows, columns])[1].reshape(count, 3)
+        births = np.arange(count)
+        for i, column in ((2, 0), (1, 1)):
+            j = (draws[:, column] * (i + 1)).astype(np.int64)
+            swapped = slots[births, j]
+            slots[births, j] = slots[:, i]
+            slots[:, i] = swapped
+        rows = np.take_along_axis(rows, slots, axis=1)
+        columns = np.take_along_axis(columns, slots, axis=1)
+        names, colors = names[rows, columns], colors[rows, columns]
+        symbols = symbols[rows, columns]
+        # The empty name is always id 0
+        named = names != 0
+        
+        def compatible(i, j):
+            return ((named[:, i] & named[:, j]) | (colors[:, i] != colors[:, j])
+                    | (symbols[:, i] != symbols[:, j]))
+        
+        # The first compatible pair out of (0, 1), (0, 2) and (1, 2), else (0, 1)
+        first_pair, second_pair, third_pair = compatible(0, 1), compatible(0, 2), compatible(1, 2)
+        first = np.where(~first_pair & ~second_pair & third_pair, 1, 0)[:, None]
+        second = np.where(first_pair, 1, np.where(second_pair | third_pair, 2, 1))[:, None]
+        
+        def parents(values):
+            return (np.take_along_axis(values, first, axis=1)[:, 0],
+                    np.take_along_axis(values, second, axis=1)[:, 0])
+        
+        symbol1, symbol2 = parents(symbols)
+        color1, color2 = parents(colors)
+        name1, name2 = parents(names)
+        named1, named2 = parents(named)
+        symbol = np.where(draws[:, 2] < 0.5, symbol1, symbol2)
+        color = np.where(draws[:, 3] < 0.5, color1, color2)
+        name = np.where(named1, name1, np.where(named2, name2, 0)).astype(names.dtype)
+        
+        # Join and intern each distinct hybrid name once
+        hybrid = named1 & named2
+        if hybrid.any():
+            swap = draws[:, 4] >= 0.5
+            pairs = np.stack([np.where(swap, name2, name1)[hybrid],
+                              np.where(swap, name1, name2)[hybrid]], axis=1)
+            pairs, inverse = np.unique(pairs, axis=0, return_inverse=True)
+            palette = game.name_palette
+            joined = [palette.join(left, right) for left, right in pairs.tolist()]
+            name[hybrid] = np.array(joined, dtype=names.dtype)[inverse.reshape(-1)]
+        return name, color, symbol
+    
+    def _step_kernel(self):
+        """Step the whole board, custom cells and mutations included, with custom_kernel"""
+        game = self.game
+        colors = np.array([game.color_palette.intern(color) for color in MUTATION_COLORS],
+                          dtype=np.int64)
+        symbols = np.array([game.symbol_palette.intern(symbol) for symbol in MUTATION_SYMBOLS],
+                           dtype=np.int64)
+        
+        new_alive = np.empty_like(self.alive)
+        name_ids = np.empty_like(self.name_ids)
+        color_ids = np.empty_like(self.color_ids)
+        symbol_ids = np.empty_like(self.symbol_ids)
+        partners = np.empty(self.name_ids.shape, dtype=np.int64)
+        compiled = _compiled_kernels()
+        if compiled is not None and self.custom_kernel is compiled[0]:
+            # Numba keeps its own generator; seeding it from the random module
+            # on every call makes random.seed repeat compiled runs too
+            compiled[1](random.getrandbits(32))
+        self.custom_kernel(self.alive.reshape(-1), self.name_ids.reshape(-1),
+                           self.color_ids.reshape(-1), self.symbol_ids.reshape(-1), game.height,
+                           game.width, game.boundary == "torus", float(game.mutation_rate),
+                           colors, symbols, new_alive.reshape(-1), name_ids.reshape(-1),
+                           color_ids.reshape(-1), symbol_ids.reshape(-1), partners.reshape(-1))
+        
+        palette = game.name_palette
+        for x, y in np.argwhere(partners).tolist():
+            name_ids[x, y] = palette.join(int(name_ids[x, y]), int(partners[x, y]) - 1)
+        
+        self.alive = new_alive
+        self.name_ids, self.color_ids, self.symbol_ids = name_ids, color_ids, symbol_ids
+    
+    def _apply_mutations(self, alive, name_ids, color_ids, symbol_ids):
+        """Apply the per-cell mutation rules in place to a freshly computed, C-contiguous board"""
+        game = self.game
+        flat_alive = alive.reshape(-1)
+        flat_ids = (name_ids.reshape(-1), color_ids.reshape(-1), symbol_ids.reshape(-1))
+        if game.seed is not None:
+            self._apply_seeded_mutations(flat_alive, flat_ids)
+            return
+        for index in _bernoulli_sites(game.mutation_rate, flat_alive.size):
+            if flat_alive[index]:
+                # Mutate living cell - mostly change properties, rarely kill it
+                if random.random() < 0.03:
+                    flat_alive[index] = 0
+                    for ids in flat_ids:
+                        ids[index] = 0
+                    continue
+                cell = game._decode(1, *(ids[index] for ids in flat_ids))
+            elif random.random() < 0.01:
+                # Very rarely birth a cell through mutation
+                cell = Cell(alive=True)
+                flat_alive[index] = 1
+            else:
+                continue
+            game._mutate_cell(cell)
+            for ids, value_id in zip(flat_ids, game._encode(cell)):
+                ids[index] = value_id
+    
+    def _apply_seeded_mutations(self, flat_alive, flat_ids):
+        """
+        Apply the mutation rules with the draws of a seeded game
+        
+        flatnonzero lists the live cells in row-major order, which is the
+        order GameOfLife._seeded_mutations samples them in.
+        """
+        game = self.game
+        width = game.width
+        live = np.flatnonzero(flat_alive)
+        sites, mutating = game._seeded_mutations(live.size, flat_alive.size)
+        mutating = live[mutating].tolist()
+        
+        for index in sites:
+            if not flat_alive[index]:
+                flat_alive[index] = 1
+                rng = game._random_stream(_MUTATION_STREAM, *divmod(index, width))
+                for ids, value_id in zip(flat_ids, game._spontaneous_ids(rng)):
+                    ids[index] = value_id
+        for index in mutating:
+            rng = game._random_stream(_MUTATION_STREAM, *divmod(index, width))
+            new_ids = game._mutate_ids(tuple(int(ids[index]) for ids in flat_ids), rng)
+            if new_ids is None:
+                flat_alive[index] = 0
+                new_ids = DEFAULT_IDS
+            for ids, value_id in zip(flat_ids, new_ids):
+                ids[index] = value_id
+
+
+def _bit_sum3(a, b, c):
+    """Add three bit planes, returning the (ones, twos) planes of the sums"""
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+
+def _conway_bits(alive, above, below, left, right):
+    """
+    Apply the B3/S23 rule to every bit of a row at once with full adders
+    
+    Works on Python ints and NumPy uint64 arrays alike.
+    
+    Args:
+        alive: Bit plane of the row itself
+        above: (ones, twos) planes summing the three cells above each cell
+        below: (ones, twos) planes summing the three cells below each cell
+        left: Bit plane of each cell's left neighbor
+        right: Bit plane of each cell's right neighbor
+        
+    Returns:
+        Bit plane of the row in the next generation (unmasked)
+    """
+    ones, carry = _bit_sum3(above[0], below[0], left ^ right)
+    twos, fours = _bit_sum3(above[1], below[1], left & right)
+    fours |= twos & carry
+    twos ^= carry
+    # Exactly 3 neighbors, or exactly 2 for a live cell
+    return twos & ~fours & (ones | alive)
+
+
+def _band_bounds(height, bands):
+    """Split range(height) into contiguous (start, stop) bands of near-equal size"""
+    bands = max(1, min(bands, height))
+    return [(height * band // bands, height * (band + 1) // bands) for band in range(bands)]
+
+
+def _band_worker(connection, names, shape, start, stop):
+    """
+    Worker process loop for ProcessBandEngine
+    
+    Each request names the shared buffer holding the current generation
+    and a number of generations k. The worker copies its band plus k halo
+    rows from each neighboring band, steps it k generations and writes the
+    result into the other shared buffer.
+    
+    Args:
+        connection: Pipe end receiving (buffer index, generations), or None to exit
+        names: Names of the two shared-memory buffers
+        shape: (height, width) of the board
+        start: First row of the band
+        stop: Row after the last row of the band
+    """
+    height, width = shape
+    memories = [shared_memory.SharedMemory(name=name) for name in names]
+    boards = [np.ndarray(shape, dtype=np.uint8, buffer=memory.buf) for memory in memories]
+    current = target = None
+    try:
+        while True:
+            message = connection.recv()
+            if message is None:
+                break
+            source, generations = message
+            current, target = boards[source], boards[1 - source]
+            # Halo exchange: the neighbors' edge rows are read straight from shared memory
+            low, high = max(start - generations, 0), min(stop + generations, height)
+            rows = _life_block(current[low:high], generations)
+            target[start:stop] = rows[start - low:stop - low]
+            connection.send(True)
+    finally:
+        del boards, current, target
+        for memory in memories:
+            memory.close()
+        connection.close()
+
+
+def _stop_band_workers(connections, processes, memories):
+    """Shut down band workers and release their shared memory"""
+    for connection in connections:
+        try:
+            connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+    for process in processes:
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+    for connection in connections:
+        connection.close()
+    for memory in memories:
+        memory.close()
+        memory.unlink()
+
+
+class ProcessBandEngine(NumpyEngine):
+    """
+    NumPy engine that steps horizontal bands of the board in worker processes
+    
+    The alive flags live in two multiprocessing.shared_memory buffers that
+    swap roles every generation. Each worker owns one band and reads
+    one-row halos from its neighbors' bands before stepping it. The parent
+    process then handles offspring and mutations exactly as NumpyEngine
+    does, so results match serial stepping. advance() widens the halos to
+    BLOCK_GENERATIONS rows so workers only synchronize once per block.
+    Call close() (or GameOfLife.close()) to stop the workers; the engine
+    then keeps working serially.
+    """
+    
+    name = "processes"
+    
+    def __init__(self, game):
+        """
+        Start one worker process per band
+        
+        Args:
+            game: GameOfLife instance providing the size, processes and offspring rules
+        """
+        if shared_memory is None:
+            raise ImportError("Parallel stepping requires Python 3.8 or newer")
+        shape = (game.height, game.width)
+        size = max(1, game.height * game.width)
+        self._memories = [shared_memory.SharedMemory(create=True, size=size) for _ in range(2)]
+        self._boards = [np.ndarray(shape, dtype=np.uint8, buffer=memory.buf)
+                        for memory in self._memories]
+        self._connections = []
+        self._processes = []
+        self._finalizer = weakref.finalize(self, _stop_band_workers,
+                                           self._connections, self._processes, self._memories)
+        super().__init__(game)
+        
+        names = [memory.name for memory in self._memories]
+        for start, stop in _band_bounds(game.height, game.processes):
+            parent_end, worker_end = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_band_worker, daemon=True,
+                                              args=(worker_end, names, shape, start, stop))
+            process.start()
+            worker_end.close()
+            self._connections.append(parent_end)
+            self._processes.append(process)
+    
+    def clear(self):
+        """Reset every cell to a dead default cell"""
+        super().clear()
+        if self._boards:
+            self._boards[0][:] = 0
+            self.alive = self._boards[0]
+    
+    def _next_alive(self, generations=1):
+        """Have every worker step its band into the other shared buffer"""
+        if not self._boards:
+            return super()._next_alive(generations)
+        source = 0 if self.alive is self._boards[0] else 1
+        if self.alive is not self._boards[source]:
+            # The board was replaced outside of the shared buffers
+            self._boards[source][:] = self.alive
+        for connection in self._connections:
+            connection.send((source, generations))
+        # Waiting for every band doubles as the barrier before the next exchange
+        for connection in self._connections:
+            connection.recv()
+        return self._boards[1 - source]
+    
+    def close(self):
+        """Stop the worker processes and keep stepping serially"""
+        if self._boards:
+            self.alive = self.alive.copy()
+            self._boards = []
+            self._finalizer()
+
+
+class ThreadBandEngine(NumpyEngine):
+    """
+    NumPy engine that steps horizontal bands of the board on a thread pool
+    
+    NumPy releases the GIL inside its array loops, so bands stepped on
+    separate threads run on separate cores without the start-up and
+    shared-memory plumbing of ProcessBandEngine. Every band reads its halo
+    rows straight from the current board, and advance() widens them so the
+    pool is only joined once per block of generations.
+    """
+    
+    name = "threads"
+    
+    def __init__(self, game):
+        """
+        Create the thread pool
+        
+        Args:
+            game: GameOfLife instance providing the size, workers and offspring rules
+        """
+        super().__init__(game)
+        self._bands = _band_bounds(game.height, game.workers)
+        self._executor = ThreadPoolExecutor(max_workers=len(self._bands))
+    
+    def _next_alive(self, generations=1):
+        """Step every band on the pool and gather the results"""
+        if self._executor is None:
+            return super()._next_alive(generations)
+        alive = self.alive
+        height = self.game.height
+        new_alive = np.empty_like(alive)
+        
+        def step_band(bounds):
+            start, stop = bounds
+            low, high = max(start - generations, 0), min(stop + generations, height)
+            rows = _life_block(alive[low:high], generations)
+            new_alive[start:stop] = rows[start - low:stop - low]
+        
+        # list() waits for every band and re-raises any worker exception
+        list(self._executor.map(step_band, self._bands))
+        return new_alive
+    
+    def close(self):
+        """Shut down the thread pool and keep stepping serially"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+@register_engine
+class BitPackedEngine(Engine):
+    """
+    Plain-Conway engine that packs the board one bit per cell
+    
+    Each row is an array of uint64 words when NumPy is available and a
+    Python int otherwise, and neighbor counts are computed for a whole row
+    of bits at a time with bitwise full adders. Only dead and default live
+    cells can be represented, so the game hands the board back to a full
+    engine as soon as custom cells or mutations come into play.
+    """
+    
+    name = "bitpacked"
+    plain_only = True
+    use_numpy = np is not None
+    
+    def __init__(self, game):
+        """
+        Create an empty board for a game
+        
+        Args:
+            game: GameOfLife instance providing the size
+        """
+        self.game = game
+        self.numpy = self.use_numpy
+        self.word_count = (game.width + 63) // 64
+        self.clear()
+    
+    def clear(self):
+        """Reset every cell to dead"""
+        if self.numpy:
+            self.words = np.zeros((self.game.height, self.word_count), dtype=np.uint64)
+        else:
+            self.bits = [0] * self.game.height
+    
+    def get(self, x, y):
+        """Get the state of an in-range cell"""
+        if self.numpy:
+            return bool((int(self.words[x, y >> 6]) >> (y & 63)) & 1)
+        return bool((self.bits[x] >> y) & 1)
+    
+    def set(self, x, y, alive, cell_type):
+        """Set an in-range cell; cell_type only contributes its alive flag"""
+        if cell_type is not None:
+            alive = cell_type.alive
+        if self.numpy:
+            bit = np.uint64(1 << (y & 63))
+            if alive:
+                self.words[x, y >> 6] |= bit
+            else:
+                self.words[x, y >> 6] &= ~bit
+        elif alive:
+            self.bits[x] |= 1 << y
+        else:
+            self.bits[x] &= ~(1 << y)
+    
+    def _row_bits(self, x):
+        """Return row x as a Python int with bit y set for each live cell"""
+        if not self.numpy:
+            return self.bits[x]
+        return int.from_bytes(self.words[x].astype("<u8").tobytes(), "little")
+    
+    def row(self, x):
+        """Return row x as a list of Cell objects"""
+        bits = self._row_bits(x)
+        return [Cell(alive=bool((bits >> y) & 1)) for y in range(self.game.width)]
+    
+    def live_cells(self):
+        """Yield (x, y, cell) for every live cell"""
+        for x in range(self.game.height):
+            bits = self._row_bits(x)
+            while bits:
+                low = bits & -bits
+                yield x, low.bit_length() - 1, Cell(alive=True)
+                bits ^= low
+    
+    @staticmethod
+    def _count_bits(words):
+        """Count the set bits in an array of uint64 words"""
+        return int(np.unpackbits(words.view(np.uint8)).sum())
+    
+    def population(self):
+        """Count the live cells"""
+        if self.numpy:
+            return self._count_bits(self.words)
+        return sum(bin(bits).count("1") for bits in self.bits)
+    
+    def step(self):
+        """Replace the board with the next generation"""
+        if self.numpy:
+            self._step_words()
+        else:
+            self._step_ints()
+    
+    def run(self, generations):
+        """
+        Step several generations in a row
+        
+        Returns:
+            Number of cells born over those generations
+        """
+        births = 0
+        for _ in range(generations):
+            if self.numpy:
+                before = self.words
+                self._step_words()
+                births += self._count_bits(self.words & ~before)
+            else:
+                before = self.bits
+                self._step_ints()
+                births += sum(bin(bits & ~old).count("1") for bits, old in zip(self.bits, before))
+        return births
+    
+    def _step_ints(self):
+        """Advance a board stored as one Python int per row"""
+        mask = (1 << self.game.width) - 1
+        rows = self.bits
+        sides = [((bits << 1) & mask, bits >> 1) for bits in rows]
+        sums = [_bit_sum3(left, bits, right) for bits, (left, right) in zip(rows, sides)]
+        empty = (0, 0)
+        last = len(rows) - 1
+        self.bits = [
+            _conway_bits(bits, sums[x - 1] if x > 0 else empty, sums[x + 1] if x < last else empty,
+                         *sides[x])
+            for x, bits in enumerate(rows)
+        ]
+    
+    def _step_words(self):
+        """Advance a board stored as uint64 words with NumPy"""
+        words = self.words
+        # Shift each row by one bit, carrying between neighboring words
+        left = words << 1
+        left[:, 1:] |= words[:, :-1] >> 63
+        right = words >> 1
+        right[:, :-1] |= words[:, 1:] << 63
+        
+        ones, twos = _bit_sum3(left, words, right)
+        above_ones, above_twos = np.zeros_like(words), np.zeros_like(words)
+        above_ones[1:], above_twos[1:] = ones[:-1], twos[:-1]
+        below_ones, below_twos = np.zeros_like(words), np.zeros_like(words)
+        below_ones[:-1], below_twos[:-1] = ones[1:], twos[1:]
+        
+        new_words = _conway_bits(words, (above_ones, above_twos), (below_ones, below_twos),
+                                 left, right)
+        # Clear the padding bits past the right edge of the board
+        spare = self.word_count * 64 - self.game.width
+        if spare:
+            new_words[:, -1] &= np.uint64((1 << (64 - spare)) - 1)
+        self.words = new_words
+
+
+def _bernoulli_sites(probability, size, rng=random):
+    """
+    Yield the indices in range(size) that succeed in independent trials
+    
+    Gaps between successes are drawn from a geometric distribution, so the
+    cost is proportional to the number of successes rather than to size.
+    
+    Args:
+        probability: Success probability of each trial
+        size: Number of trials
+        rng: Source of the draws, the random module or a CounterRandom
+    """
+    if probability <= 0:
+        return
+    if probability >= 1:
+        yield from range(size)
+        return
+    log_failure = math.log(1.0 - probability)
+    index = -1
+    while True:
+        index += 1 + int(math.log(1.0 - rng.random()) / log_failure)
+        if index >= size:
+            return
+        yield index
+
+
+# Kinds of decision a seeded game keys its random streams by
+_OFFSPRING_STREAM, _MUTATION_STREAM, _SPONTANEOUS_STREAM, _MUTATING_STREAM = range(4)
+
+# SplitMix64 constants; CounterRandom runs the generator on counters
+_MASK64 = (1 << 64) - 1
+_GOLDEN64 = 0x9E3779B97F4A7C15
+_MIX1, _MIX2 = 0xBF58476D1CE4E5B9, 0x94D049BB133111EB
+_UNIT53 = 2.0 ** -53
+
+
+def _mix64(value):
+    """Scramble a 64-bit integer with the SplitMix64 finalizer"""
+    value = (value ^ (value >> 30)) * _MIX1 & _MASK64
+    value = (value ^ (value >> 27)) * _MIX2 & _MASK64
+    return value ^ (value >> 31)
+
+
+def _stream_key(parts):
+    """Hash a sequence of integers, negative ones taken modulo 2**64, to a 64-bit key"""
+    key = 0
+    for part in parts:
+        key = _mix64((key + (part & _MASK64) + _GOLDEN64) & _MASK64)
+    return key
+
+
+class CounterRandom:
+    """
+    Counter-based random stream for the decisions of one cell in one generation
+    
+    The n-th number of a stream is a hash of its key and n, and the key is
+    a hash of the integers naming the stream: a seeded game names them by
+    seed, generation, kind of decision and the cell's coordinates. A cell's
+    draws are thus a pure function of those, whichever engine steps the
+    board and in whatever order it visits the cells. Offers the random,
+    choice and shuffle methods of the random module that the offspring and
+    mutation rules use.
+    """
+    
+    __slots__ = ("key", "counter")
+    
+    def __init__(self, *parts):
+        """
+        Create a stream named by a sequence of integers
+        
+        Args:
+            parts: Integers naming the stream, e.g. (seed, generation,
+                stream, x, y)
+        """
+        self.key = _stream_key(parts)
+        self.counter = 0
+    
+    def random(self):
+        """Return the next float in [0, 1)"""
+        self.counter += 1
+        return (_mix64((self.key + self.counter * _GOLDEN64) & _MASK64) >> 11) * _UNIT53
+    
+    def choice(self, seq):
+        """Return a random element of a non-empty sequence"""
+        return seq[int(self.random() * len(seq))]
+    
+    def shuffle(self, items):
+        """Shuffle a list in place"""
+        for i in range(len(items) - 1, 0, -1):
+            j = int(self.random() * (i + 1))
+            items[i], items[j] = items[j], items[i]
+
+
+def _mix64_array(values):
+    """_mix64 over a NumPy uint64 array, wrapping like the masked Python version"""
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(_MIX1)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(_MIX2)
+    return values ^ (values >> np.uint64(31))
+
+
+def _counter_randoms(parts, xs, ys, draws):
+    """
+    Draw the first numbers of many cells' CounterRandom streams at once
+    
+    Args:
+        parts: Integers naming every stream before the coordinates, e.g.
+            (seed, generation, stream)
+        xs, ys: Integer arrays with the rows and columns of the cells
+        draws: Number of draws per cell
+        
+    Returns:
+        Float array of shape (cells, draws) whose row i holds the first
+        draws of CounterRandom(*parts, xs[i], ys[i])
+    """
+    keys = np.full(len(xs), _stream_key(parts), dtype=np.uint64)
+    for values in (xs, ys):
+        values = np.asarray(values, dtype=np.int64).view(np.uint64)
+        keys = _mix64_array(keys + values + np.uint64(_GOLDEN64))
+    counters = np.arange(1, draws + 1, dtype=np.uint64) * np.uint64(_GOLDEN64)
+    return (_mix64_array(keys[:, None] + counters) >> np.uint64(11)).astype(np.float64) * _UNIT53
+
+
+@register_engine
+class SparseEngine(Engine):
+    """
+    Engine that stores only the live cells, for large mostly empty boards
+    
+    The board is a dict mapping (row, column) to the (name, color, symbol)
+    palette ids of each live cell. A step only visits live cells and their
+    neighbors, and spontaneous mutation births are sampled with geometric
+    gaps, so both creating and stepping the board cost time proportional to
+    the population rather than the area.
+    """
+    
+    name = "sparse"
+    plain_only = False
+    boundaries = ("bounded", "torus")
+    
+    def __init__(self, game):
+        """
+        Create an empty board for a game
+        
+        Args:
+            game: GameOfLife instance providing the size, palettes and offspring rules
+        """
+        self.game = game
+        self.clear()
+    
+    def clear(self):
+        """Reset every cell to dead"""
+        self.cells = {}
+    
+    def row(self, x):
+        """Return row x as a list of Cell objects"""
+        return [self._cell(x, y) for y in range(self.game.width)]
+    
+    def _cell(self, x, y):
+        """Build a Cell object for an in-range position"""
+        ids = self.cells.get((x, y))
+        if ids is None:
+            return Cell()
+        return self.game._decode(1, *ids)
+    
+    def live_cells(self):
+        """Yield (x, y, cell) for every live cell"""
+        for (x, y), ids in list(self.cells.items()):
+            yield x, y, self.game._decode(1, *ids)
+    
+    def get(self, x, y):
+        """Get the state of an in-range cell"""
+        return (x, y) in self.cells
+    
+    def set(self, x, y, alive, cell_type):
+        """Set an in-range cell, taking the properties of cell_type when given"""
+        if cell_type is not None:
+            alive = cell_type.alive
+            ids = self.game._encode(cell_type)
+        else:
+            # A cell brought back to life without a type is a default cell
+            ids = self.cells.get((x, y), DEFAULT_IDS)
+        if alive:
+            self.cells[(x, y)] = ids
+        else:
+            self.cells.pop((x, y), None)
+    
+    def scan_neighbors(self, x, y):
+        """Count the live neighbors of a cell and collect their palette ids in one pass"""
+        cells = self.cells
+        neighbors = [cells[position] for position in self.game._neighbor_positions(x, y)
+                     if position in cells]
+        return len(neighbors), neighbors
+    
+    def population(self):
+        """Count the live cells"""
+        return len(self.cells)
+    
+    def genotype_counts(self):
+        """Count the live cells of each distinct (name, color, symbol) palette ids"""
+        return Counter(self.cells.values())
+    
+    def run(self, generations):
         """
-        Initialize a cell with custom properties
+        Step several generations in a row
         
-        Args:
-            alive: Whether the cell is alive
-            name: Custom name for the cell
-            color: Color for the cell (default: white)
-            symbol: Symbol to display for the cell (default: █)
+        Returns:
+            Number of cells born over those generations
         """
+        births = 0
+        for _ in range(generations):
+            before = self.cells
+            self.step()
+            births += sum(1 for position in self.cells if position not in before)
+        return births
+    
+    def step(self):
+        """Replace the board with the next generation"""
+        game = self.game
+        cells = self.cells
+        height, width = game.height, game.width
+        torus = game.boundary == "torus"
+        
+        # Every cell that could be alive next generation neighbors a live cell
+        counts = {}
+        for x, y in cells:
+            for dx, dy in NEIGHBOR_OFFSETS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < height and 0 <= ny < width:
+                    counts[(nx, ny)] = counts.get((nx, ny), 0) + 1
+                elif torus:
+                    # Only neighbors across an edge need wrapping
+                    position = (nx % height, ny % width)
+                    counts[position] = counts.get(position, 0) + 1
+        
+        shared = game._shared_genotype()
+        new_cells = {}
+        births = []
+        for position, neighbors in counts.items():
+            if position in cells:
+                # Live cell with 2 or 3 neighbors survives
+                if neighbors == 2 or neighbors == 3:
+                    new_cells[position] = cells[position]
+            elif neighbors == 3:
+                # Dead cell with exactly 3 neighbors becomes alive
+                if shared is not None:
+                    new_cells[position] = shared
+                else:
+                    births.append((position, self.scan_neighbors(*position)[1]))
+        
+        # Resolve the offspring of the whole generation in one batch
+        if births:
+            resolved = game._resolve_births([parents for _, parents in births],
+                                            [position for position, _ in births])
+            for (position, _), ids in zip(births, resolved):
+                new_cells[position] = ids
+        
+        if game.mutation_rate > 0:
+            self._apply_mutations(new_cells)
+        self.cells = new_cells
+    
+    def _apply_mutations(self, cells):
+        """Apply the per-cell mutation rules to a freshly computed board"""
+        game = self.game
+        size = game.width * game.height
+        if game.seed is not None:
+            # Seeded mutations pick live cells in row-major order
+            live = sorted(cells)
+            sites, mutating = game._seeded_mutations(len(live), size)
+        else:
+            # Dead cells are born through mutation with probability rate * 1%;
+            # sampling over the whole area and skipping live cells is equivalent
+            live = list(cells)
+            sites = _bernoulli_sites(game.mutation_rate * 0.01, size)
+            mutating = _bernoulli_sites(game.mutation_rate, len(live))
+        
+        for index in sites:
+            position = divmod(index, game.width)
+            if position not in cells:
+                rng = game._random_stream(_MUTATION_STREAM, *position)
+                cells[position] = game._spontaneous_ids(rng)
+        for index in mutating:
+            position = live[index]
+            rng = game._random_stream(_MUTATION_STREAM, *position)
+            ids = game._mutate_ids(cells[position], rng)
+            if ids is None:
+                del cells[position]
+            else:
+                cells[position] = ids
+
+
+class _Chunk:
+    """Square piece of an unbounded board; ids only holds live custom cells"""
+    
+    __slots__ = ("alive", "ids")
+    
+    def __init__(self, alive):
         self.alive = alive
-        self.name = name
-        self.color = color
-        self.symbol = symbol
+        self.ids = {}
+
+
+@register_engine
+class ChunkedEngine(Engine):
+    """
+    Engine for an unbounded board that grows and shrinks in square chunks
     
-    def __bool__(self):
-        """Allow cell to be used in boolean context"""
-        return self.alive
+    The board is a dict mapping (chunk row, chunk column) to a chunk of
+    alive flags plus the palette ids of its live custom cells. A chunk is
+    allocated when live cells first reach it and freed once it is empty, so
+    memory and step time follow the live region wherever it wanders. Each
+    chunk is stepped with the 4x4 lookup table, reading one halo row and
+    column from the chunks around it. The game's width and height only
+    frame the rows shown by row() and the grid.
     
-    def copy(self):
-        """Create a copy of this cell"""
-        return Cell(self.alive, self.name, self.color, self.symbol)
+    Mutations can strike any live cell, but spontaneous births are only
+    sampled inside allocated chunks, as the empty universe has no end.
+    """
+    
+    name = "chunked"
+    plain_only = False
+    boundaries = ("unbounded",)
+    
+    CHUNK_SIZE = 32
+    
+    def __init__(self, game):
+        """
+        Create an empty board for a game
+        
+        Args:
+            game: GameOfLife instance providing the palettes and offspring rules
+        """
+        self.game = game
+        self.clear()
+    
+    def clear(self):
+        """Reset every cell to dead, freeing all chunks"""
+        self.chunks = {}
+    
+    def _locate(self, x, y):
+        """Return the chunk key and the index within the chunk of any cell"""
+        chunk_x, local_x = divmod(x, self.CHUNK_SIZE)
+        chunk_y, local_y = divmod(y, self.CHUNK_SIZE)
+        return (chunk_x, chunk_y), local_x * self.CHUNK_SIZE + local_y
+    
+    def _ids(self, x, y):
+        """Return the palette ids of a live cell, or None for a dead one"""
+        key, index = self._locate(x, y)
+        chunk = self.chunks.get(key)
+        if chunk is None or not chunk.alive[index]:
+            return None
+        return chunk.ids.get(index, DEFAULT_IDS)
+    
+    def _cell(self, x, y):
+        """Build a Cell object for any position"""
+        ids = self._ids(x, y)
+        if ids is None:
+            return Cell()
+        return self.game._decode(1, *ids)
+    
+    def row(self, x):
+        """Return the visible part of row x as a list of Cell objects"""
+        return [self._cell(x, y) for y in range(self.game.width)]
+    
+    def live_cells(self):
+        """Yield (x, y, cell) for every live cell"""
+        size = self.CHUNK_SIZE
+        for (chunk_x, chunk_y), chunk in list(self.chunks.items()):
+            index = chunk.alive.find(1)
+            while index != -1:
+                local_x, local_y = divmod(index, size)
+                ids = chunk.ids.get(index, DEFAULT_IDS)
+                cell = self.game._decode(1, *ids)
+                yield chunk_x * size + local_x, chunk_y * size + local_y, cell
+                index = chunk.alive.find(1, index + 1)
+    
+    def get(self, x, y):
+        """Get the state of any cell"""
+        return self._ids(x, y) is not None
+    
+    def set(self, x, y, alive, cell_type):
+        """Set any cell, taking the properties of cell_type when given"""
+        key, index = self._locate(x, y)
+        chunk = self.chunks.get(key)
+        if cell_type is not None:
+            alive = cell_type.alive
+            ids = self.game._encode(cell_type)
+        elif chunk is not None and chunk.alive[index]:
+            ids = chunk.ids.get(index, DEFAULT_IDS)
+        else:
+            # A cell brought back to life without a type is a default cell
+            ids = DEFAULT_IDS
+        
+        if alive:
+            if chunk is None:
+                chunk = self.chunks[key] = _Chunk(bytearray(self.CHUNK_SIZE * self.CHUNK_SIZE))
+            chunk.alive[index] = 1
+            if ids != DEFAULT_IDS:
+                chunk.ids[index] = ids
+            else:
+                chunk.ids.pop(index, None)
+        elif chunk is not None:
+            chunk.alive[index] = 0
+            chunk.ids.pop(index, None)
+            if chunk.alive.find(1) == -1:
+                del self.chunks[key]
+    
+    def scan_neighbors(self, x, y):
+        """Count the live neighbors of a cell and collect their palette ids in one pass"""
+        neighbors = []
+        for dx, dy in NEIGHBOR_OFFSETS:
+            ids = self._ids(x + dx, y + dy)
+            if ids is not None:
+                neighbors.append(ids)
+        return len(neighbors), neighbors
+    
+    def population(self):
+        """Count the live cells"""
+        return sum(chunk.alive.count(1) for chunk in self.chunks.values())
+    
+    def genotype_counts(self):
+        """Count the live cells of each distinct (name, color, symbol) palette ids"""
+        counts = Counter()
+        for chunk in self.chunks.values():
+            counts.update(chunk.ids.values())
+            # Default cells are the live cells without an entry in ids
+            defaults = chunk.alive.count(1) - len(chunk.ids)
+            if defaults:
+                counts[DEFAULT_IDS] += defaults
+        return counts
+    
+    def _candidates(self):
+        """List the chunks that can hold live cells next generation"""
+        size = self.CHUNK_SIZE
+        last = size * (size - 1)
+        candidates = set(self.chunks)
+        # An empty chunk can only see births along an edge or corner where
+        # a neighboring chunk has live cells
+        for (chunk_x, chunk_y), chunk in self.chunks.items():
+            alive = chunk.alive
+            touching = [
+                (-1, 0, alive.find(1, 0, size) != -1),
+                (1, 0, alive.find(1, last) != -1),
+                (0, -1, 1 in alive[0::size]),
+                (0, 1, 1 in alive[size - 1::size]),
+                (-1, -1, alive[0]),
+                (-1, 1, alive[size - 1]),
+                (1, -1, alive[last]),
+                (1, 1, alive[-1]),
+            ]
+            for dx, dy, live in touching:
+                if live:
+                    candidates.add((chunk_x + dx, chunk_y + dy))
+        return candidates
+    
+    def step(self):
+        """Replace the board with the next generation"""
+        game = self.game
+        size = self.CHUNK_SIZE
+        chunks = self.chunks
+        dead_row = bytes(size)
+        shared = game._shared_genotype()
+        new_chunks = {}
+        births = []
+        
+        for chunk_x, chunk_y in self._candidates():
+            around = {(dx, dy): chunks.get((chunk_x + dx, chunk_y + dy))
+                      for dx in (-1, 0, 1) for dy in (-1, 0, 1)}
+            
+            # Rows of the chunk with one halo row and column from its neighbors
+            rows = []
+            for r in range(-1, size + 1):
+                if r < 0:
+                    dx, start = -1, (size - 1) * size
+                else:
+                    dx, start = (1, 0) if r == size else (0, r * size)
+                left, middle, right = around[(dx, -1)], around[(dx, 0)], around[(dx, 1)]
+                rows.append((left.alive[start + size - 1:start + size] if left else b"\0")
+                            + (middle.alive[start:start + size] if middle else dead_row)
+                            + (right.alive[start:start + 1] if right else b"\0"))
+            new_alive = bytearray(b"".join(_step_rows(rows, size)))
+            if new_alive.find(1) == -1:
+                continue
+            new_chunk = new_chunks[(chunk_x, chunk_y)] = _Chunk(new_alive)
+            
+            # Without custom cells nearby every survivor and newborn is a default cell
+            if not any(chunk is not None and chunk.ids for chunk in around.values()):
+                continue
+            old = around[(0, 0)]
+            index = new_alive.find(1)
+            while index != -1:
+                if old is not None and old.alive[index]:
+                    # Survivors keep their properties
+                    if index in old.ids:
+                        new_chunk.ids[index] = old.ids[index]
+                else:
+                    if shared is not None:
+                        if shared != DEFAULT_IDS:
+                            new_chunk.ids[index] = shared
+                    else:
+                        local_x, local_y = divmod(index, size)
+                        position = (chunk_x * size + local_x, chunk_y * size + local_y)
+                        neighbors = self.scan_neighbors(*position)[1]
+                        births.append((new_chunk, index, position, neighbors))
+                index = new_alive.find(1, index + 1)
+        
+        # Resolve the offspring of the whole generation in one batch
+        if births:
+            resolved = game._resolve_births([parents for _, _, _, parents in births],
+                                            [position for _, _, position, _ in births])
+            for (chunk, index, _, _), ids in zip(births, resolved):
+                if ids != DEFAULT_IDS:
+                    chunk.ids[index] = ids
+        
+        if game.mutation_rate > 0:
+            self._apply_mutations(new_chunks)
+        self.chunks = new_chunks
+    
+    def _apply_mutations(self, chunks):
+        """Apply the per-cell mutation rules to a freshly computed board"""
+        game = self.game
+        for key, chunk in list(chunks.items()):
+            alive = chunk.alive
+            live = []
+            index = alive.find(1)
+            while index != -1:
+                live.append(index)
+                index = alive.find(1, index + 1)
+            
+            chunk_x, chunk_y = key
+            size = self.CHUNK_SIZE
+            
+            def position(index):
+                local_x, local_y = divmod(index, size)
+                return chunk_x * size + local_x, chunk_y * size + local_y
+            
+            if game.seed is not None:
+                sites, mutating = game._seeded_mutations(len(live), len(alive), key)
+            else:
+                # Spontaneous births, sampled over the chunk like SparseEngine samples the board
+                sites = _bernoulli_sites(game.mutation_rate * 0.01, len(alive))
+                mutating = _bernoulli_sites(game.mutation_rate, len(live))
+            
+            for index in sites:
+                if not alive[index]:
+                    alive[index] = 1
+                    rng = game._random_stream(_MUTATION_STREAM, *position(index))
+                    chunk.ids[index] = game._spontaneous_ids(rng)
+            for index in mutating:
+                index = live[index]
+                ids = game._mutate_ids(chunk.ids.get(index, DEFAULT_IDS),
+                                       game._random_stream(_MUTATION_STREAM, *position(index)))
+                if ids is None:
+                    alive[index] = 0
+                    chunk.ids.pop(index, None)
+                else:
+                    chunk.ids[index] = ids
+            if alive.find(1) == -1:
+                del chunks[key]
+    
+    def run(self, generations):
+        """
+        Step several generations in a row
+        
+        Returns:
+            Number of cells born over those generations
+        """
+        births = 0
+        for _ in range(generations):
+            before = self.chunks
+            self.step()
+            for key, chunk in self.chunks.items():
+                old = before.get(key)
+                if old is None:
+                    births += chunk.alive.count(1)
+                else:
+                    born = (int.from_bytes(chunk.alive, "little")
+                            & ~int.from_bytes(old.alive, "little"))
+                    births += bin(born).count("1")
+        return births
+
+
+class _QuadNode:
+    """Hash-consed quadtree node; level 0 nodes are single cells"""
+    
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population")
+    
+    def __init__(self, nw, ne, sw, se, level, population):
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+
+@register_engine
+class HashLifeEngine(Engine):
+    """
+    Plain-Conway engine that jumps ahead with HashLife
+    
+    The board is a hash-consed quadtree whose identical subtrees are shared,
+    and the future center of every node is memoized, so regular patterns can
+    be advanced 2**j generations in time roughly proportional to j.
+    Cells outside the board are forced dead at every generation, which makes
+    the results match a bounded board exactly. Nodes straddling the edge are
+    memoized together with their position because of this.
+    """
+    
+    name = "hashlife"
+    plain_only = True
+    # Memoized results or interned nodes kept before the memo is dropped and
+    # the node table cut back to the live board
+    MAX_RESULTS = 1 << 16
+    
+    def __init__(self, game):
+        """
+        Create an empty board for a game
+        
+        Args:
+            game: GameOfLife instance providing the size
+        """
+        self.game = game
+        self._nodes = {}
+        self._results = {}
+        self._empty = [_QuadNode(None, None, None, None, 0, 0)]
+        self._alive_leaf = _QuadNode(None, None, None, None, 0, 1)
+        # The board occupies the top-left corner of a square root node
+        self.level = max(2, (max(game.width, game.height) - 1).bit_length())
+        self.clear()
+    
+    def clear(self):
+        """Reset every cell to dead"""
+        self.root = self._empty_node(self.level)
+    
+    def _node(self, nw, ne, sw, se):
+        """Return the canonical node with the given quadrants"""
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            population = nw.population + ne.population + sw.population + se.population
+            node = _QuadNode(nw, ne, sw, se, nw.level + 1, population)
+            self._nodes[key] = node
+        return node
+    
+    def _empty_node(self, level):
+        """Return the canonical empty node of a level"""
+        while len(self._empty) <= level:
+            empty = self._empty[-1]
+            self._empty.append(self._node(empty, empty, empty, empty))
+        return self._empty[level]
+    
+    def get(self, x, y):
+        """Get the state of an in-range cell"""
+        node = self.root
+        while node.level > 0:
+            if not node.population:
+                return False
+            half = 1 << (node.level - 1)
+            if x < half:
+                node = node.nw if y < half else node.ne
+            else:
+                node = node.sw if y < half else node.se
+            x, y = x % half, y % half
+        return node.population == 1
+    
+    def set(self, x, y, alive, cell_type):
+        """Set an in-range cell; cell_type only contributes its alive flag"""
+        if cell_type is not None:
+            alive = cell_type.alive
+        self.root = self._set(self.root, x, y, bool(alive))
+    
+    def _set(self, node, x, y, alive):
+        """Return a copy of node with one cell changed"""
+        if node.level == 0:
+            return self._alive_leaf if alive else self._empty[0]
+        half = 1 << (node.level - 1)
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        if x < half:
+            if y < half:
+                nw = self._set(nw, x, y, alive)
+            else:
+                ne = self._set(ne, x, y - half, alive)
+        elif y < half:
+            sw = self._set(sw, x - half, y, alive)
+        else:
+            se = self._set(se, x - half, y - half, alive)
+        return self._node(nw, ne, sw, se)
+    
+    def row(self, x):
+        """Return row x as a list of Cell objects"""
+        return [Cell(alive=self.get(x, y)) for y in range(self.game.width)]
+    
+    def live_cells(self):
+        """Yield (x, y, cell) for every live cell"""
+        stack = [(self.root, 0, 0)]
+        while stack:
+            node, x, y = stack.pop()
+            if not node.population:
+                continue
+            if node.level == 0:
+                yield x, y, Cell(alive=True)
+                continue
+            half = 1 << (node.level - 1)
+            stack.extend([(node.se, x + half, y + half), (node.sw, x + half, y),
+                          (node.ne, x, y + half), (node.nw, x, y)])
+    
+    def population(self):
+        """Count the live cells"""
+        return self.root.population
+    
+    def step(self):
+        """Replace the board with the next generation"""
+        self.advance(1)
+    
+    def advance(self, generations):
+        """
+        Advance the board by any number of generations
+        
+        The count is split into powers of two, each handled by one memoized
+        jump of the whole board. Once the memo or the node table holds more
+        than MAX_RESULTS entries, the memo is cleared and only the nodes the
+        board still uses are kept.
+        
+        Args:
+            generations: Number of generations to advance
+        """
+        if len(self._results) > self.MAX_RESULTS or len(self._nodes) > self.MAX_RESULTS:
+            self._collect()
+        j = 0
+        while generations:
+            if generations & 1:
+                self.root = self._jump(j)
+            generations >>= 1
+            j += 1
+    
+    def _collect(self):
+        """Drop the memo and every interned node the board and empty nodes do not reach"""
+        self._results.clear()
+        nodes = {}
+        stack = [self.root] + self._empty[1:]
+        while stack:
+            node = stack.pop()
+            key = (node.nw, node.ne, node.sw, node.se)
+            if node.level and key not in nodes:
+                nodes[key] = node
+                stack.extend(key)
+        self._nodes = nodes
+    
+    def _jump(self, j):
+        """Return the board node advanced 2**j generations"""
+        # Put the board at the top-left of the center quarter of a root node
+        # big enough for the jump, with everything around it dead
+        level = max(self.level + 1, j + 2)
+        board = self.root
+        while board.level < level - 1:
+            empty = self._empty_node(board.level)
+            board = self._node(board, empty, empty, empty)
+        empty = self._empty_node(level - 2)
+        root = self._node(
+            self._node(empty, empty, empty, board.nw),
+            self._node(empty, empty, board.ne, empty),
+            self._node(empty, board.sw, empty, empty),
+            self._node(board.se, empty, empty, empty),
+        )
+        offset = -(1 << (level - 2))
+        result = self._advance(root, j, offset, offset)
+        # The result has the same layout as the padded board
+        while result.level > self.level:
+            result = result.nw
+        return result
+    
+    def _centre(self, node):
+        """Return the center quarter of a node without advancing it"""
+        return self._node(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+    
+    def _advance(self, node, j, x, y):
+        """
+        Return the center of a node advanced 2**j generations
+        
+        Args:
+            node: Node of level k, with j <= k - 2
+            j: Log2 of the number of generations
+            x: Row of the node's top-left cell on the board
+            y: Column of the node's top-left cell on the board
+        """
+        if not node.population:
+            return self._empty_node(node.level - 1)
+        size = 1 << node.level
+        inside = x >= 0 and y >= 0 and x + size <= self.game.height and y + size <= self.game.width
+        key = (node, j) if inside else (node, j, x, y)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+        
+        if node.level == 2:
+            result = self._advance_block(node, x, y, inside)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            # Nine overlapping sub-nodes, one level down, in row-major order
+            subnodes = [
+                nw, self._node(nw.ne, ne.nw, nw.se, ne.sw), ne,
+                self._node(nw.sw, nw.se, sw.nw, sw.ne), self._centre(node),
+                self._node(ne.sw, ne.se, se.nw, se.ne),
+                sw, self._node(sw.ne, se.nw, sw.se, se.sw), se,
+            ]
+            quarter = size >> 2
+            full_jump = j == node.level - 2
+            parts = []
+            for index, subnode in enumerate(subnodes):
+                row, column = divmod(index, 3)
+                if full_jump:
+                    # First half of the jump
+                    parts.append(self._advance(subnode, j - 1,
+                                               x + row * quarter, y + column * quarter))
+                else:
+                    parts.append(self._centre(subnode))
+            
+            # Combine into four overlapping nodes and advance them the rest of the way
+            remaining = j - 1 if full_jump else j
+            offset = quarter >> 1
+            quadrants = []
+            for row, column in ((0, 0), (0, 1), (1, 0), (1, 1)):
+                top = row * 3 + column
+                combined = self._node(parts[top], parts[top + 1], parts[top + 3], parts[top + 4])
+                quadrants.append(self._advance(combined, remaining, x + row * quarter + offset,
+                                               y + column * quarter + offset))
+            result = self._node(*quadrants)
+        
+        self._results[key] = result
+        return result
+    
+    def _advance_block(self, node, x, y, inside):
+        """Advance the center 2x2 of a 4x4 node by one generation"""
+        cells = [[0] * 4 for _ in range(4)]
+        quadrants = ((0, 0, node.nw), (0, 2, node.ne), (2, 0, node.sw), (2, 2, node.se))
+        for row, column, quadrant in quadrants:
+            cells[row][column] = quadrant.nw.population
+            cells[row][column + 1] = quadrant.ne.population
+            cells[row + 1][column] = quadrant.sw.population
+            cells[row + 1][column + 1] = quadrant.se.population
+        
+        leaves = []
+        for row in (1, 2):
+            for column in (1, 2):
+                total = sum(cells[r][c] for r in (row - 1, row, row + 1)
+                            for c in (column - 1, column, column + 1))
+                neighbors = total - cells[row][column]
+                alive = neighbors == 3 or (neighbors == 2 and cells[row][column])
+                if alive and not inside:
+                    # Cells outside the board never come to life
+                    alive = 0 <= x + row < self.game.height and 0 <= y + column < self.game.width
+                leaves.append(self._alive_leaf if alive else self._empty[0])
+        return self._node(*leaves)
 
 
 class GameOfLife:
     """Conway's Game of Life simulator"""
     
-    def __init__(self, width=40, height=20, mutation_rate=0.0):
+    # Thresholds backend="auto" uses to pick an engine
+    AUTO_NUMPY_AREA = 2500
+    AUTO_SPARSE_AREA = 10000
+    AUTO_SPARSE_DENSITY = 0.02
+    # A sparse auto board only goes back to a dense engine above this density
+    AUTO_DENSE_DENSITY = 0.05
+    # Unused names are pruned once the name palette holds this many, and
+    # run checks at least this many generations apart
+    PRUNE_NAMES = 1024
+    PRUNE_INTERVAL = 64
+    
+    def __init__(self, width=40, height=20, mutation_rate=0.0, backend="python", processes=None,
+                 workers=None, boundary="bounded", name_depth=None, seed=None):
         """
         Initialize the Game of Life grid
         
@@ -52,13 +2865,191 @@ class GameOfLife:
             width: Width of the grid
             height: Height of the grid
             mutation_rate: Probability of random mutation (0.0 to 1.0)
+            backend: Stepping engine: "python" (default), "numpy", "bitpacked",
+                "sparse", "hashlife", or "auto" to let the game pick one
+                from the board; engine_reason records why
+            processes: Number of worker processes stepping bands of the board
+                in parallel (requires the "numpy" backend)
+            workers: Number of threads stepping bands of the board in
+                parallel (requires the "numpy" backend)
+            boundary: "bounded" (default) treats cells past the edges as
+                dead; "torus" wraps each edge around to the opposite one;
+                "unbounded" lets patterns grow past them forever, with
+                width and height only framing the displayed region
+            name_depth: Number of hybrid levels spelled out in the names
+                genotypes.counts() reports, or None (default) for all
+            seed: Optional integer that makes every random decision a pure
+                function of the seed, the generation and the cell's
+                coordinates, so runs repeat exactly on every engine; None
+                (default) draws from the random module
         """
         self.width = width
         self.height = height
-        self.grid = [[Cell() for _ in range(width)] for _ in range(height)]
         self.generation = 0
         self.mutation_rate = mutation_rate
         self.cell_types = []  # Store custom cell types
+        self.name_depth = name_depth
+        if seed is not None and not isinstance(seed, int):
+            raise ValueError(f"seed must be an integer or None, not {seed!r}")
+        self.seed = seed
+        
+        # Shared tables mapping the small ids stored on the board to values
+        self.name_palette = NamePalette()
+        self.color_palette = Palette("white")
+        self.symbol_palette = Palette("█")
+        # Which genotypes can breed, over ids that _compatibility_id hands out
+        self.compatibility = CompatibilityMatrix()
+        self._compatibility_ids = {}
+        self.genotypes = GenotypeRegistry(self)
+        self._prune_names_at = self.PRUNE_NAMES
+        
+        if backend != "auto" and backend not in ENGINES:
+            raise ValueError(f"Unknown backend {backend!r}, "
+                             f"expected 'auto' or one of {sorted(ENGINES)}")
+        self.backend = backend
+        self.processes = processes
+        self.workers = workers
+        boundaries = ("bounded", "torus", "unbounded")
+        if boundary not in boundaries:
+            raise ValueError(f"Unknown boundary {boundary!r}, expected one of {list(boundaries)}")
+        self.boundary = boundary
+        
+        if boundary == "unbounded":
+            parallel = processes is not None or workers is not None
+            if backend not in ("auto", "python", "chunked") or parallel:
+                raise ValueError("unbounded boards always use the chunked engine")
+            name, reason = "chunked", "unbounded boards always grow in chunks"
+        elif backend == "auto":
+            name, reason = self._choose_backend()
+        else:
+            name, reason = backend, "requested"
+        engine_class = ENGINES[name]
+        if boundary not in engine_class.boundaries:
+            raise ValueError(f"The {name!r} engine does not support boundary {boundary!r}")
+        # Plain-only engines hand the board to a full engine once custom cells or mutations appear
+        self._engine_class = self._full_engine_for(engine_class)
+        
+        if boundary == "torus" and (processes is not None or workers is not None):
+            raise ValueError("processes and workers need a bounded board")
+        if processes is not None and workers is not None:
+            raise ValueError("processes and workers cannot be combined")
+        if processes is not None and processes > 1:
+            if backend != "numpy":
+                raise ValueError("processes requires the 'numpy' backend")
+            engine_class = self._engine_class = ProcessBandEngine
+        if workers is not None and workers > 1:
+            if backend != "numpy":
+                raise ValueError("workers requires the 'numpy' backend")
+            engine_class = self._engine_class = ThreadBandEngine
+        
+        # "auto" looks again at the first step, once the board is filled in,
+        # and big boards keep moving between dense and sparse engines after it
+        self._auto_pending = backend == "auto" and boundary != "unbounded"
+        self._adaptive = self._auto_pending and width * height >= self.AUTO_SPARSE_AREA
+        self.layout_switches = 0
+        self.conversion_time = 0.0
+        # Palette ids every live cell shares, or None for a mixed population;
+        # stale once set_cell or a mutation may have changed it
+        self._genotype = DEFAULT_IDS
+        self._genotype_stale = False
+        self.engine_reason = reason
+        self.engine = engine_class(self)
+    
+    def _choose_backend(self, full=False):
+        """
+        Pick an engine for backend="auto" from the board as it is now
+        
+        Args:
+            full: Only consider engines that handle custom cells and mutations
+            
+        Returns:
+            Tuple of (engine name, reason for the choice)
+        """
+        area = self.width * self.height
+        engine = getattr(self, "engine", None)
+        population = engine.population() if engine is not None else 0
+        density = population / area if area else 0.0
+        custom = bool(self.cell_types) or (engine is not None and not self._is_plain())
+        
+        # Even plain boards go sparse when nearly empty, since every other engine costs O(area)
+        if area >= self.AUTO_SPARSE_AREA and density < self.AUTO_SPARSE_DENSITY:
+            return "sparse", (f"{area} cells at {density:.1%} density, "
+                              f"below {self.AUTO_SPARSE_DENSITY:.0%}")
+        if not full and not custom and self.mutation_rate == 0 and self.boundary == "bounded":
+            return "bitpacked", "plain Conway with no custom cell types or mutations"
+        if np is not None and area >= self.AUTO_NUMPY_AREA:
+            return "numpy", f"{area} cells at {density:.1%} density with NumPy available"
+        if np is None:
+            return "python", "NumPy is not installed"
+        return "python", f"{area} cells is too small to gain from NumPy"
+    
+    def _full_engine_for(self, engine_class):
+        """The engine class to hand the board to once custom cells or mutations appear"""
+        if engine_class.plain_only:
+            return ENGINES[self._choose_backend(full=True)[0]]
+        return engine_class
+    
+    def _auto_select(self):
+        """Settle the automatic backend choice once the board has been filled in"""
+        self._auto_pending = False
+        name, reason = self._choose_backend()
+        engine_class = ENGINES[name]
+        self._engine_class = self._full_engine_for(engine_class)
+        self._use_engine(engine_class, reason)
+    
+    def _adapt_layout(self):
+        """
+        Move an auto board between dense and sparse engines as its density changes
+        
+        The thresholds for leaving and returning to the sparse engine differ,
+        so a density hovering around either one does not cause thrashing.
+        Every switch is counted in layout_switches and timed in
+        conversion_time.
+        """
+        density = self.engine.population() / (self.width * self.height)
+        if isinstance(self.engine, SparseEngine):
+            if density <= self.AUTO_DENSE_DENSITY:
+                return
+            # The bit-packed engine for plain boards, a full dense engine otherwise
+            engine_class = ENGINES[self._choose_backend()[0]]
+            reason = f"density rose to {density:.1%}, above {self.AUTO_DENSE_DENSITY:.0%}"
+        else:
+            if density >= self.AUTO_SPARSE_DENSITY:
+                return
+            engine_class = SparseEngine
+            reason = f"density fell to {density:.1%}, below {self.AUTO_SPARSE_DENSITY:.0%}"
+        
+        start = time.perf_counter()
+        self._engine_class = self._full_engine_for(engine_class)
+        self._use_engine(engine_class, reason)
+        self.conversion_time += time.perf_counter() - start
+        self.layout_switches += 1
+    
+    def _use_engine(self, engine_class, reason=None):
+        """Move the live cells onto a new engine of the given class"""
+        if reason is not None:
+            self.engine_reason = reason
+        if isinstance(self.engine, engine_class):
+            return
+        engine = engine_class(self)
+        for x, y, cell in self.engine.live_cells():
+            engine.set(x, y, True, cell)
+        self.close()
+        self.engine = engine
+    
+    def close(self):
+        """Release the engine's worker processes or threads, if it has any"""
+        self.engine.close()
+    
+    def _use_full_engine(self):
+        """Leave a plain-Conway engine for the backend that handles every rule"""
+        if self.engine.plain_only:
+            self._use_engine(self._engine_class, "custom cells or mutations need a full engine")
+    
+    @property
+    def grid(self):
+        """The board as rows of Cell objects (use set_cell to change it)"""
+        return GridView(self.engine, self.height)
     
     def set_cell(self, x, y, alive=True, cell_type=None):
         """
@@ -70,102 +3061,349 @@ class GameOfLife:
             alive: Whether the cell should be alive
             cell_type: Optional Cell object with custom properties
         """
-        if 0 <= x < self.height and 0 <= y < self.width:
-            if cell_type is not None:
-                self.grid[x][y] = cell_type.copy()
-            else:
-                self.grid[x][y].alive = alive
+        if self._in_bounds(x, y):
+            custom = cell_type is not None and (
+                (cell_type.lineage, cell_type.color, cell_type.symbol) != PLAIN_GENOTYPE)
+            if custom:
+                self._use_full_engine()
+            self.engine.set(x, y, alive, cell_type)
+            self._genotype_stale = True
     
     def get_cell(self, x, y):
         """Get the state of a cell"""
-        if 0 <= x < self.height and 0 <= y < self.width:
-            return self.grid[x][y].alive
+        if self._in_bounds(x, y):
+            return self.engine.get(x, y)
         return False
     
+    def _in_bounds(self, x, y):
+        """Whether a position is on the board"""
+        return self.boundary == "unbounded" or (0 <= x < self.height and 0 <= y < self.width)
+    
+    def _neighbor_positions(self, x, y):
+        """List the on-board positions around a cell, wrapping around on a torus"""
+        if self.boundary == "torus":
+            rows = ((x - 1) % self.height, x, (x + 1) % self.height)
+            columns = ((y - 1) % self.width, y, (y + 1) % self.width)
+            return [(nx, ny) for i, nx in enumerate(rows) for j, ny in enumerate(columns)
+                    if i != 1 or j != 1]
+        return [(x + dx, y + dy) for dx, dy in NEIGHBOR_OFFSETS
+                if 0 <= x + dx < self.height and 0 <= y + dy < self.width]
+    
+    def _encode(self, cell):
+        """Return the (name, color, symbol) palette ids for a cell's properties"""
+        return (self.name_palette.intern(cell.lineage),
+                self.color_palette.intern(cell.color),
+                self.symbol_palette.intern(cell.symbol))
+    
+    def _decode(self, alive, name_id, color_id, symbol_id):
+        """Build a Cell object from an alive flag and palette ids"""
+        return Cell(bool(alive), self.name_palette[name_id],
+                    self.color_palette[color_id], self.symbol_palette[symbol_id])
+    
     def count_neighbors(self, x, y):
         """Count the number of alive neighbors for a cell"""
-        count = 0
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < self.height and 0 <= ny < self.width:
-                    if self.grid[nx][ny].alive:
-                        count += 1
-        return count
+        return self.engine.count_neighbors(x, y)
     
     def next_generation(self):
         """Compute the next generation based on Game of Life rules"""
-        new_grid = [[Cell() for _ in range(self.width)] for _ in range(self.height)]
+        if self._auto_pending:
+            self._auto_select()
+        if self.mutation_rate > 0:
+            self._use_full_engine()
+        self.engine.step()
+        self.generation += 1
+        if self._adaptive:
+            self._adapt_layout()
+        self._prune_names()
+    
+    def population(self):
+        """Count the live cells"""
+        return self.engine.population()
+    
+    def run(self, generations, *, until=None, callback=None, callback_every=None):
+        """
+        Step many generations in one call and summarize them
         
-        for x in range(self.height):
-            for y in range(self.width):
-                neighbors = self.count_neighbors(x, y)
-                alive = self.grid[x][y].alive
-                
-                # Apply Game of Life rules
-                if alive:
-                    # Live cell with 2 or 3 neighbors survives
-                    if neighbors == 2 or neighbors == 3:
-                        new_grid[x][y] = self.grid[x][y].copy()
-                else:
-                    # Dead cell with exactly 3 neighbors becomes alive
-                    if neighbors == 3:
-                        # Create offspring from two compatible parent cells
-                        alive_neighbors = self._get_alive_neighbors(x, y)
-                        parent1, parent2 = self._select_parents(alive_neighbors)
-                        if parent1:
-                            new_grid[x][y] = self._create_offspring(parent1, parent2)
-                        else:
-                            # Fallback if no parents available
-                            new_grid[x][y].alive = True
-                
-                # Apply mutations
-                if self.mutation_rate > 0 and random.random() < self.mutation_rate:
-                    if new_grid[x][y].alive:
-                        # Mutate living cell - mostly change properties, rarely kill it
-                        if random.random() < 0.03:  # Only 3% chance to die from mutation
-                            new_grid[x][y].alive = False
-                        else:
-                            self._mutate_cell(new_grid[x][y])
-                    else:
-                        # Very rarely birth a cell through mutation
-                        if random.random() < 0.01:  # Only 1% chance to spontaneously birth
-                            new_grid[x][y].alive = True
-                            self._mutate_cell(new_grid[x][y])
+        The engine steps the generations between checks back to back, so
+        the run only returns to this loop when until or callback needs to
+        see the board.
         
-        self.grid = new_grid
-        self.generation += 1
+        Args:
+            generations: Maximum number of generations to step
+            until: Optional function taking the game, called after every
+                generation; the run stops early once it returns True
+            callback: Optional function taking the game
+            callback_every: Number of generations between callback calls
+                (default: every generation)
+            
+        Returns:
+            RunStats for the generations stepped
+        """
+        if generations < 0:
+            raise ValueError("generations must not be negative")
+        start = time.perf_counter()
+        if self._auto_pending:
+            self._auto_select()
+        hashlife_reason = None
+        if self.mutation_rate > 0:
+            self._use_full_engine()
+        elif isinstance(self.engine, HashLifeEngine):
+            # HashLife cannot count births cheaply, so its plain board moves
+            # to the bit-packed engine for the run and back afterwards
+            hashlife_reason = self.engine_reason
+            self._use_engine(BitPackedEngine,
+                             "run counts births, which HashLife cannot do cheaply")
+        
+        every = callback_every or 1
+        if until is not None or self._adaptive:
+            interval = 1
+        elif callback is not None:
+            interval = every
+        else:
+            interval = max(generations, 1)
+        if len(self.name_palette) > 1:
+            # Leave room to prune hybrid names during long runs
+            interval = min(interval, self.PRUNE_INTERVAL)
+        if self.seed is not None and (self.mutation_rate > 0 or not self._is_plain()):
+            # Seeded draws are keyed by self.generation, which only moves between batches
+            interval = 1
+        
+        population = self.engine.population()
+        switches, conversion_time = self.layout_switches, self.conversion_time
+        births = done = 0
+        while done < generations:
+            batch = min(interval, generations - done)
+            if callback is not None:
+                batch = min(batch, every - done % every)
+            births += self.engine.run(batch)
+            done += batch
+            self.generation += batch
+            if self._adaptive:
+                self._adapt_layout()
+            self._prune_names()
+            if callback is not None and done % every == 0:
+                callback(self)
+            if until is not None and until(self):
+                break
+        
+        final_population = self.engine.population()
+        deaths = population + births - final_population
+        if hashlife_reason is not None and isinstance(self.engine, BitPackedEngine):
+            self._use_engine(HashLifeEngine, hashlife_reason)
+        return RunStats(done, final_population, births, deaths, time.perf_counter() - start,
+                        self.layout_switches - switches, self.conversion_time - conversion_time)
+    
+    def advance(self, generations):
+        """
+        Jump ahead a number of generations
+        
+        Plain-Conway boards are handed to the HashLife engine for the jump,
+        which skips ahead in roughly logarithmic time on regular patterns,
+        and then go back to the engine they were on. Games stepping bands
+        in parallel advance temporally blocked instead, several generations
+        per synchronization. Torus and unbounded boards
+        and boards with custom cells or mutations fall back to stepping one
+        generation at a time.
+        
+        Args:
+            generations: Number of generations to advance
+        """
+        if generations < 0:
+            raise ValueError("generations must not be negative")
+        if self._auto_pending:
+            self._auto_select()
+        if self.mutation_rate > 0 or self.boundary != "bounded" or not self._is_plain():
+            for _ in range(generations):
+                self.next_generation()
+            return
+        if issubclass(self._engine_class, (ProcessBandEngine, ThreadBandEngine)):
+            self._use_full_engine()
+            self.engine.advance(generations)
+        else:
+            # HashLife only pays off for the jump, so the board goes back to
+            # its engine afterwards, memo and all left behind
+            engine_class, reason = type(self.engine), self.engine_reason
+            self._use_engine(HashLifeEngine,
+                             "advance jumps plain Conway boards ahead with HashLife")
+            self.engine.advance(generations)
+            self._use_engine(engine_class, reason)
+        self.generation += generations
+    
+    def _is_plain(self):
+        """Whether every live cell is a default cell"""
+        return self.engine.plain_only or self.engine.is_plain()
     
     def _get_random_neighbor_cell(self, x, y):
         """Get a random alive neighbor cell"""
-        neighbors = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < self.height and 0 <= ny < self.width:
-                    if self.grid[nx][ny].alive:
-                        neighbors.append(self.grid[nx][ny])
-        
+        neighbors = self._get_alive_neighbors(x, y)
         if neighbors:
             return random.choice(neighbors)
         return Cell(alive=True)
     
+    def _prune_names(self):
+        """Drop unused genotypes and names once the name palette has grown large"""
+        if len(self.name_palette) >= self._prune_names_at:
+            self.genotypes.prune()
+            self._prune_names_at = max(self.PRUNE_NAMES, 2 * len(self.name_palette))
+    
+    def _shared_genotype(self):
+        """
+        Palette ids of the one genotype shared by the whole population, if any
+        
+        Two parents of the same unnamed genotype can only have a child of
+        that genotype, so while every live cell shares one, engines give it
+        to every newborn and skip the offspring rules. Named genotypes breed
+        hybrid names and mutations add variety, so neither qualifies. The
+        population is only rescanned after set_cell or mutations changed it.
+        
+        Returns:
+            (name, color, symbol) palette ids, or None when births need the
+            full offspring rules
+        """
+        if self.mutation_rate > 0:
+            self._genotype_stale = True
+            return None
+        if self._genotype_stale:
+            self._genotype_stale = False
+            genotypes = list(self.engine.genotype_counts())
+            if not genotypes:
+                self._genotype = DEFAULT_IDS
+            elif len(genotypes) == 1 and not self.name_palette[genotypes[0][0]]:
+                self._genotype = genotypes[0]
+            else:
+                self._genotype = None
+        return self._genotype
+    
     def _get_alive_neighbors(self, x, y):
         """Get list of all alive neighbor cells"""
-        neighbors = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < self.height and 0 <= ny < self.width:
-                    if self.grid[nx][ny].alive:
-                        neighbors.append(self.grid[nx][ny])
-        return neighbors
+        return self.engine.alive_neighbors(x, y)
+    
+    def _resolve_births(self, neighborhoods, positions):
+        """
+        Resolve the offspring of a generation's births in one batch
+        
+        Parents are selected and properties inherited as _select_parents
+        and _create_offspring do, but on palette id tuples instead of Cell
+        objects: ids are equal exactly when their values are, so only name
+        compatibility needs the palette. Hybrid names are joined as lineage
+        nodes by the ids of the parent names, never as strings.
+        
+        Args:
+            neighborhoods: For every birth, the (name, color, symbol) palette
+                id tuples of its live neighbors, in NEIGHBOR_OFFSETS order
+            positions: The (x, y) position of every birth
+                
+        Returns:
+            List with the palette ids of each newborn cell
+        """
+        default = DEFAULT_IDS
+        join = self.name_palette.join
+        rows = self.compatibility.rows
+        compatibility_id = self._compatibility_id
+        offspring = []
+        for neighbors, (x, y) in zip(neighborhoods, positions):
+            if len(neighbors) < 2 or all(ids == default for ids in neighbors):
+                # A lone parent passes everything on, and default parents
+                # always have a default child
+                offspring.append(neighbors[0] if neighbors else default)
+                continue
+            
+            # Try to find compatible parents, one matrix lookup per pair
+            rng = self._random_stream(_OFFSPRING_STREAM, x, y)
+            neighbors = list(neighbors)
+            rng.shuffle(neighbors)
+            classes = [compatibility_id(ids) for ids in neighbors]
+            count = len(neighbors)
+            first, second = next(((i, j) for i in range(count) for j in range(i + 1, count)
+                                  if rows[classes[i]] >> classes[j] & 1), (0, 1))
+            name1, color1, symbol1 = neighbors[first]
+            name2, color2, symbol2 = neighbors[second]
+            
+            # The empty name is always id 0
+            symbol = rng.choice([symbol1, symbol2])
+            color = rng.choice([color1, color2])
+            if name1 and name2:
+                # Create hybrid name
+                name = join(name1, name2) if rng.random() < 0.5 else join(name2, name1)
+            else:
+                name = name1 or name2
+            offspring.append((name, color, symbol))
+        return offspring
+    
+    def _random_stream(self, stream, x, y):
+        """
+        Source of one cell's random draws in the generation being stepped
+        
+        Args:
+            stream: Kind of decision, one of the _*_STREAM constants
+            x, y: Position of the cell, or of the chunk for spontaneous
+                births on unbounded boards
+            
+        Returns:
+            The cell's CounterRandom when the game is seeded, else the
+            random module
+        """
+        if self.seed is None:
+            return random
+        return CounterRandom(self.seed, self.generation, stream, x, y)
+    
+    def _mutate_ids(self, ids, rng):
+        """
+        Apply the mutation rule to a live cell picked to mutate
+        
+        Args:
+            ids: The cell's (name, color, symbol) palette ids
+            rng: Source of the draws
+            
+        Returns:
+            The cell's new palette ids, or None if the mutation kills it
+        """
+        # Mutate living cell - mostly change properties, rarely kill it
+        if rng.random() < 0.03:
+            return None
+        cell = self._decode(1, *ids)
+        self._mutate_cell(cell, rng)
+        return self._encode(cell)
+    
+    def _spontaneous_ids(self, rng):
+        """Return the palette ids of a cell born through mutation"""
+        cell = Cell(alive=True)
+        self._mutate_cell(cell, rng)
+        return self._encode(cell)
+    
+    def _seeded_mutations(self, live, size, key=(0, 0)):
+        """
+        Pick a seeded generation's mutations
+        
+        Both kinds of mutation are sampled by geometric gaps, as
+        _bernoulli_sites does, from streams per board (or per chunk): live
+        cells, taken in row-major order, mutate at the mutation rate, and
+        dead cells are born through mutation at rate * 1%. Only the picked
+        cells then draw from their own mutation streams.
+        
+        Args:
+            live: Number of live cells
+            size: Number of cells the spontaneous births are sampled over
+            key: Position naming the board's (or chunk's) streams
+            
+        Returns:
+            Tuple of (indices into size drawn for spontaneous births,
+            row-major indices of the live cells that mutate)
+        """
+        rate = self.mutation_rate
+        spontaneous = self._random_stream(_SPONTANEOUS_STREAM, *key)
+        sites = list(_bernoulli_sites(rate * 0.01, size, spontaneous))
+        mutating = list(_bernoulli_sites(rate, live, self._random_stream(_MUTATING_STREAM, *key)))
+        return sites, mutating
+    
+    def _compatibility_id(self, ids):
+        """Return the compatibility matrix id for a cell's palette ids, adding it if new"""
+        compatibility_id = self._compatibility_ids.get(ids)
+        if compatibility_id is None:
+            name_id, color_id, symbol_id = ids
+            compatibility_id = self.compatibility.intern((name_id != 0, color_id, symbol_id))
+            self._compatibility_ids[ids] = compatibility_id
+        return compatibility_id
     
     def _are_compatible(self, cell1, cell2):
         """
@@ -176,7 +3414,7 @@ class GameOfLife:
         - OR both have custom names (indicating they are custom cell types)
         """
         # If both have custom names, they're compatible
-        if cell1.name and cell2.name:
+        if cell1.lineage and cell2.lineage:
             return True
         
         # If they differ in appearance, they're compatible
@@ -185,12 +3423,13 @@ class GameOfLife:
         
         return False
     
-    def _select_parents(self, neighbors):
+    def _select_parents(self, neighbors, rng=random):
         """
         Select 2 compatible parent cells from the list of neighbors
         
         Args:
             neighbors: List of alive neighbor cells
+            rng: Source of the draws, the random module or a CounterRandom
             
         Returns:
             Tuple of (parent1, parent2) or (parent, None) if only one parent available
@@ -199,7 +3438,7 @@ class GameOfLife:
             return (neighbors[0] if neighbors else None, None)
         
         # Try to find compatible parents
-        random.shuffle(neighbors)
+        rng.shuffle(neighbors)
         for i in range(len(neighbors)):
             for j in range(i + 1, len(neighbors)):
                 if self._are_compatible(neighbors[i], neighbors[j]):
@@ -208,7 +3447,7 @@ class GameOfLife:
         # If no compatible pair found, use first two neighbors
         return (neighbors[0], neighbors[1])
     
-    def _create_offspring(self, parent1, parent2):
+    def _create_offspring(self, parent1, parent2, rng=random):
         """
         Create offspring cell from two parent cells
         
@@ -220,6 +3459,7 @@ class GameOfLife:
         Args:
             parent1: First parent cell
             parent2: Second parent cell (can be None)
+            rng: Source of the draws, the random module or a CounterRandom
             
         Returns:
             New Cell with blended properties
@@ -230,35 +3470,32 @@ class GameOfLife:
             # Single parent - just inherit properties
             offspring.symbol = parent1.symbol
             offspring.color = parent1.color
-            offspring.name = parent1.name
+            offspring.name = parent1.lineage
         else:
             # Two parents - blend properties
-            offspring.symbol = random.choice([parent1.symbol, parent2.symbol])
-            offspring.color = random.choice([parent1.color, parent2.color])
+            offspring.symbol = rng.choice([parent1.symbol, parent2.symbol])
+            offspring.color = rng.choice([parent1.color, parent2.color])
             
             # Blend names if both parents have names
-            if parent1.name and parent2.name:
+            if parent1.lineage and parent2.lineage:
                 # Create hybrid name
-                if random.random() < 0.5:
-                    offspring.name = f"{parent1.name}-{parent2.name}"
+                if rng.random() < 0.5:
+                    offspring.name = HybridName(parent1.lineage, parent2.lineage)
                 else:
-                    offspring.name = f"{parent2.name}-{parent1.name}"
-            elif parent1.name:
-                offspring.name = parent1.name
-            elif parent2.name:
-                offspring.name = parent2.name
+                    offspring.name = HybridName(parent2.lineage, parent1.lineage)
+            elif parent1.lineage:
+                offspring.name = parent1.lineage
+            elif parent2.lineage:
+                offspring.name = parent2.lineage
         
         return offspring
     
-    def _mutate_cell(self, cell):
-        """Apply random mutation to a cell's properties"""
-        colors = ["white", "red", "green", "blue", "yellow", "magenta", "cyan"]
-        symbols = ["█", "●", "■", "◆", "★", "♦", "▲"]
-        
-        if random.random() < 0.5:
-            cell.color = random.choice(colors)
-        if random.random() < 0.3:
-            cell.symbol = random.choice(symbols)
+    def _mutate_cell(self, cell, rng=random):
+        """Apply random mutation to a cell's properties, drawing from rng"""
+        if rng.random() < 0.5:
+            cell.color = rng.choice(MUTATION_COLORS)
+        if rng.random() < 0.3:
+            cell.symbol = rng.choice(MUTATION_SYMBOLS)
     
     def add_cell_type(self, name, color="white", symbol="█"):
         """
@@ -271,39 +3508,30 @@ class GameOfLife:
         """
         cell_type = Cell(alive=True, name=name, color=color, symbol=symbol)
         self.cell_types.append(cell_type)
+        self._compatibility_id(self._encode(cell_type))
         return cell_type
     
     def clear_grid(self):
         """Clear all cells"""
-        self.grid = [[Cell() for _ in range(self.width)] for _ in range(self.height)]
+        self.engine.clear()
         self.generation = 0
+        self._genotype = DEFAULT_IDS
+        self._genotype_stale = False
     
     def load_pattern(self, pattern_name):
         """Load a predefined pattern"""
         self.clear_grid()
         
-        patterns = {
-            'glider': [(1, 2), (2, 3), (3, 1), (3, 2), (3, 3)],
-            'blinker': [(1, 1), (1, 2), (1, 3)],
-            'toad': [(2, 2), (2, 3), (2, 4), (3, 1), (3, 2), (3, 3)],
-            'beacon': [(1, 1), (1, 2), (2, 1), (3, 4), (4, 3), (4, 4)],
-            'pulsar': [
-                (2, 4), (2, 5), (2, 6), (2, 10), (2, 11), (2, 12),
-                (4, 2), (4, 7), (4, 9), (4, 14),
-                (5, 2), (5, 7), (5, 9), (5, 14),
-                (6, 2), (6, 7), (6, 9), (6, 14),
-                (7, 4), (7, 5), (7, 6), (7, 10), (7, 11), (7, 12),
-                (9, 4), (9, 5), (9, 6), (9, 10), (9, 11), (9, 12),
-                (10, 2), (10, 7), (10, 9), (10, 14),
-                (11, 2), (11, 7), (11, 9), (11, 14),
-                (12, 2), (12, 7), (12, 9), (12, 14),
-                (14, 4), (14, 5), (14, 6), (14, 10), (14, 11), (14, 12)
-            ]
-        }
-        
-        if pattern_name in patterns:
-            for x, y in patterns[pattern_name]:
+        if pattern_name in PATTERNS:
+            for x, y in PATTERNS[pattern_name]:
                 self.set_cell(x, y, True)
+            # Predefined patterns are plain Conway until something adds
+            # variety; an engine the caller asked for keeps the board
+            if self.backend == "auto" and self.boundary != "unbounded":
+                self._auto_select()
+            elif (self.backend == "python" and self.mutation_rate == 0
+                  and self.boundary == "bounded"):
+                self._use_engine(BitPackedEngine, "load_pattern placed a plain Conway pattern")
             return True
         return False
     
@@ -352,6 +3580,13 @@ def main():
     except ValueError:
         mutation_rate = 0.0
     
+    # Get how far to jump between frames
+    steps_input = input("Generations per frame (default 1): ").strip()
+    try:
+        steps = max(1, int(steps_input)) if steps_input else 1
+    except ValueError:
+        steps = 1
+    
     patterns = {
         '1': 'glider',
         '2': 'blinker',
@@ -412,7 +3647,10 @@ def main():
         while True:
             game.display()
             time.sleep(0.2)
-            game.next_generation()
+            if steps == 1:
+                game.next_generation()
+            else:
+                game.advance(steps)
     except KeyboardInterrupt:
         print("\n\nSimulation ended.")
         print(f"Total generations: {game.generation}")
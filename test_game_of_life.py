@@ -2,8 +2,27 @@
 Unit tests for Conway's Game of Life implementation
 """
 
+import random
+import tracemalloc
 import unittest
-from game_of_life import GameOfLife, Cell
+from unittest import mock
+import game_of_life
+from game_of_life import (GameOfLife, Cell, CompatibilityMatrix, CounterRandom, Genotype,
+                          HybridName, Palette, PATTERNS, RunStats, ENGINES, Engine,
+                          register_engine, BitPackedEngine, ChunkedEngine, HashLifeEngine,
+                          NumpyEngine, ProcessBandEngine, PythonEngine, SparseEngine,
+                          ThreadBandEngine, _band_bounds, _counter_randoms, _custom_step_kernel,
+                          _bernoulli_sites, _block_table, _rule_table)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 
 class TestCell(unittest.TestCase):
@@ -48,6 +67,52 @@ class TestCell(unittest.TestCase):
         cell2.name = "Copy"
         self.assertTrue(cell1.alive)
         self.assertEqual(cell1.name, "Original")
+    
+    def test_cell_has_no_instance_dict(self):
+        """Test cells use slots instead of a per-instance __dict__"""
+        self.assertFalse(hasattr(Cell(), "__dict__"))
+
+
+class TestBoardStorage(unittest.TestCase):
+    """Test cases for the structure-of-arrays board storage"""
+    
+    def test_palette_interns_values(self):
+        """Test that a palette hands out one id per distinct value"""
+        palette = Palette("white")
+        self.assertEqual(palette.intern("white"), 0)
+        red = palette.intern("red")
+        self.assertEqual(palette.intern("red"), red)
+        self.assertEqual(palette[red], "red")
+        self.assertEqual(len(palette), 2)
+    
+    def test_board_is_stored_as_compact_arrays(self):
+        """Test that the board is flat arrays of flags and palette ids"""
+        game = GameOfLife(width=8, height=4)
+        fire = game.add_cell_type("Fire", "red", "●")
+        game.set_cell(1, 1, alive=True, cell_type=fire)
+        game.set_cell(2, 5, alive=True, cell_type=fire)
+        
+        engine = game.engine
+        self.assertIsInstance(engine.alive, bytearray)
+        self.assertEqual(len(engine.alive), 32)
+        self.assertEqual(engine.color_ids[1 * 8 + 1], engine.color_ids[2 * 8 + 5])
+        # Default, plus the one color shared by both cells
+        self.assertEqual(len(game.color_palette), 2)
+    
+    def test_grid_view(self):
+        """Test the grid view's rows, indexing and snapshot semantics"""
+        game = GameOfLife(width=6, height=3)
+        game.set_cell(2, 4, True)
+        
+        self.assertEqual(len(game.grid), 3)
+        self.assertEqual(len(game.grid[0]), 6)
+        self.assertTrue(game.grid[-1][4].alive)
+        with self.assertRaises(IndexError):
+            game.grid[3]
+        
+        # Cells are snapshots; the board only changes through set_cell
+        game.grid[0][0].alive = True
+        self.assertFalse(game.get_cell(0, 0))
 
 
 class TestGameOfLife(unittest.TestCase):
@@ -505,5 +570,1702 @@ class TestGameOfLife(unittest.TestCase):
         self.assertGreater(alive_count, 0)
 
 
+def random_soup(game, density=0.3, seed=0):
+    """Fill a game with a reproducible random pattern of default cells"""
+    rng = random.Random(seed)
+    for x in range(game.height):
+        for y in range(game.width):
+            if rng.random() < density:
+                game.set_cell(x, y, True)
+    return game
+
+
+def seed_random(test, seed):
+    """Seed the random module for the rest of a test, restoring its state afterwards"""
+    test.addCleanup(random.setstate, random.getstate())
+    random.seed(seed)
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestNumpyBackend(unittest.TestCase):
+    """Test cases for the NumPy stepping backend"""
+    
+    def assert_same_evolution(self, python_game, numpy_game, generations):
+        """Step two games side by side and compare every generation"""
+        for _ in range(generations):
+            self.assertEqual(str(python_game), str(numpy_game))
+            python_game.next_generation()
+            numpy_game.next_generation()
+        self.assertEqual(str(python_game), str(numpy_game))
+    
+    def test_unknown_backend(self):
+        """Test that an unknown backend name is rejected"""
+        with self.assertRaises(ValueError):
+            GameOfLife(width=10, height=10, backend="fortran")
+    
+    def test_patterns_match_python_backend(self):
+        """Test that classic patterns evolve identically on both backends"""
+        for pattern in ['glider', 'blinker', 'toad', 'beacon', 'pulsar']:
+            python_game = GameOfLife(width=20, height=20)
+            numpy_game = GameOfLife(width=20, height=20, backend="numpy")
+            # Place the cells directly so load_pattern's plain-Conway engine stays out of the way
+            for x, y in PATTERNS[pattern]:
+                python_game.set_cell(x, y, True)
+                numpy_game.set_cell(x, y, True)
+            self.assert_same_evolution(python_game, numpy_game, 30)
+    
+    def test_random_soup_matches_python_backend(self):
+        """Test that a random soup evolves identically, including the edges"""
+        python_game = random_soup(GameOfLife(width=30, height=25))
+        numpy_game = random_soup(GameOfLife(width=30, height=25, backend="numpy"))
+        self.assert_same_evolution(python_game, numpy_game, 40)
+    
+    def test_cell_access(self):
+        """Test set_cell, get_cell, count_neighbors and grid on the NumPy backend"""
+        game = GameOfLife(width=10, height=10, backend="numpy")
+        game.set_cell(5, 5, True)
+        game.set_cell(5, 6, True)
+        game.set_cell(6, 5, True)
+        game.set_cell(20, 20, True)  # Out of range, ignored
+        
+        self.assertTrue(game.get_cell(5, 5))
+        self.assertFalse(game.get_cell(0, 0))
+        self.assertFalse(game.get_cell(20, 20))
+        self.assertEqual(game.count_neighbors(6, 6), 3)
+        self.assertEqual(game.count_neighbors(0, 0), 0)
+        self.assertEqual(len(game._get_alive_neighbors(6, 6)), 3)
+        self.assertTrue(game.grid[5][6].alive)
+        
+        game.clear_grid()
+        self.assertFalse(game.get_cell(5, 5))
+    
+    def test_custom_cells_breed(self):
+        """Test that births next to custom cells go through the offspring rules"""
+        game = GameOfLife(width=10, height=10, backend="numpy")
+        red = game.add_cell_type("Red", "red", "●")
+        blue = game.add_cell_type("Blue", "blue", "■")
+        game.set_cell(4, 4, alive=True, cell_type=red)
+        game.set_cell(4, 5, alive=True, cell_type=blue)
+        game.set_cell(4, 6, alive=True, cell_type=red)
+        
+        game.next_generation()
+        
+        offspring = game.grid[5][5]
+        self.assertTrue(offspring.alive)
+        self.assertIn(offspring.symbol, ["●", "■"])
+        self.assertIn(offspring.color, ["red", "blue"])
+        self.assertIn(offspring.name, ["Red-Blue", "Blue-Red", "Red-Red"])
+        # The surviving middle cell keeps its own properties
+        self.assertEqual(game.grid[4][5].name, "Blue")
+    
+    def test_mutation_runs(self):
+        """Test that mutations are applied on the NumPy backend"""
+        # Every cell mutates each generation, which empties the board now and then
+        seed_random(self, 2)
+        game = GameOfLife(width=20, height=20, mutation_rate=1.0, backend="numpy")
+        game.load_pattern('glider')
+        for _ in range(10):
+            game.next_generation()
+        self.assertEqual(game.generation, 10)
+        symbols = {cell.symbol for row in game.grid for cell in row if cell.alive}
+        self.assertTrue(symbols)
+
+
+class TestBitPackedEngine(unittest.TestCase):
+    """Test cases for the bit-packed plain-Conway engine"""
+    
+    def assert_matches_python_engine(self, width, height):
+        """Step a soup on both engines and compare every generation"""
+        reference = random_soup(GameOfLife(width=width, height=height))
+        packed = random_soup(GameOfLife(width=width, height=height))
+        packed._use_engine(BitPackedEngine)
+        self.assertIsInstance(packed.engine, BitPackedEngine)
+        for _ in range(30):
+            self.assertEqual(str(reference), str(packed))
+            reference.next_generation()
+            packed.next_generation()
+        self.assertEqual(str(reference), str(packed))
+    
+    def test_matches_python_engine(self):
+        """Test soups spanning several words evolve exactly like the reference engine"""
+        self.assert_matches_python_engine(width=70, height=12)
+        self.assert_matches_python_engine(width=64, height=5)
+    
+    def test_python_int_rows_match_python_engine(self):
+        """Test the big-int fallback used when NumPy is missing"""
+        with mock.patch.object(BitPackedEngine, "use_numpy", False):
+            self.assert_matches_python_engine(width=70, height=12)
+    
+    def test_load_pattern_uses_bitpacked_engine(self):
+        """Test that plain load_pattern runs are handed to the bit-packed engine"""
+        game = GameOfLife(width=20, height=20)
+        game.load_pattern('glider')
+        self.assertIsInstance(game.engine, BitPackedEngine)
+        self.assertEqual(len(list(game.engine.live_cells())), 5)
+        self.assertEqual(game.count_neighbors(2, 2), 5)
+        
+        game = GameOfLife(width=20, height=20, mutation_rate=0.1)
+        game.load_pattern('glider')
+        self.assertIsInstance(game.engine, PythonEngine)
+    
+    def test_load_pattern_keeps_requested_engine(self):
+        """Test that load_pattern leaves an explicitly chosen engine in place"""
+        game = GameOfLife(width=20, height=20, backend="sparse")
+        game.load_pattern('glider')
+        self.assertIsInstance(game.engine, SparseEngine)
+        self.assertEqual(game.population(), 5)
+        
+        if numpy is not None:
+            game = GameOfLife(width=20, height=20, backend="numpy", workers=4)
+            game.load_pattern('glider')
+            self.assertIsInstance(game.engine, ThreadBandEngine)
+            game.close()
+        
+        # "auto" picks from the loaded board, which here is nearly empty
+        game = GameOfLife(width=500, height=500, backend="auto")
+        game.load_pattern('glider')
+        self.assertIsInstance(game.engine, SparseEngine)
+    
+    def test_custom_cell_leaves_bitpacked_engine(self):
+        """Test that placing a custom cell moves the board to a full engine"""
+        game = GameOfLife(width=20, height=20)
+        game.load_pattern('blinker')
+        game.set_cell(10, 10, True)
+        self.assertIsInstance(game.engine, BitPackedEngine)
+        
+        fire = game.add_cell_type("Fire", "red", "●")
+        game.set_cell(15, 15, alive=True, cell_type=fire)
+        
+        self.assertIsInstance(game.engine, PythonEngine)
+        self.assertTrue(game.get_cell(1, 2))
+        self.assertTrue(game.get_cell(10, 10))
+        self.assertEqual(game.grid[15][15].name, "Fire")
+    
+    def test_mutation_leaves_bitpacked_engine(self):
+        """Test that enabling mutations moves the board to a full engine"""
+        game = GameOfLife(width=20, height=20)
+        game.load_pattern('glider')
+        game.mutation_rate = 0.5
+        game.next_generation()
+        self.assertIsInstance(game.engine, PythonEngine)
+
+
+class TestHashLifeEngine(unittest.TestCase):
+    """Test cases for the HashLife engine and GameOfLife.advance"""
+    
+    def test_advance_matches_stepping(self):
+        """Test that jumping ahead gives the same board as stepping, edges included"""
+        for width, height, generations in [(13, 9, 37), (32, 32, 64), (21, 40, 50)]:
+            stepped = random_soup(GameOfLife(width=width, height=height), seed=width)
+            jumped = random_soup(GameOfLife(width=width, height=height), seed=width)
+            for _ in range(generations):
+                stepped.next_generation()
+            jumped.advance(generations)
+            
+            self.assertIsInstance(jumped.engine, PythonEngine)
+            self.assertEqual(str(stepped), str(jumped))
+            # Single steps after the jump agree as well
+            stepped.next_generation()
+            jumped.next_generation()
+            self.assertEqual(str(stepped), str(jumped))
+    
+    def test_glider_hits_the_edge(self):
+        """Test that a glider leaving the board behaves like it does when stepped"""
+        stepped = GameOfLife(width=12, height=12)
+        jumped = GameOfLife(width=12, height=12)
+        stepped.load_pattern('glider')
+        jumped.load_pattern('glider')
+        for _ in range(100):
+            stepped.next_generation()
+        jumped.advance(100)
+        self.assertEqual(str(stepped), str(jumped))
+    
+    def test_advance_far_ahead(self):
+        """Test that an oscillator can be advanced billions of generations"""
+        game = GameOfLife(width=20, height=20)
+        game.load_pattern('pulsar')
+        start = str(game).split("\n", 1)[1]
+        
+        game.advance(3 * 10 ** 9)  # The pulsar has period 3
+        
+        self.assertEqual(game.generation, 3 * 10 ** 9)
+        self.assertEqual(str(game).split("\n", 1)[1], start)
+        game.advance(1)
+        self.assertNotEqual(str(game).split("\n", 1)[1], start)
+    
+    def test_advance_falls_back_for_custom_cells(self):
+        """Test that custom cells and mutations are stepped instead"""
+        game = GameOfLife(width=10, height=10)
+        fire = game.add_cell_type("Fire", "red", "●")
+        for x, y in PATTERNS['blinker']:
+            game.set_cell(x + 3, y + 3, alive=True, cell_type=fire)
+        game.advance(3)
+        self.assertIsInstance(game.engine, PythonEngine)
+        self.assertEqual(game.generation, 3)
+        self.assertTrue(game.get_cell(4, 5))
+        self.assertEqual(game.grid[4][5].name, "Fire")
+        
+        game = GameOfLife(width=10, height=10, mutation_rate=0.01)
+        game.advance(2)
+        self.assertIsInstance(game.engine, PythonEngine)
+        self.assertEqual(game.generation, 2)
+        
+        with self.assertRaises(ValueError):
+            game.advance(-1)
+    
+    def test_cell_access(self):
+        """Test set_cell, get_cell and count_neighbors on the HashLife engine"""
+        game = GameOfLife(width=10, height=6, backend="hashlife")
+        self.assertIsInstance(game.engine, HashLifeEngine)
+        game.set_cell(5, 9, True)
+        game.set_cell(4, 9, True)
+        self.assertTrue(game.get_cell(5, 9))
+        self.assertEqual(game.count_neighbors(5, 8), 2)
+        self.assertEqual(sorted((x, y) for x, y, _ in game.engine.live_cells()), [(4, 9), (5, 9)])
+        
+        game.set_cell(5, 9, False)
+        self.assertFalse(game.get_cell(5, 9))
+    
+    def test_advance_restores_engine(self):
+        """Test that boards go back to their engine after the HashLife jump"""
+        for backend in ["python", "sparse"] + (["numpy"] if numpy is not None else []):
+            game = GameOfLife(width=20, height=20, backend=backend)
+            for x, y in PATTERNS['glider']:
+                game.set_cell(x, y)
+            game.advance(16)
+            self.assertEqual(game.engine.name, backend)
+            self.assertEqual(game.engine_reason, "requested")
+            self.assertEqual(game.population(), 5)
+    
+    def test_memo_is_capped(self):
+        """Test that the HashLife memo and node table stay bounded over many jumps"""
+        reference = random_soup(GameOfLife(width=32, height=32))
+        game = random_soup(GameOfLife(width=32, height=32, backend="hashlife"))
+        with mock.patch.object(HashLifeEngine, "MAX_RESULTS", 100):
+            game.advance(50)
+            memoized, interned = len(game.engine._results), len(game.engine._nodes)
+            self.assertGreater(memoized, 100)
+            for _ in range(20):
+                game.advance(7)
+                self.assertLess(len(game.engine._results), memoized)
+                self.assertLess(len(game.engine._nodes), interned)
+        # Nodes kept across the collection still make up the right board
+        for _ in range(190):
+            reference.next_generation()
+        self.assertEqual(str(reference), str(game))
+
+
+class TestSparseEngine(unittest.TestCase):
+    """Test cases for the sparse live-cell engine"""
+    
+    def test_matches_python_engine(self):
+        """Test that a soup evolves exactly like it does on the reference engine"""
+        reference = random_soup(GameOfLife(width=25, height=18))
+        sparse = random_soup(GameOfLife(width=25, height=18, backend="sparse"))
+        self.assertIsInstance(sparse.engine, SparseEngine)
+        for _ in range(30):
+            self.assertEqual(str(reference), str(sparse))
+            reference.next_generation()
+            sparse.next_generation()
+        self.assertEqual(str(reference), str(sparse))
+    
+    def test_huge_board(self):
+        """Test that a huge board costs time in proportion to its population"""
+        game = GameOfLife(width=100000, height=100000, backend="sparse")
+        for x, y in PATTERNS['glider']:
+            game.set_cell(x + 50000, y + 50000, True)
+        for _ in range(8):
+            game.next_generation()
+        # A glider moves one cell diagonally every four generations
+        self.assertEqual(len(game.engine.cells), 5)
+        self.assertTrue(game.get_cell(50005, 50004))
+        self.assertEqual(game.count_neighbors(50004, 50004), 5)
+    
+    def test_custom_cells_breed(self):
+        """Test that births inherit from custom parents on the sparse engine"""
+        game = GameOfLife(width=10, height=10, backend="sparse")
+        red = game.add_cell_type("Red", "red", "●")
+        blue = game.add_cell_type("Blue", "blue", "■")
+        game.set_cell(4, 4, alive=True, cell_type=red)
+        game.set_cell(4, 5, alive=True, cell_type=blue)
+        game.set_cell(4, 6, alive=True, cell_type=red)
+        
+        game.next_generation()
+        
+        offspring = game.grid[5][5]
+        self.assertTrue(offspring.alive)
+        self.assertIn(offspring.symbol, ["●", "■"])
+        self.assertIn(offspring.name, ["Red-Blue", "Blue-Red", "Red-Red"])
+        self.assertEqual(game.grid[4][5].name, "Blue")
+    
+    def test_mutation_births_on_empty_board(self):
+        """Test that spontaneous births are sampled across the whole board"""
+        game = GameOfLife(width=1000, height=1000, mutation_rate=1.0, backend="sparse")
+        game.next_generation()
+        # Each dead cell is born with probability 1% at a 100% mutation rate
+        self.assertGreater(len(game.engine.cells), 8000)
+        self.assertLess(len(game.engine.cells), 12000)
+    
+    def test_bernoulli_sites(self):
+        """Test that geometric gap sampling succeeds at the requested rate"""
+        sites = list(_bernoulli_sites(0.01, 100000))
+        self.assertEqual(sites, sorted(set(sites)))
+        self.assertTrue(all(0 <= site < 100000 for site in sites))
+        self.assertGreater(len(sites), 800)
+        self.assertLess(len(sites), 1200)
+        self.assertEqual(list(_bernoulli_sites(1.0, 5)), [0, 1, 2, 3, 4])
+        self.assertEqual(list(_bernoulli_sites(0.0, 5)), [])
+
+
+class TestTileTracking(unittest.TestCase):
+    """Test cases for skipping unchanged tiles on the Python engine"""
+    
+    def test_settled_board_skips_tiles(self):
+        """Test that only tiles near recent changes are recomputed"""
+        game = GameOfLife(width=64, height=64)  # 4x4 tiles of 16x16 cells
+        for x, y in [(20, 19), (20, 20), (20, 21)]:  # Blinker in tile (1, 1)
+            game.set_cell(x, y, True)
+        for x, y in [(52, 52), (52, 53), (53, 52), (53, 53)]:  # Block in tile (3, 3)
+            game.set_cell(x, y, True)
+        
+        game.next_generation()  # Every tile starts out changed
+        self.assertEqual(game.engine.tiles_computed, 16)
+        game.next_generation()  # Only the blinker's tile and its neighbors
+        game.next_generation()
+        self.assertEqual(game.engine.tiles_computed, 16 + 9 + 9)
+        self.assertEqual(game.engine.tiles_skipped, 7 + 7)
+        
+        self.assertTrue(game.get_cell(19, 20))  # Odd generation, so vertical
+        self.assertTrue(game.get_cell(53, 53))
+    
+    def test_matches_sparse_engine(self):
+        """Test that skipping tiles never changes the outcome"""
+        tiled = GameOfLife(width=80, height=60)
+        sparse = GameOfLife(width=80, height=60, backend="sparse")
+        rng = random.Random(7)
+        for x in range(20):
+            for y in range(25):
+                if rng.random() < 0.35:
+                    tiled.set_cell(x, y, True)
+                    sparse.set_cell(x, y, True)
+        for _ in range(80):
+            tiled.next_generation()
+            sparse.next_generation()
+            self.assertEqual(str(tiled), str(sparse))
+        self.assertGreater(tiled.engine.tiles_skipped, 0)
+    
+    def test_set_cell_wakes_tile(self):
+        """Test that editing a skipped tile makes it active again"""
+        game = GameOfLife(width=48, height=48)
+        game.next_generation()
+        game.next_generation()
+        skipped = game.engine.tiles_skipped
+        
+        game.set_cell(40, 39, True)
+        game.set_cell(40, 40, True)
+        game.set_cell(40, 41, True)
+        game.next_generation()
+        
+        self.assertTrue(game.get_cell(39, 40))
+        self.assertFalse(game.get_cell(40, 39))
+        self.assertEqual(game.engine.tiles_skipped, skipped + 9 - 4)
+    
+    def test_mutations_compute_every_tile(self):
+        """Test that no tile is skipped while mutations are on"""
+        game = GameOfLife(width=48, height=48, mutation_rate=0.001)
+        for _ in range(3):
+            game.next_generation()
+        self.assertEqual(game.engine.tiles_skipped, 0)
+        self.assertEqual(game.engine.tiles_computed, 27)
+
+
+class TestDoubleBuffering(unittest.TestCase):
+    """Test cases for the Python engine's preallocated board buffers"""
+    
+    def step_traced(self, game):
+        """Step once and return the (current, peak) bytes allocated meanwhile"""
+        tracemalloc.start()
+        try:
+            game.next_generation()
+            return tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    
+    def test_steady_state_allocates_nothing(self):
+        """Test that stepping reuses the buffers instead of allocating a board"""
+        game = GameOfLife(width=128, height=128)
+        for x, y in [(20, 19), (20, 20), (20, 21), (60, 60), (60, 61), (61, 60), (61, 61)]:
+            game.set_cell(x, y, True)
+        for _ in range(3):
+            game.next_generation()
+        
+        board_bytes = len(game.engine.alive)
+        for _ in range(4):
+            current, peak = self.step_traced(game)
+            # Only short-lived temporaries; far less than even the alive flags
+            self.assertLess(current, 1024)
+            self.assertLess(peak, board_bytes // 4)
+        self.assertTrue(game.get_cell(21, 20) or game.get_cell(20, 19))
+        self.assertTrue(game.get_cell(61, 61))
+    
+    def test_buffers_swap(self):
+        """Test that the two boards swap roles every generation"""
+        game = GameOfLife(width=20, height=20)
+        front = game.engine.alive
+        back = game.engine._back_board[0]
+        game.next_generation()
+        self.assertIs(game.engine.alive, back)
+        game.next_generation()
+        self.assertIs(game.engine.alive, front)
+    
+    def test_mutated_tile_is_refreshed(self):
+        """Test that properties changed by a mutation survive once mutations stop"""
+        game = GameOfLife(width=40, height=40)
+        for x, y in [(10, 10), (10, 11), (11, 10), (11, 11)]:
+            game.set_cell(x, y, True)
+        game.next_generation()
+        
+        def mutate(cell):
+            cell.symbol = "★"
+        
+        # Every live cell mutates its symbol and no dead cell is born
+        game.mutation_rate = 1.0
+        with mock.patch("random.random", return_value=0.5), \
+                mock.patch.object(game, "_mutate_cell", side_effect=mutate):
+            game.next_generation()
+        game.mutation_rate = 0.0
+        for _ in range(3):
+            game.next_generation()
+        
+        self.assertEqual(game.grid[10][10].symbol, "★")
+        self.assertEqual(game.grid[11][11].symbol, "★")
+
+
+class TestLookupTables(unittest.TestCase):
+    """Test cases for the neighborhood lookup tables behind the Python engine"""
+    
+    def test_rule_table_matches_conway(self):
+        """Test every 3x3 neighborhood against the B3/S23 rule"""
+        table = _rule_table()
+        self.assertEqual(len(table), 512)
+        for index in range(512):
+            alive = bool(index & 16)
+            neighbors = bin(index).count("1") - alive
+            expected = neighbors == 3 or (alive and neighbors == 2)
+            self.assertEqual(table[index], expected, index)
+    
+    def test_other_life_like_rules(self):
+        """Test that a different rule only changes the table"""
+        highlife = _rule_table(births=(3, 6), survivals=(2, 3))
+        # A dead center with six live neighbors
+        self.assertEqual(highlife[0b111000111], 1)
+        self.assertEqual(_rule_table()[0b111000111], 0)
+    
+    def test_block_table_matches_rule_table(self):
+        """Test that each 4x4 block steps its center like four separate lookups"""
+        rule, blocks = _rule_table(), _block_table()
+        rng = random.Random(0)
+        for index in [0, 65535] + [rng.randrange(65536) for _ in range(2000)]:
+            cells = [[(index >> (4 * column + row)) & 1 for column in range(4)]
+                     for row in range(4)]
+            for bit, (row, column) in enumerate([(1, 1), (1, 2), (2, 1), (2, 2)]):
+                window = sum(cells[row + dr][column + dc] << (3 * (dc + 1) + dr + 1)
+                             for dr in (-1, 0, 1) for dc in (-1, 0, 1))
+                self.assertEqual((blocks[index] >> bit) & 1, rule[window])
+    
+    def test_odd_board_matches_sparse_engine(self):
+        """Test that blocks hanging over odd board edges step correctly"""
+        python_game = random_soup(GameOfLife(width=37, height=21))
+        sparse_game = random_soup(GameOfLife(width=37, height=21, backend="sparse"))
+        for _ in range(25):
+            self.assertEqual(str(python_game), str(sparse_game))
+            python_game.next_generation()
+            sparse_game.next_generation()
+        self.assertEqual(str(python_game), str(sparse_game))
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestProcessBands(unittest.TestCase):
+    """Test cases for stepping bands of the board in worker processes"""
+    
+    def make_game(self, **kwargs):
+        """Create a game and make sure its workers are stopped afterwards"""
+        game = GameOfLife(**kwargs)
+        self.addCleanup(game.close)
+        return game
+    
+    def test_requires_numpy_backend(self):
+        """Test that processes are rejected for other backends"""
+        with self.assertRaises(ValueError):
+            GameOfLife(width=10, height=10, processes=2)
+    
+    def test_band_bounds(self):
+        """Test that bands cover every row once and never outnumber the rows"""
+        self.assertEqual(_band_bounds(10, 3), [(0, 3), (3, 6), (6, 10)])
+        self.assertEqual(_band_bounds(2, 4), [(0, 1), (1, 2)])
+    
+    def test_matches_serial_stepping(self):
+        """Test that halo exchange between bands gives the serial result"""
+        serial_game = random_soup(GameOfLife(width=50, height=37, backend="numpy"))
+        band_game = random_soup(self.make_game(width=50, height=37, backend="numpy", processes=3))
+        self.assertIsInstance(band_game.engine, ProcessBandEngine)
+        for _ in range(30):
+            self.assertEqual(str(serial_game), str(band_game))
+            serial_game.next_generation()
+            band_game.next_generation()
+        self.assertEqual(str(serial_game), str(band_game))
+    
+    def test_custom_cells_breed(self):
+        """Test that births next to custom cells still create offspring"""
+        game = self.make_game(width=10, height=10, backend="numpy", processes=2)
+        red = game.add_cell_type("Red", "red", "●")
+        for y in (4, 5, 6):
+            game.set_cell(4, y, alive=True, cell_type=red)
+        
+        game.next_generation()
+        
+        for x in (3, 5):
+            offspring = game.grid[x][5]
+            self.assertTrue(offspring.alive)
+            self.assertEqual(offspring.name, "Red-Red")
+            self.assertEqual(offspring.symbol, "●")
+    
+    def test_close_keeps_stepping_serially(self):
+        """Test that a closed engine keeps its board and keeps stepping"""
+        game = self.make_game(width=20, height=20, backend="numpy", processes=2)
+        game.set_cell(5, 4)
+        game.set_cell(5, 5)
+        game.set_cell(5, 6)
+        game.close()
+        game.next_generation()
+        self.assertTrue(game.get_cell(4, 5))
+        self.assertTrue(game.get_cell(6, 5))
+        self.assertFalse(game.get_cell(5, 4))
+    
+    def test_temporally_blocked_advance(self):
+        """Test that advancing with wide halos matches stepping one generation at a time"""
+        serial_game = random_soup(GameOfLife(width=50, height=37, backend="numpy"))
+        band_game = random_soup(self.make_game(width=50, height=37, backend="numpy", processes=4))
+        for _ in range(21):
+            serial_game.next_generation()
+        band_game.advance(21)
+        self.assertIsInstance(band_game.engine, ProcessBandEngine)
+        self.assertEqual(band_game.generation, 21)
+        self.assertEqual(str(serial_game), str(band_game))
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestThreadBands(unittest.TestCase):
+    """Test cases for stepping bands of the board on a thread pool"""
+    
+    def test_requires_numpy_backend(self):
+        """Test that workers are rejected for other backends and alongside processes"""
+        with self.assertRaises(ValueError):
+            GameOfLife(width=10, height=10, workers=2)
+        with self.assertRaises(ValueError):
+            GameOfLife(width=10, height=10, backend="numpy", processes=2, workers=2)
+    
+    def test_matches_serial_stepping(self):
+        """Test that bands reading shared halo rows give the serial result"""
+        serial_game = random_soup(GameOfLife(width=50, height=37, backend="numpy"))
+        band_game = random_soup(GameOfLife(width=50, height=37, backend="numpy", workers=4))
+        self.addCleanup(band_game.close)
+        self.assertIsInstance(band_game.engine, ThreadBandEngine)
+        for _ in range(30):
+            self.assertEqual(str(serial_game), str(band_game))
+            serial_game.next_generation()
+            band_game.next_generation()
+        self.assertEqual(str(serial_game), str(band_game))
+    
+    def test_close_keeps_stepping_serially(self):
+        """Test that a closed engine keeps stepping without its pool"""
+        game = GameOfLife(width=20, height=20, backend="numpy", workers=2)
+        for y in (4, 5, 6):
+            game.set_cell(5, y)
+        game.close()
+        game.next_generation()
+        self.assertTrue(game.get_cell(4, 5))
+        self.assertTrue(game.get_cell(6, 5))
+        self.assertFalse(game.get_cell(5, 4))
+    
+    def test_temporally_blocked_advance(self):
+        """Test that advancing with wide halos matches stepping one generation at a time"""
+        serial_game = random_soup(GameOfLife(width=50, height=37, backend="numpy"))
+        band_game = random_soup(GameOfLife(width=50, height=37, backend="numpy", workers=4))
+        self.addCleanup(band_game.close)
+        for _ in range(21):
+            serial_game.next_generation()
+        band_game.advance(21)
+        self.assertIsInstance(band_game.engine, ThreadBandEngine)
+        self.assertEqual(str(serial_game), str(band_game))
+    
+    def test_advance_clears_stale_ids(self):
+        """Test that cells born during a blocked advance are default cells"""
+        game = GameOfLife(width=10, height=10, backend="numpy", workers=2)
+        self.addCleanup(game.close)
+        game.set_cell(0, 1, alive=True, cell_type=game.add_cell_type("Red", "red", "●"))
+        game.set_cell(0, 1, False)
+        for y in (0, 1, 2):
+            game.set_cell(1, y)
+        game.advance(1)
+        newborn = game.grid[0][1]
+        self.assertTrue(newborn.alive)
+        self.assertEqual(newborn.name, "")
+        self.assertEqual(newborn.symbol, "█")
+
+
+class TestRun(unittest.TestCase):
+    """Test cases for running many generations in one call"""
+    
+    def test_stats_match_stepping(self):
+        """Test that births and deaths add up to the per-generation changes"""
+        game = random_soup(GameOfLife(width=30, height=25))
+        reference = random_soup(GameOfLife(width=30, height=25))
+        births = deaths = 0
+        for _ in range(20):
+            before = {(x, y) for x, y, _ in reference.engine.live_cells()}
+            reference.next_generation()
+            after = {(x, y) for x, y, _ in reference.engine.live_cells()}
+            births += len(after - before)
+            deaths += len(before - after)
+        
+        stats = game.run(20)
+        self.assertIsInstance(stats, RunStats)
+        self.assertEqual(stats.generations, 20)
+        self.assertEqual(stats.births, births)
+        self.assertEqual(stats.deaths, deaths)
+        self.assertEqual(stats.population, len(after))
+        self.assertGreaterEqual(stats.elapsed, 0)
+        self.assertEqual(game.generation, 20)
+        self.assertEqual(str(game), str(reference))
+    
+    def test_engines_agree(self):
+        """Test that every engine reports the same statistics"""
+        expected = None
+        for backend in ["python", "numpy", "sparse"] if numpy else ["python", "sparse"]:
+            stats = random_soup(GameOfLife(width=30, height=25, backend=backend)).run(15)
+            summary = (stats.population, stats.births, stats.deaths)
+            if expected is None:
+                expected = summary
+            self.assertEqual(summary, expected, backend)
+        
+        game = GameOfLife(width=30, height=25)
+        game.load_pattern('glider')
+        stats = game.run(8)
+        self.assertIsInstance(game.engine, BitPackedEngine)
+        self.assertEqual((stats.population, stats.births, stats.deaths), (5, 16, 16))
+    
+    def test_leaves_hashlife(self):
+        """Test that a board jumped ahead with advance can still be run"""
+        game = GameOfLife(width=30, height=25)
+        game.load_pattern('blinker')
+        game.advance(5)
+        stats = game.run(3)
+        self.assertNotIsInstance(game.engine, HashLifeEngine)
+        self.assertEqual((stats.births, stats.deaths, stats.population), (6, 6, 3))
+        self.assertEqual(game.generation, 8)
+    
+    def test_returns_to_hashlife(self):
+        """Test that a board on the HashLife backend goes back to it after a run"""
+        game = GameOfLife(width=30, height=25, backend="hashlife")
+        game.load_pattern('blinker')
+        reason = game.engine_reason
+        stats = game.run(3)
+        self.assertIsInstance(game.engine, HashLifeEngine)
+        self.assertEqual(game.engine_reason, reason)
+        self.assertEqual((stats.births, stats.deaths, stats.population), (6, 6, 3))
+        game.advance(5)
+        self.assertEqual(game.population(), 3)
+        self.assertEqual(game.generation, 8)
+    
+    def test_until_stops_early(self):
+        """Test that the run stops at the first generation meeting the condition"""
+        game = GameOfLife(width=10, height=10)
+        game.set_cell(5, 5)
+        stats = game.run(100, until=lambda g: g.population() == 0)
+        self.assertEqual(stats.generations, 1)
+        self.assertEqual(game.generation, 1)
+        self.assertEqual(stats.deaths, 1)
+    
+    def test_callback_every(self):
+        """Test that callbacks see the board at the requested generations only"""
+        game = GameOfLife(width=10, height=10)
+        game.load_pattern('blinker')
+        seen = []
+        game.run(10, callback=lambda g: seen.append(g.generation), callback_every=3)
+        self.assertEqual(seen, [3, 6, 9])
+        self.assertEqual(game.generation, 10)
+
+
+class TestUnboundedBoard(unittest.TestCase):
+    """Test cases for the unbounded, chunked board"""
+    
+    def live_positions(self, game, dx=0, dy=0):
+        """Return the sorted live positions of a game, shifted by (dx, dy)"""
+        return sorted((x + dx, y + dy) for x, y, _ in game.engine.live_cells())
+    
+    def test_rejects_other_backends(self):
+        """Test that unknown boundaries and other engines are rejected"""
+        with self.assertRaises(ValueError):
+            GameOfLife(boundary="sphere")
+        with self.assertRaises(ValueError):
+            GameOfLife(backend="sparse", boundary="unbounded")
+    
+    def test_cells_past_the_edges(self):
+        """Test that cells can be set and read anywhere"""
+        game = GameOfLife(width=10, height=10, boundary="unbounded")
+        self.assertIsInstance(game.engine, ChunkedEngine)
+        game.set_cell(-5, 1000)
+        self.assertTrue(game.get_cell(-5, 1000))
+        game.set_cell(-5, 999)
+        game.set_cell(-5, 1001)
+        self.assertEqual(game.count_neighbors(-4, 1000), 3)
+    
+    def test_glider_runs_forever(self):
+        """Test that a glider keeps flying while only a few chunks stay allocated"""
+        game = GameOfLife(width=10, height=10, boundary="unbounded")
+        game.load_pattern('glider')
+        game.run(400)
+        self.assertEqual(game.population(), 5)
+        # The glider moved 100 cells diagonally
+        self.assertEqual(self.live_positions(game, -100, -100), sorted(PATTERNS['glider']))
+        self.assertLessEqual(len(game.engine.chunks), 4)
+        self.assertEqual(str(game).count("█"), 0)
+    
+    def test_matches_large_bounded_board(self):
+        """Test that chunk halos step like a board too big to reach the edges"""
+        unbounded_game = random_soup(GameOfLife(width=40, height=30, boundary="unbounded"))
+        bounded_game = GameOfLife(width=400, height=400, backend="sparse")
+        for x, y, cell in unbounded_game.engine.live_cells():
+            bounded_game.set_cell(x + 180, y + 180, True, cell)
+        for _ in range(60):
+            self.assertEqual(self.live_positions(unbounded_game, 180, 180),
+                             self.live_positions(bounded_game))
+            unbounded_game.next_generation()
+            bounded_game.next_generation()
+    
+    def test_empty_chunks_are_freed(self):
+        """Test that chunks disappear once their cells die"""
+        game = GameOfLife(width=10, height=10, boundary="unbounded")
+        game.set_cell(500, 500)
+        game.set_cell(0, 0)
+        self.assertEqual(len(game.engine.chunks), 2)
+        game.next_generation()
+        self.assertEqual(game.engine.chunks, {})
+    
+    def test_custom_cells_breed(self):
+        """Test that births across a chunk border still create offspring"""
+        game = GameOfLife(width=10, height=10, boundary="unbounded")
+        red = game.add_cell_type("Red", "red", "●")
+        size = ChunkedEngine.CHUNK_SIZE
+        for y in (size - 2, size - 1, size):
+            game.set_cell(0, y, alive=True, cell_type=red)
+        game.next_generation()
+        
+        offspring = game.engine._cell(-1, size - 1)
+        self.assertTrue(offspring.alive)
+        self.assertEqual(offspring.name, "Red-Red")
+        self.assertEqual(game.engine._cell(0, size - 1).name, "Red")
+
+
+class TestTorusBoard(unittest.TestCase):
+    """Test cases for boards whose edges wrap around"""
+    
+    def backends(self):
+        """Return the backends available here"""
+        return ["python", "numpy", "sparse"] if numpy else ["python", "sparse"]
+    
+    def test_rejects_parallel_engines(self):
+        """Test that band engines refuse a torus"""
+        with self.assertRaises(ValueError):
+            GameOfLife(backend="numpy", workers=2, boundary="torus")
+    
+    def test_neighbors_wrap(self):
+        """Test that corner cells count neighbors across both edges"""
+        for backend in self.backends():
+            game = GameOfLife(width=10, height=8, backend=backend, boundary="torus")
+            game.set_cell(7, 9)
+            game.set_cell(0, 9)
+            game.set_cell(7, 0)
+            self.assertEqual(game.count_neighbors(0, 0), 3, backend)
+            self.assertEqual(len(game._get_alive_neighbors(0, 0)), 3, backend)
+    
+    def test_glider_returns_home(self):
+        """Test that a glider crossing every edge comes back to where it started"""
+        for backend in self.backends():
+            game = GameOfLife(width=20, height=20, backend=backend, boundary="torus")
+            game.load_pattern('glider')
+            game.run(80)
+            live = sorted((x, y) for x, y, _ in game.engine.live_cells())
+            self.assertEqual(live, sorted(PATTERNS['glider']), backend)
+    
+    def test_engines_agree(self):
+        """Test that a soup on an odd-sized torus evolves identically on every engine"""
+        games = [random_soup(GameOfLife(width=37, height=23, backend=backend, boundary="torus"))
+                 for backend in self.backends()]
+        for _ in range(40):
+            boards = [str(game) for game in games]
+            self.assertEqual(boards, [boards[0]] * len(games))
+            for game in games:
+                game.next_generation()
+    
+    def test_custom_births_across_edge(self):
+        """Test that offspring take after parents on the far side of an edge"""
+        for backend in self.backends():
+            game = GameOfLife(width=10, height=10, backend=backend, boundary="torus")
+            red = game.add_cell_type("Red", "red", "●")
+            for x in (9, 0, 1):
+                game.set_cell(x, 0, alive=True, cell_type=red)
+            game.next_generation()
+            self.assertEqual(game.grid[0][9].name, "Red-Red", backend)
+
+
+class TestEngineRegistry(unittest.TestCase):
+    """Test cases for the engine registry and automatic backend selection"""
+    
+    def test_registered_engines(self):
+        """Test that every built-in engine is selectable by name"""
+        for name in ["python", "numpy", "bitpacked", "sparse", "hashlife", "chunked"]:
+            self.assertIn(name, ENGINES)
+            self.assertTrue(issubclass(ENGINES[name], Engine))
+            self.assertEqual(ENGINES[name].name, name)
+    
+    def test_plain_backends_hand_over(self):
+        """Test that plain-only backends move to a full engine for custom cells"""
+        for backend in ["bitpacked", "hashlife"]:
+            game = GameOfLife(width=20, height=20, backend=backend)
+            self.assertEqual(game.engine.name, backend)
+            game.load_pattern('blinker')
+            game.next_generation()
+            self.assertTrue(game.get_cell(0, 2))
+            game.set_cell(10, 10, alive=True, cell_type=game.add_cell_type("Red", "red", "●"))
+            self.assertFalse(game.engine.plain_only)
+            self.assertEqual(game.engine_reason, "custom cells or mutations need a full engine")
+    
+    def test_unsupported_boundary(self):
+        """Test that an engine is refused a boundary it cannot step"""
+        with self.assertRaises(ValueError):
+            GameOfLife(backend="hashlife", boundary="torus")
+    
+    def test_custom_engine(self):
+        """Test that a registered engine can be selected by name"""
+        @register_engine
+        class EchoEngine(SparseEngine):
+            name = "echo"
+        self.addCleanup(ENGINES.pop, "echo")
+        
+        game = GameOfLife(width=10, height=10, backend="echo")
+        self.assertIsInstance(game.engine, EchoEngine)
+        self.assertEqual(game.engine_reason, "requested")
+    
+    def test_auto_picks_bitpacked_for_plain_boards(self):
+        """Test that plain Conway boards go to the bit-packed engine"""
+        game = random_soup(GameOfLife(width=50, height=50, backend="auto"))
+        game.next_generation()
+        self.assertEqual(game.engine.name, "bitpacked")
+        self.assertIn("plain Conway", game.engine_reason)
+    
+    def test_auto_picks_sparse_for_empty_boards(self):
+        """Test that a big, nearly empty board with custom cells goes to the sparse engine"""
+        game = GameOfLife(width=200, height=200, backend="auto")
+        red = game.add_cell_type("Red", "red", "●")
+        for y in (4, 5, 6):
+            game.set_cell(5, y, alive=True, cell_type=red)
+        stats = game.run(2)
+        self.assertEqual(game.engine.name, "sparse")
+        self.assertIn("density", game.engine_reason)
+        self.assertEqual(stats.population, 3)
+    
+    def test_auto_picks_sparse_for_empty_plain_boards(self):
+        """Test that one glider on a big board goes to the sparse engine, not a bit-packed one"""
+        game = GameOfLife(width=2000, height=2000, backend="auto")
+        self.assertEqual(game.engine.name, "sparse")
+        for x, y in PATTERNS["glider"]:
+            game.set_cell(x, y)
+        game.run(4)
+        self.assertEqual(game.engine.name, "sparse")
+        self.assertIn("density", game.engine_reason)
+        self.assertEqual(game.population(), 5)
+    
+    def test_auto_picks_dense_engine_for_busy_boards(self):
+        """Test that a dense board with mutations goes to a dense engine"""
+        game = random_soup(GameOfLife(width=60, height=60, mutation_rate=0.01, backend="auto"))
+        game.next_generation()
+        self.assertEqual(game.engine.name, "numpy" if numpy else "python")
+        
+        small_game = GameOfLife(width=10, height=10, mutation_rate=0.01, backend="auto")
+        random_soup(small_game)
+        small_game.next_generation()
+        self.assertEqual(small_game.engine.name, "python")
+
+
+class TestAdaptiveLayout(unittest.TestCase):
+    """Test cases for auto boards moving between dense and sparse engines"""
+    
+    def make_game(self):
+        """Create a 100x100 auto board that already holds a custom cell type"""
+        game = GameOfLife(width=100, height=100, backend="auto")
+        self.red = game.add_cell_type("Red", "red", "●")
+        return game
+    
+    def set_blocks(self, game, rows, alive=True):
+        """Set or clear a 2x2 still-life block every 4 columns along the given rows"""
+        for x in rows:
+            for y in range(0, game.width, 4):
+                for dx, dy in [(0, 0), (0, 1), (1, 0), (1, 1)]:
+                    game.set_cell(x + dx, y + dy, alive=alive,
+                                  cell_type=self.red if alive else None)
+    
+    def test_switches_when_density_collapses(self):
+        """Test that a dense board moves to the sparse engine once it empties out"""
+        game = self.make_game()
+        # Isolated cells at 11% density all die in one generation
+        for x in range(0, 100, 3):
+            for y in range(0, 100, 3):
+                game.set_cell(x, y, alive=True, cell_type=self.red)
+        game.next_generation()
+        self.assertIsInstance(game.engine, SparseEngine)
+        self.assertEqual(game.layout_switches, 1)
+        self.assertIn("density fell", game.engine_reason)
+        self.assertGreaterEqual(game.conversion_time, 0)
+    
+    def test_hysteresis(self):
+        """Test that densities between the two thresholds never trigger a switch"""
+        game = self.make_game()
+        # 75 blocks of still lifes make a 3% density
+        self.set_blocks(game, [0, 4, 8])
+        stats = game.run(3)
+        self.assertNotIsInstance(game.engine, SparseEngine)
+        self.assertEqual(stats.switches, 0)
+        
+        # Down to 1% moves to the sparse engine
+        self.set_blocks(game, [4, 8], alive=False)
+        stats = game.run(1)
+        self.assertIsInstance(game.engine, SparseEngine)
+        self.assertEqual(stats.switches, 1)
+        
+        # Back at 3%, the board stays sparse
+        self.set_blocks(game, [4, 8])
+        stats = game.run(3)
+        self.assertIsInstance(game.engine, SparseEngine)
+        self.assertEqual(stats.switches, 0)
+        
+        # 6% crosses the upper threshold
+        self.set_blocks(game, [12, 16, 20])
+        stats = game.run(1)
+        self.assertNotIsInstance(game.engine, SparseEngine)
+        self.assertEqual(stats.switches, 1)
+        self.assertIn("density rose", game.engine_reason)
+        self.assertEqual(game.layout_switches, 2)
+        self.assertEqual(game.population(), 600)
+    
+    def test_plain_boards_switch_between_bitpacked_and_sparse(self):
+        """Test that a plain board moves between the bit-packed and sparse engines"""
+        game = GameOfLife(width=100, height=100, backend="auto")
+        for x in range(0, 100, 3):
+            for y in range(0, 100, 3):
+                game.set_cell(x, y)
+        game.next_generation()
+        self.assertIsInstance(game.engine, SparseEngine)
+        self.assertEqual(game.layout_switches, 1)
+        
+        # 150 plain blocks make a 6% density
+        for x in range(0, 24, 4):
+            for y in range(0, 100, 4):
+                for dx, dy in [(0, 0), (0, 1), (1, 0), (1, 1)]:
+                    game.set_cell(x + dx, y + dy)
+        stats = game.run(1)
+        self.assertIsInstance(game.engine, BitPackedEngine)
+        self.assertEqual(stats.switches, 1)
+        self.assertIn("density rose", game.engine_reason)
+        self.assertEqual(game.population(), 600)
+    
+    def test_small_boards_do_not_adapt(self):
+        """Test that boards too small for the sparse engine stay put"""
+        game = GameOfLife(width=20, height=20, backend="auto")
+        red = game.add_cell_type("Red", "red", "●")
+        game.set_cell(5, 5, alive=True, cell_type=red)
+        game.next_generation()
+        self.assertEqual(game.layout_switches, 0)
+        self.assertEqual(game.engine.name, "python")
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestCustomKernel(unittest.TestCase):
+    """Test cases for the single-loop custom-cell kernel, run here as plain Python"""
+    
+    def setUp(self):
+        """Step NumPy boards through the uncompiled kernel"""
+        kernel = staticmethod(_custom_step_kernel)
+        patcher = mock.patch.object(NumpyEngine, "custom_kernel", kernel)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_kernel_only_compiled_with_numba(self):
+        """Test that the compiled kernel is used exactly when Numba is installed"""
+        self.assertEqual(game_of_life._compiled_kernels() is None, numba is None)
+    
+    def test_matches_conway_rules(self):
+        """Test that custom-cell boards follow the same live/dead rules as other engines"""
+        for boundary in ("bounded", "torus"):
+            boards = []
+            for backend in ("python", "numpy"):
+                game = GameOfLife(width=30, height=30, backend=backend, boundary=boundary)
+                red = game.add_cell_type("Red", "red", "●")
+                blue = game.add_cell_type("Blue", "blue", "■")
+                rng = random.Random(3)
+                for x in range(30):
+                    for y in range(30):
+                        if rng.random() < 0.35:
+                            game.set_cell(x, y, cell_type=rng.choice([red, blue, None]))
+                for _ in range(5):
+                    game.next_generation()
+                boards.append([[cell.alive for cell in row] for row in game.grid])
+            self.assertEqual(boards[0], boards[1])
+    
+    def test_offspring_blends_parents(self):
+        """Test that births inherit colors, symbols and hybrid names from their parents"""
+        game = GameOfLife(width=5, height=5, backend="numpy")
+        red = game.add_cell_type("Red", "red", "●")
+        blue = game.add_cell_type("Blue", "blue", "■")
+        # Vertical blinker whose births see all three cells
+        for x, cell_type in [(1, red), (2, blue), (3, red)]:
+            game.set_cell(x, 2, cell_type=cell_type)
+        game.next_generation()
+        
+        self.assertEqual(game.grid[2][2].name, "Blue")
+        for y in (1, 3):
+            cell = game.grid[2][y]
+            self.assertTrue(cell.alive)
+            self.assertIn(cell.name, ("Red-Blue", "Blue-Red", "Red-Red"))
+            self.assertIn(cell.color, ("red", "blue"))
+            self.assertIn(cell.symbol, ("●", "■"))
+    
+    def test_mutations(self):
+        """Test that a certain mutation kills live cells and births dead ones"""
+        game = GameOfLife(width=6, height=6, mutation_rate=1.0, backend="numpy")
+        for x, y in [(1, 1), (1, 2), (2, 1), (2, 2)]:
+            game.set_cell(x, y)
+        with mock.patch("random.random", return_value=0.0):
+            game.next_generation()
+        for x in range(6):
+            for y in range(6):
+                self.assertEqual(game.grid[x][y].alive, not (x in (1, 2) and y in (1, 2)))
+        self.assertEqual(game.grid[0][0].color, "white")
+    
+    def test_kernel_steps_unseeded_games(self):
+        """Test that the kernel steps games with mutations unless seeded or missing"""
+        for seed, kernel, expected in [(None, _custom_step_kernel, True),
+                                       (3, _custom_step_kernel, False), (None, None, False)]:
+            game = GameOfLife(width=6, height=6, mutation_rate=0.1, backend="numpy", seed=seed)
+            game.set_cell(1, 1)
+            kernel = kernel and staticmethod(kernel)
+            with mock.patch.object(NumpyEngine, "custom_kernel", kernel), \
+                    mock.patch.object(NumpyEngine, "_step_kernel", autospec=True) as step_kernel:
+                game.next_generation()
+            self.assertEqual(step_kernel.called, expected)
+
+
+@unittest.skipIf(numba is None, "Numba is not installed")
+class TestCompiledKernel(unittest.TestCase):
+    """Test cases for the Numba-compiled custom-cell kernel"""
+    
+    def run_game(self):
+        """Run a custom-cell board with mutations through the compiled kernel"""
+        game = GameOfLife(width=60, height=60, mutation_rate=0.05, backend="numpy")
+        red = game.add_cell_type("Red", "red", "●")
+        blue = game.add_cell_type("Blue", "blue", "■")
+        rng = random.Random(5)
+        for x in range(60):
+            for y in range(60):
+                if rng.random() < 0.35:
+                    game.set_cell(x, y, cell_type=rng.choice([red, blue]))
+        for _ in range(5):
+            game.next_generation()
+        return [[(cell.alive, cell.name, cell.color, cell.symbol) for cell in row]
+                for row in game.grid]
+    
+    def test_uses_compiled_kernel(self):
+        """Test that the NumPy engine steps through the compiled kernel by default"""
+        seed_random(self, 1)
+        # 1600 dead cells each born with probability 0.01
+        game = GameOfLife(width=40, height=40, mutation_rate=1.0, backend="numpy")
+        self.assertIs(game.engine.custom_kernel, game_of_life._compiled_kernels()[0])
+        with mock.patch.object(NumpyEngine, "_step_kernel", autospec=True,
+                               side_effect=NumpyEngine._step_kernel) as step_kernel:
+            game.next_generation()
+        self.assertTrue(step_kernel.called)
+        self.assertGreater(game.population(), 0)
+    
+    def test_random_seed_repeats_runs(self):
+        """Test that random.seed makes compiled runs repeat exactly"""
+        boards = []
+        for _ in range(2):
+            seed_random(self, 11)
+            boards.append(self.run_game())
+        self.assertEqual(boards[0], boards[1])
+        seed_random(self, 12)
+        self.assertNotEqual(self.run_game(), boards[0])
+
+
+class TestNeighborScan(unittest.TestCase):
+    """Test cases for the single-pass neighborhood scan"""
+    
+    def test_scan_matches_count_and_neighbors(self):
+        """Test that every engine counts and collects the same live neighbors"""
+        backends = ["python", "sparse"] + (["numpy"] if numpy is not None else [])
+        for backend in backends:
+            game = GameOfLife(width=10, height=10, backend=backend)
+            red = game.add_cell_type("Red", "red", "●")
+            game.set_cell(4, 4, cell_type=red)
+            game.set_cell(4, 5, True)
+            game.set_cell(6, 6, True)
+            game.set_cell(9, 9, True)
+            
+            count, neighbors = game.engine.scan_neighbors(5, 5)
+            self.assertEqual(count, 3)
+            self.assertEqual(count, game.count_neighbors(5, 5))
+            self.assertEqual(sorted(neighbors), sorted([game._encode(red), (0, 0, 0), (0, 0, 0)]))
+            names = sorted(cell.name for cell in game._get_alive_neighbors(5, 5))
+            self.assertEqual(names, ["", "", "Red"])
+    
+    def test_plain_engines_share_the_scan(self):
+        """Test that the plain-only engines scan neighbors through Engine's get-based loop"""
+        for engine_class in (BitPackedEngine, HashLifeEngine):
+            self.assertIs(engine_class.scan_neighbors, Engine.scan_neighbors)
+            game = GameOfLife(width=10, height=10, backend=engine_class.name)
+            for x, y in [(0, 0), (0, 1), (1, 0), (9, 9)]:
+                game.set_cell(x, y, True)
+            self.assertEqual(game.engine.scan_neighbors(1, 1), (3, [(0, 0, 0)] * 3))
+            self.assertEqual(game.engine.scan_neighbors(9, 8), (1, [(0, 0, 0)]))
+    
+    def test_default_births_skip_offspring_rules(self):
+        """Test that births among default cells skip parent selection and inheritance"""
+        boards = [("python", "bounded"), ("sparse", "bounded"), ("python", "unbounded")]
+        for backend, boundary in boards:
+            game = GameOfLife(width=10, height=10, backend=backend, boundary=boundary)
+            # A blinker of default cells, with a custom cell far away
+            game.set_cell(8, 8, cell_type=game.add_cell_type("Red", "red", "●"))
+            for y in (3, 4, 5):
+                game.set_cell(4, y, True)
+            # Parent selection draws from a random stream and looks up compatibility classes
+            with mock.patch.object(game, "_random_stream", side_effect=AssertionError), \
+                    mock.patch.object(game, "_compatibility_id", side_effect=AssertionError):
+                game.next_generation()
+            self.assertTrue(game.get_cell(5, 4))
+            self.assertEqual(game.grid[5][4].name, "")
+
+
+class TestHomogeneousPopulation(unittest.TestCase):
+    """Test cases for skipping the offspring rules while every cell shares one genotype"""
+    
+    BOARDS = [("python", "bounded"), ("sparse", "bounded"), ("python", "unbounded")] + \
+        ([("numpy", "bounded")] if numpy is not None else [])
+    
+    def make_blinker(self, backend, boundary, cell_type):
+        """Create a 10x10 game holding a horizontal blinker of one cell type"""
+        game = GameOfLife(width=10, height=10, backend=backend, boundary=boundary)
+        for y in (3, 4, 5):
+            game.set_cell(4, y, cell_type=cell_type)
+        return game
+    
+    def test_unnamed_genotype_skips_offspring_rules(self):
+        """Test that births copy the shared genotype without selecting parents"""
+        for backend, boundary in self.BOARDS:
+            blue = Cell(alive=True, color="blue", symbol="■")
+            game = self.make_blinker(backend, boundary, blue)
+            self.assertEqual(game._shared_genotype(), game._encode(blue))
+            with mock.patch.object(game, "_resolve_births", side_effect=AssertionError), \
+                    mock.patch.object(game.engine, "_resolve_births", side_effect=AssertionError,
+                                      create=True):
+                game.run(3)
+            for x, y in [(4, 4), (3, 4), (5, 4)]:
+                cell = game.grid[x][y]
+                self.assertEqual((cell.alive, cell.color, cell.symbol), (True, "blue", "■"))
+            self.assertFalse(game.grid[4][3].alive)
+            self.assertEqual(game.grid[4][3].color, "white")
+    
+    def test_variety_disables_fast_path(self):
+        """Test that a second genotype brings back the offspring rules"""
+        for backend, boundary in self.BOARDS:
+            blue = Cell(alive=True, color="blue", symbol="■")
+            game = self.make_blinker(backend, boundary, blue)
+            game.set_cell(4, 5, cell_type=Cell(alive=True, color="red", symbol="●"))
+            self.assertIsNone(game._shared_genotype())
+            # Keep the scan order and always inherit from the second parent,
+            # the red cell in the only compatible pair; compiled code would
+            # not see these mocks
+            with mock.patch.object(NumpyEngine, "custom_kernel", None), \
+                    mock.patch("random.random", return_value=0.9), \
+                    mock.patch("random.shuffle"), \
+                    mock.patch("random.choice", side_effect=lambda values: values[-1]):
+                game.next_generation()
+            for x in (3, 5):
+                self.assertEqual((game.grid[x][4].color, game.grid[x][4].symbol), ("red", "●"))
+    
+    def test_named_genotype_still_breeds_hybrids(self):
+        """Test that a population of one named type keeps producing hybrid names"""
+        for backend, boundary in self.BOARDS:
+            game = GameOfLife(width=10, height=10, backend=backend, boundary=boundary)
+            red = game.add_cell_type("Red", "red", "●")
+            for y in (3, 4, 5):
+                game.set_cell(4, y, cell_type=red)
+            self.assertIsNone(game._shared_genotype())
+            game.next_generation()
+            self.assertEqual(game.grid[3][4].name, "Red-Red")
+    
+    def test_mutations_disable_fast_path(self):
+        """Test that mutations bring back the full genotype logic until they stop"""
+        game = GameOfLife(width=10, height=10, mutation_rate=1.0)
+        game.load_pattern("blinker")
+        self.assertIsNone(game._shared_genotype())
+        with mock.patch("random.random", return_value=0.0), \
+                mock.patch("random.choice", side_effect=lambda values: values[0]):
+            game.next_generation()
+        
+        # Every cell flipped, and newborns kept the default color and symbol
+        game.mutation_rate = 0.0
+        self.assertEqual(game._shared_genotype(), (0, 0, 0))
+        self.assertEqual(game.population(), 97)
+
+
+class TestBatchedBirths(unittest.TestCase):
+    """Test cases for resolving every birth of a generation in one batch"""
+    
+    TRIALS = 4000
+    
+    def setUp(self):
+        """Create a game with two named types and an unnamed custom cell"""
+        seed_random(self, 7)
+        backend = "numpy" if numpy is not None else "python"
+        self.game = GameOfLife(width=4 * 1000, height=4, backend=backend)
+        self.parents = [self.game.add_cell_type("Red", "red", "●"),
+                        self.game.add_cell_type("Blue", "blue", "■"),
+                        Cell(alive=True, color="green", symbol="▲")]
+    
+    def frequencies(self, offspring):
+        """Share of each (name, color, symbol) among a list of palette ids"""
+        counts = {}
+        for ids in offspring:
+            cell = self.game._decode(1, *ids)
+            key = (cell.name, cell.color, cell.symbol)
+            counts[key] = counts.get(key, 0) + 1
+        return {key: count / len(offspring) for key, count in counts.items()}
+    
+    def expected(self):
+        """Frequencies produced by _select_parents and _create_offspring"""
+        offspring = []
+        for _ in range(self.TRIALS):
+            neighbors = [parent.copy() for parent in self.parents]
+            parent1, parent2 = self.game._select_parents(neighbors)
+            offspring.append(self.game._encode(self.game._create_offspring(parent1, parent2)))
+        return self.frequencies(offspring)
+    
+    def assertSameDistribution(self, actual, expected):
+        """Check two outcome distributions agree up to sampling noise"""
+        self.assertEqual(set(actual), set(expected))
+        for key, share in expected.items():
+            self.assertAlmostEqual(actual[key], share, delta=0.04, msg=key)
+    
+    def test_batch_matches_offspring_rules(self):
+        """Test that batched resolution is statistically equivalent to the per-birth rules"""
+        neighborhood = [self.game._encode(parent) for parent in self.parents]
+        offspring = self.game._resolve_births([neighborhood] * self.TRIALS,
+                                              [(0, 0)] * self.TRIALS)
+        actual = self.frequencies(offspring)
+        self.assertSameDistribution(actual, self.expected())
+    
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_array_batch_matches_offspring_rules(self):
+        """Test that the NumPy engine's vectorized resolution matches the per-birth rules"""
+        # A row of parents every 4 columns, each with a birth site below its middle
+        for y in range(0, self.game.width, 4):
+            for offset, parent in enumerate(self.parents):
+                self.game.set_cell(1, y + offset, cell_type=parent)
+        ys = numpy.arange(1, self.game.width, 4)
+        offspring = []
+        for _ in range(self.TRIALS // ys.size):
+            names, colors, symbols = self.game.engine._resolve_births(numpy.full(ys.size, 2), ys)
+            offspring.extend(zip(names.tolist(), colors.tolist(), symbols.tolist()))
+        self.assertSameDistribution(self.frequencies(offspring), self.expected())
+    
+    def test_hybrid_names_interned_once(self):
+        """Test that a batch only adds each distinct hybrid name to the palette once"""
+        neighborhood = [self.game._encode(parent) for parent in self.parents[:2]]
+        before = len(self.game.name_palette)
+        offspring = self.game._resolve_births([neighborhood] * 100, [(0, 0)] * 100)
+        self.assertEqual(len(self.game.name_palette), before + 2)
+        names = {self.game.name_palette.render(ids[0]) for ids in offspring}
+        self.assertEqual(names, {"Red-Blue", "Blue-Red"})
+
+
+class TestCompatibilityMatrix(unittest.TestCase):
+    """Test cases for the genotype compatibility bit-matrix"""
+    
+    def test_matches_are_compatible(self):
+        """Test that the matrix agrees with _are_compatible for every pair"""
+        game = GameOfLife()
+        cells = [Cell(True, name, color, symbol) for name in ("", "Fire", "Ice")
+                 for color in ("white", "red") for symbol in ("█", "●")]
+        for cell in cells:
+            for other in cells:
+                expected = game._are_compatible(cell, other)
+                first = game._compatibility_id(game._encode(cell))
+                second = game._compatibility_id(game._encode(other))
+                self.assertEqual(game.compatibility.compatible(first, second), expected,
+                                 (cell, other))
+    
+    def test_interning_is_incremental(self):
+        """Test that new keys get the next id and leave existing entries in place"""
+        matrix = CompatibilityMatrix()
+        plain = matrix.intern((False, 0, 0))
+        red = matrix.intern((False, 1, 0))
+        self.assertEqual((plain, red), (0, 1))
+        self.assertEqual(matrix.rows, [0b10, 0b01])
+        
+        # Named cells breed with each other and themselves, but not with a lookalike
+        named = matrix.intern((True, 0, 0))
+        self.assertEqual(matrix.intern((False, 1, 0)), red)
+        self.assertEqual(matrix.rows, [0b010, 0b101, 0b110])
+        self.assertTrue(matrix.compatible(named, named))
+        self.assertFalse(matrix.compatible(named, plain))
+    
+    def test_add_cell_type_registers_genotype(self):
+        """Test that new cell types are added to the matrix straight away"""
+        game = GameOfLife()
+        game.add_cell_type("Fire", "red", "●")
+        game.add_cell_type("Ice", "blue", "■")
+        self.assertEqual(len(game.compatibility), 2)
+        self.assertTrue(game.compatibility.compatible(0, 1))
+    
+    def test_births_use_matrix(self):
+        """Test that batched parent selection never compares Cell objects"""
+        seed_random(self, 0)
+        game = GameOfLife()
+        fire = game._encode(game.add_cell_type("Fire", "red", "●"))
+        with mock.patch.object(game, "_are_compatible", side_effect=AssertionError):
+            offspring = game._resolve_births([[fire, fire, (0, 0, 0)]] * 20, [(0, 0)] * 20)
+        self.assertIn((game.name_palette.join(fire[0], fire[0]), 1, 1), offspring)
+
+
+class TestGenotypeRegistry(unittest.TestCase):
+    """Test cases for the flyweight genotype registry"""
+    
+    def test_counts_live_genotypes(self):
+        """Test that every genotype on the board is counted once per live cell"""
+        for backend in ["python", "sparse"] + (["numpy"] if numpy is not None else []):
+            game = GameOfLife(width=10, height=10, backend=backend)
+            fire = game.add_cell_type("Fire", "red", "●")
+            for y in range(3):
+                game.set_cell(1, y, cell_type=fire)
+            game.set_cell(5, 5, True)
+            game.set_cell(5, 6, True)
+            counts = game.genotypes.counts()
+            self.assertEqual(counts, {Genotype("Fire", "red", "●"): 3,
+                                      Genotype("", "white", "█"): 2})
+    
+    def test_genotypes_are_shared(self):
+        """Test that the registry hands out one immutable object per genotype"""
+        game = GameOfLife(width=10, height=10)
+        ids = game._encode(Cell(True, "Fire", "red", "●"))
+        genotype = game.genotypes.get(ids)
+        self.assertIs(game.genotypes.get(ids), genotype)
+        with self.assertRaises(AttributeError):
+            genotype.color = "blue"
+    
+    def test_unused_genotypes_and_names_are_dropped(self):
+        """Test that extinct genotypes leave the registry and their names are reused"""
+        game = GameOfLife(width=10, height=10)
+        game.add_cell_type("Fire", "red", "●")
+        game.set_cell(2, 2, cell_type=Cell(True, "Fire-Ice", "blue", "■"))
+        self.assertEqual(len(game.genotypes.counts()), 1)
+        hybrid_id = game.name_palette.intern("Fire-Ice")
+        
+        game.set_cell(2, 2, False)
+        self.assertEqual(game.genotypes.counts(), {})
+        self.assertEqual(len(game.genotypes), 0)
+        self.assertEqual(len(game.name_palette), 2)
+        self.assertIsNotNone(game.name_palette[game.name_palette.intern("Fire")])
+        self.assertEqual(game.name_palette.intern("Ice-Fire"), hybrid_id)
+    
+    def test_long_runs_prune_names(self):
+        """Test that hybrid names are pruned during runs without corrupting live names"""
+        game = GameOfLife(width=30, height=30)
+        game.PRUNE_NAMES = game._prune_names_at = 8
+        types = [game.add_cell_type(name, color)
+                 for name, color in [("Fire", "red"), ("Ice", "blue")]]
+        rng = random.Random(5)
+        for x in range(30):
+            for y in range(30):
+                if rng.random() < 0.4:
+                    game.set_cell(x, y, cell_type=rng.choice(types))
+        with mock.patch.object(game.genotypes, "prune", wraps=game.genotypes.prune) as prune:
+            game.run(20)
+        self.assertGreater(prune.call_count, 0)
+        for row in game.grid:
+            for cell in row:
+                if cell.alive:
+                    self.assertTrue(set(cell.name.split("-")) <= {"Fire", "Ice"}, cell.name)
+
+
+class TestHybridNames(unittest.TestCase):
+    """Test cases for hybrid names stored as an interned lineage DAG"""
+    
+    def setUp(self):
+        """Set up a game with two named cell types"""
+        self.game = GameOfLife(width=10, height=10)
+        self.fire = self.game.add_cell_type("Fire", "red", "●")
+        self.ice = self.game.add_cell_type("Ice", "blue", "■")
+    
+    def test_join_is_interned(self):
+        """Test that joining the same parents twice gives the same id"""
+        palette = self.game.name_palette
+        fire, ice = palette.intern("Fire"), palette.intern("Ice")
+        hybrid = palette.join(fire, ice)
+        self.assertEqual(palette.join(fire, ice), hybrid)
+        self.assertNotEqual(palette.join(ice, fire), hybrid)
+        self.assertEqual(palette.render(hybrid), "Fire-Ice")
+    
+    def test_deep_lineage_bounded_memory(self):
+        """Test that each generation of breeding adds one node, not a longer string"""
+        palette = self.game.name_palette
+        name_id = palette.intern("Fire")
+        ice = palette.intern("Ice")
+        before = len(palette)
+        for _ in range(2000):
+            name_id = palette.join(name_id, ice)
+        self.assertEqual(len(palette), before + 2000)
+        self.assertIsInstance(palette[name_id], HybridName)
+        self.assertEqual(palette.render(name_id), "Fire" + "-Ice" * 2000)
+        self.assertEqual(palette.render(name_id, depth=2), "…-Ice-Ice")
+        self.assertEqual(palette.render(name_id, depth=0), "…")
+    
+    def test_offspring_name_is_lineage(self):
+        """Test that _create_offspring links the parent names instead of concatenating them"""
+        with mock.patch('random.random', return_value=0.1):
+            offspring = self.game._create_offspring(self.fire, self.ice)
+        self.assertIsInstance(offspring.lineage, HybridName)
+        self.assertIs(offspring.lineage.first, "Fire")
+        self.assertEqual(offspring.name, "Fire-Ice")
+        
+        ids = self.game._encode(offspring)
+        palette = self.game.name_palette
+        self.assertEqual(ids[0], palette.join(palette.intern("Fire"), palette.intern("Ice")))
+        self.assertEqual(self.game._encode(offspring.copy()), ids)
+    
+    def test_names_survive_engine_switch(self):
+        """Test that moving cells to another engine keeps their name ids"""
+        palette = self.game.name_palette
+        fire, ice = palette.intern("Fire"), palette.intern("Ice")
+        hybrid = palette.join(palette.join(fire, ice), fire)
+        self.game.set_cell(3, 3, cell_type=self.game._decode(True, hybrid, 1, 1))
+        size = len(palette)
+        self.game._use_engine(SparseEngine)
+        self.assertEqual(self.game._encode(self.game.grid[3][3])[0], hybrid)
+        self.assertEqual(len(palette), size)
+        self.assertEqual(self.game.grid[3][3].name, "Fire-Ice-Fire")
+    
+    def test_pruning_keeps_ancestors(self):
+        """Test that pruning keeps the parents of live hybrids and releases the rest"""
+        palette = self.game.name_palette
+        fire, ice = palette.intern("Fire"), palette.intern("Ice")
+        parent = palette.join(fire, ice)
+        child = palette.join(parent, ice)
+        palette.join(ice, ice)
+        self.game.set_cell(1, 1, cell_type=self.game._decode(True, child, 1, 1))
+        self.game.genotypes.counts()
+        self.assertEqual(len(palette), 5)
+        self.assertEqual(palette.render(child), "Fire-Ice-Ice")
+        self.assertEqual(palette.join(fire, ice), parent)
+    
+    def test_released_lineage_is_reinterned(self):
+        """Test that a Cell whose hybrid name was released can still be placed"""
+        with mock.patch('random.random', return_value=0.1):
+            offspring = self.game._create_offspring(self.fire, self.ice)
+        self.game.set_cell(1, 1, cell_type=offspring)
+        view = self.game.grid[1][1]
+        self.game.set_cell(1, 1, False)
+        self.game.genotypes.counts()
+        self.game.set_cell(2, 2, cell_type=view)
+        self.assertEqual(self.game.grid[2][2].name, "Fire-Ice")
+    
+    def test_pruning_renders_no_names(self):
+        """Test that pruning during a run never spells out hybrid names"""
+        palette = self.game.name_palette
+        name_id = palette.intern("Fire")
+        for _ in range(200):
+            name_id = palette.join(name_id, name_id)
+        self.game.set_cell(1, 1, cell_type=self.game._decode(True, name_id, 1, 1))
+        with mock.patch.object(HybridName, "render", side_effect=AssertionError):
+            self.assertEqual(self.game.genotypes.prune(), {(name_id, 1, 1): 1})
+    
+    def test_name_depth_truncates_genotypes(self):
+        """Test that name_depth shortens the names genotypes.counts reports"""
+        game = GameOfLife(width=10, height=10, name_depth=1)
+        palette = game.name_palette
+        fire, ice = palette.intern("Fire"), palette.intern("Ice")
+        for position, first, second in [((1, 1), fire, ice), ((5, 5), ice, fire)]:
+            name = palette.join(palette.join(first, second), ice)
+            game.set_cell(*position, cell_type=game._decode(True, name, 0, 0))
+        self.assertEqual(game.genotypes.counts(), {Genotype("…-Ice", "white", "█"): 2})
+
+
+class TestMutationSampling(unittest.TestCase):
+    """Test cases for drawing only the mutated cells"""
+    
+    def setUp(self):
+        """Step NumPy boards with array operations, whose draws the random module makes"""
+        patcher = mock.patch.object(NumpyEngine, "custom_kernel", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_draws_scale_with_mutations(self):
+        """Test that a step makes far fewer draws than there are cells"""
+        for backend in ["python", "sparse"] + (["numpy"] if numpy is not None else []):
+            game = GameOfLife(width=200, height=200, mutation_rate=0.001, backend=backend)
+            with mock.patch('random.random', wraps=random.random) as draws:
+                game.next_generation()
+            self.assertLess(draws.call_count, 1000, backend)
+    
+    def test_seeded_draws_scale_with_mutations(self):
+        """Test that seeded games draw per mutation, not per live cell"""
+        for backend in ["python", "sparse"]:
+            game = GameOfLife(width=200, height=200, mutation_rate=0.001, backend=backend, seed=1)
+            # 10000 live cells in still-life blocks, which breed no offspring
+            for x in range(0, 200, 4):
+                for y in range(0, 200, 4):
+                    for dx, dy in [(0, 0), (0, 1), (1, 0), (1, 1)]:
+                        game.set_cell(x + dx, y + dy)
+            with mock.patch.object(CounterRandom, "random", autospec=True,
+                                   side_effect=CounterRandom.random) as draws:
+                game.next_generation()
+            self.assertLess(draws.call_count, 200, backend)
+    
+    def test_mutated_fraction_matches_rate(self):
+        """Test that each live cell still mutates with the mutation rate"""
+        backends = ["python", "sparse"] + (["numpy"] if numpy is not None else [])
+        boards = [(backend, "bounded") for backend in backends] + [("python", "unbounded")]
+        for backend, boundary in boards:
+            seed_random(self, 3)
+            game = GameOfLife(width=40, height=40, mutation_rate=0.5, backend=backend,
+                              boundary=boundary)
+            for x in range(0, 40, 4):
+                for y in range(0, 40, 4):
+                    for dx, dy in [(1, 1), (1, 2), (2, 1), (2, 2)]:
+                        game.set_cell(x + dx, y + dy)
+            with mock.patch.object(game, '_mutate_cell') as mutate:
+                game.next_generation()
+            # 400 block cells mutate half the time and survive it 97% of the
+            # time; 1200 dead cells add about 6 mutated births
+            self.assertGreater(mutate.call_count, 150, backend)
+            self.assertLess(mutate.call_count, 250, backend)
+    
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_mutations_reach_the_board(self):
+        """Test that cells born by mutation on the NumPy engines stay on the board"""
+        for options in [{}, {"workers": 2}, {"seed": 4}]:
+            seed_random(self, 3)
+            game = GameOfLife(width=200, height=200, mutation_rate=1.0, backend="numpy", **options)
+            game.next_generation()
+            # Each of the 40000 dead cells is born with probability 0.01
+            self.assertGreater(game.population(), 300, options)
+            self.assertLess(game.population(), 500, options)
+
+
+class TestSeededRuns(unittest.TestCase):
+    """Test cases for seeded, counter-based random decisions"""
+    
+    def make_game(self, backend="python", boundary="bounded", seed=7, **options):
+        """Create a seeded soup of custom and default cells"""
+        game = GameOfLife(width=24, height=20, mutation_rate=0.05, backend=backend,
+                          boundary=boundary, seed=seed, **options)
+        types = [game.add_cell_type("Fire", "red", "●"),
+                 game.add_cell_type("Ice", "blue", "■"), None]
+        rng = random.Random(1)
+        for x in range(20):
+            for y in range(24):
+                if rng.random() < 0.35:
+                    game.set_cell(x, y, cell_type=rng.choice(types))
+        return game
+    
+    def board(self, game):
+        """List the live cells with their properties, hybrid names cut to a few levels"""
+        return [(x, y, cell.lineage if isinstance(cell.lineage, str) else cell.lineage.render(6),
+                 cell.color, cell.symbol)
+                for x, row in enumerate(game.grid) for y, cell in enumerate(row) if cell.alive]
+    
+    def test_counter_random_is_pure(self):
+        """Test that a stream only depends on the integers naming it"""
+        first = CounterRandom(7, 3, 1, -2, 5)
+        draws = [first.random() for _ in range(100)]
+        second = CounterRandom(7, 3, 1, -2, 5)
+        self.assertEqual([second.random() for _ in range(100)], draws)
+        self.assertTrue(all(0.0 <= draw < 1.0 for draw in draws))
+        self.assertNotEqual(CounterRandom(7, 3, 1, -2, 6).random(), draws[0])
+        
+        items = list(range(10))
+        CounterRandom(1).shuffle(items)
+        self.assertEqual(sorted(items), list(range(10)))
+        self.assertIn(CounterRandom(2).choice("abc"), "abc")
+    
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_array_draws_match_streams(self):
+        """Test that the vectorized draws equal each cell's own stream"""
+        xs, ys = numpy.array([0, 3, -1, 900]), numpy.array([5, 0, 7, -40])
+        draws = _counter_randoms((7, 3, 1), xs, ys, 4)
+        for row, x, y in zip(draws.tolist(), xs.tolist(), ys.tolist()):
+            stream = CounterRandom(7, 3, 1, x, y)
+            self.assertEqual(row, [stream.random() for _ in range(4)])
+    
+    def test_engines_agree_bit_for_bit(self):
+        """Test that every engine steps a seeded game to the same board"""
+        for boundary in ("bounded", "torus"):
+            engines = [("python", {}), ("sparse", {})]
+            if numpy is not None:
+                engines.append(("numpy", {}))
+                if boundary == "bounded":
+                    engines.append(("numpy", {"workers": 2}))
+            boards = []
+            for backend, options in engines:
+                game = self.make_game(backend, boundary, **options)
+                game.run(25)
+                boards.append(self.board(game))
+                game.close()
+            for board, (backend, options) in zip(boards[1:], engines[1:]):
+                self.assertEqual(board, boards[0], (boundary, backend, options))
+    
+    def test_run_matches_single_steps(self):
+        """Test that batched runs draw exactly what single generations do"""
+        for boundary in ("bounded", "unbounded"):
+            batched, stepped = self.make_game(boundary=boundary), self.make_game(boundary=boundary)
+            batched.run(15)
+            for _ in range(15):
+                stepped.next_generation()
+            self.assertEqual(self.board(batched), self.board(stepped))
+    
+    def test_seed_selects_the_run(self):
+        """Test that a seed repeats its run and another seed changes it"""
+        first, second, other = self.make_game(), self.make_game(), self.make_game(seed=8)
+        for game in (first, second, other):
+            game.run(15)
+        self.assertEqual(self.board(first), self.board(second))
+        self.assertNotEqual(self.board(first), self.board(other))
+    
+    def test_seeded_games_leave_global_random_alone(self):
+        """Test that seeded stepping never draws from the random module"""
+        backends = ["python", "sparse"] + (["numpy"] if numpy is not None else [])
+        for backend in backends:
+            game = self.make_game(backend)
+            with mock.patch('random.random', side_effect=AssertionError), \
+                    mock.patch('random.shuffle', side_effect=AssertionError), \
+                    mock.patch('random.choice', side_effect=AssertionError):
+                game.run(5)
+    
+    def test_seed_must_be_an_integer(self):
+        """Test that a non-integer seed is rejected"""
+        with self.assertRaises(ValueError):
+            GameOfLife(seed="seven")
+
+
 if __name__ == '__main__':
     unittest.main()